@@ -8,22 +8,27 @@ from __future__ import division, print_function
 from typing import Dict
 
 import argparse
-import base64
-import binascii
 import copy
+import functools
 import hashlib
-import inspect
 import io
 import itertools
+import marshal
+import mmap
+import operator
 import os
 import re
-import shlex
-import string
 import struct
 import sys
 import time
+import types
 import zlib
 
+try:
+    import deflate  # optional, libdeflate bindings compress firmware faster (and a bit smaller) than zlib
+except ImportError:
+    deflate = None
+
 try:
     import serial
 except ImportError:
@@ -75,6 +80,8 @@ MEM_END_ROM_TIMEOUT = 0.05            # special short timeout for ESP_MEM_END, a
 DEFAULT_SERIAL_WRITE_TIMEOUT = 10     # timeout for serial port write
 DEFAULT_CONNECT_ATTEMPTS = 7          # default number of times to try connection
 WRITE_BLOCK_ATTEMPTS = 3              # number of times to try writing a data block
+SERIAL_RX_BUFFER_SIZE = 0x10000       # serial driver receive buffer size requested on Windows
+PROGRESS_UPDATE_INTERVAL = 0.1        # minimum time between write_flash progress updates
 
 SUPPORTED_CHIPS = ['esp8266', 'esp32', 'esp32s2', 'esp32s3', 'esp32c3', 'esp32c6', 'esp32h2', 'esp32c2']
 
@@ -190,24 +197,6 @@ def esp32s3_or_newer_function_only(func):
     return check_supported_function(func, lambda o: isinstance(o, ESP32S3ROM) or isinstance(o, ESP32C3ROM))
 
 
-PYTHON2 = sys.version_info[0] < 3  # True if on pre-Python 3
-
-# Function to return nth byte of a bitstring
-# Different behaviour on Python 2 vs 3
-if PYTHON2:
-    def byte(bitstr, index):
-        return ord(bitstr[index])
-else:
-    def byte(bitstr, index):
-        return bitstr[index]
-
-# Provide a 'basestring' class on Python 3
-try:
-    basestring
-except NameError:
-    basestring = str
-
-
 def print_overwrite(message, last_line=False):
     """ Print a message, overwriting the currently printed line.
 
@@ -340,10 +329,14 @@ class ESPLoader(object):
         self.secure_download_mode = False  # flag is set to True if esptool detects the ROM is in Secure Download Mode
         self.stub_is_disabled = False  # flag is set to True if esptool detects conditions which require the stub to be disabled
 
-        if isinstance(port, basestring):
+        if isinstance(port, str):
             self._port = serial.serial_for_url(port)
         else:
             self._port = port
+        if sys.platform == "win32" and hasattr(self._port, "set_buffer_size"):
+            # the default Windows driver receive buffer is small, a larger one lets
+            # slip_reader pick up whole responses in fewer reads at high baud rates
+            self._port.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE)
         self._slip_reader = slip_reader(self._port, self.trace)
         # setting baud rate in a separate step is a workaround for
         # CH341 driver on some Linux versions (this opens at 9600 then
@@ -440,12 +433,15 @@ class ESPLoader(object):
     """ Calculate checksum of a blob, as it is defined by the ROM """
     @staticmethod
     def checksum(data, state=ESP_CHECKSUM_MAGIC):
-        for b in data:
-            if type(b) is int:  # python 2/3 compat
-                state ^= b
-            else:
-                state ^= ord(b)
-
+        # XOR of all bytes, computed by folding the data (as one big integer) in half until a
+        # single byte is left. This keeps the work in C instead of looping over every byte.
+        length = len(data)
+        if length:
+            value = int.from_bytes(data, 'little')
+            while length > 1:
+                length = (length + 1) // 2
+                value = (value >> (length * 8)) ^ (value & ((1 << (length * 8)) - 1))
+            state ^= value
         return state
 
     """ Send a request and read the response """
@@ -481,7 +477,7 @@ class ESPLoader(object):
 
                 if op is None or op_ret == op:
                     return val, data
-                if byte(data, 0) != 0 and byte(data, 1) == self.ROM_INVALID_RECV_MSG:
+                if data[0] != 0 and data[1] == self.ROM_INVALID_RECV_MSG:
                     self.flush_input()  # Unsupported read_reg can result in more than one error response for some reason
                     raise UnsupportedCommandError(self, op)
 
@@ -507,7 +503,7 @@ class ESPLoader(object):
             raise FatalError("Failed to %s. Only got %d byte status response." % (op_description, len(data)))
         status_bytes = data[-self.STATUS_BYTES_LENGTH:]
         # we only care if the first one is non-zero. If it is, the second byte is a reason.
-        if byte(status_bytes, 0) != 0:
+        if status_bytes[0] != 0:
             raise FatalError.WithResult('Failed to %s' % op_description, status_bytes)
 
         # if we had more data than just the status bytes, return it as the result
@@ -716,7 +712,7 @@ class ESPLoader(object):
         # when detecting chip type, and the way we check for success (STATUS_BYTES_LENGTH) is different
         # for different chip types (!)
         val, data = self.command(self.ESP_READ_REG, struct.pack('<I', addr), timeout=timeout)
-        if byte(data, 0) != 0:
+        if data[0] != 0:
             raise FatalError.WithResult("Failed to read register address %08x" % addr, data)
         return val
 
@@ -3175,6 +3171,10 @@ class ESPBOOTLOADER(object):
     IMAGE_V2_SEGMENT = 4
 
 
+# Characters stripped from user-supplied chip names, ie "ESP32-S2" -> "esp32s2"
+_CHIP_NAME_STRIP_RE = re.compile(r"[-()]")
+
+
 def LoadFirmwareImage(chip, filename):
     """ Load a firmware image. Can be for any supported SoC.
 
@@ -3183,22 +3183,11 @@ def LoadFirmwareImage(chip, filename):
 
         Returns a BaseFirmwareImage subclass, either ESP8266ROMFirmwareImage (v1) or ESP8266V2FirmwareImage (v2).
     """
-    chip = re.sub(r"[-()]", "", chip.lower())
+    chip = _CHIP_NAME_STRIP_RE.sub("", chip.lower())
+    image_class = _CHIP_IMAGE_CLASSES.get(chip)
     with open(filename, 'rb') as f:
-        if chip == 'esp32':
-            return ESP32FirmwareImage(f)
-        elif chip == "esp32s2":
-            return ESP32S2FirmwareImage(f)
-        elif chip == "esp32s3":
-            return ESP32S3FirmwareImage(f)
-        elif chip == 'esp32c3':
-            return ESP32C3FirmwareImage(f)
-        elif chip == 'esp32c6':
-            return ESP32C6FirmwareImage(f)
-        elif chip == 'esp32h2':
-            return ESP32H2FirmwareImage(f)
-        elif chip == 'esp32c2':
-            return ESP32C2FirmwareImage(f)
+        if image_class is not None:
+            return image_class(f)
         else:  # Otherwise, ESP8266 so look at magic to determine the image type
             magic = ord(f.read(1))
             f.seek(0)
@@ -3335,11 +3324,17 @@ class BaseFirmwareImage(object):
                 segment_data[patch_offset + self.SHA256_DIGEST_LEN:]
         return segment_data
 
-    def save_segment(self, f, segment, checksum=None):
-        """ Save the next segment to the image file, return next checksum value if provided """
+    def save_segment(self, f, segment, checksum=None, padding=0):
+        """ Save the next segment to the image file, return next checksum value if provided
+
+        If padding is set, that many zero bytes are appended to the segment in the file
+        (zero bytes don't change the checksum).
+        """
         segment_data = self.maybe_patch_segment_data(f, segment.data)
-        f.write(struct.pack('<II', segment.addr, len(segment_data)))
+        f.write(struct.pack('<II', segment.addr, len(segment_data) + padding))
         f.write(segment_data)
+        if padding:
+            f.write(b"\x00" * padding)
         if checksum is not None:
             return ESPLoader.checksum(segment_data, checksum)
 
@@ -3347,6 +3342,7 @@ class BaseFirmwareImage(object):
         """
         Save the next segment to the image file, return next checksum value if provided
         """
+        padding = 0
         if self.ROM_LOADER.CHIP_NAME == "ESP32":
             # Work around a bug in ESP-IDF 2nd stage bootloader, that it didn't map the
             # last MMU page, if an IROM/DROM segment was < 0x24 bytes
@@ -3354,8 +3350,9 @@ class BaseFirmwareImage(object):
             segment_end_pos = f.tell() + len(segment.data) + self.SEG_HEADER_LEN
             segment_len_remainder = segment_end_pos % self.IROM_ALIGN
             if segment_len_remainder < 0x24:
-                segment.data += b"\x00" * (0x24 - segment_len_remainder)
-        return self.save_segment(f, segment, checksum)
+                # write the padding straight to the file instead of copying the whole segment data
+                padding = 0x24 - segment_len_remainder
+        return self.save_segment(f, segment, checksum, padding)
 
     def read_checksum(self, f):
         """ Return ESPLoader checksum from end of just-read image """
@@ -3423,13 +3420,14 @@ class BaseFirmwareImage(object):
             else:
                 # The section next_elem cannot be merged into the previous one,
                 # which means it needs to be part of the final segments.
-                # As we are browsing the list backward, the elements need to be
-                # inserted at the beginning of the final list.
-                segments.insert(0, next_elem)
+                # As we are browsing the list backward, the elements are appended
+                # in reverse order and the list is reversed once at the end.
+                segments.append(next_elem)
 
         # The first segment will always be here as it cannot be merged into any
         # "previous" section.
-        segments.insert(0, self.segments[0])
+        segments.append(self.segments[0])
+        segments.reverse()
 
         # note: we could sort segments here as well, but the ordering of segments is sometimes
         # important for other reasons (like embedded ELF SHA-256), so we assume that the linker
@@ -3576,8 +3574,11 @@ class ESP8266V2FirmwareImage(BaseFirmwareImage):
 def esp8266_crc32(data):
     """
     CRC32 algorithm used by 8266 SDK bootloader (and gen_appbin.py).
+
+    zlib.crc32 releases the GIL on large buffers and uses the hardware
+    accelerated CRC routines of the zlib build where available.
     """
-    crc = binascii.crc32(data, 0) & 0xFFFFFFFF
+    crc = zlib.crc32(data, 0) & 0xFFFFFFFF
     if crc & 0x80000000:
         return crc ^ 0xFFFFFFFF
     else:
@@ -3600,6 +3601,7 @@ class ESP32FirmwareImage(BaseFirmwareImage):
     WP_PIN_DISABLED = 0xEE
 
     EXTENDED_HEADER_STRUCT_FMT = "<BBBBHBHH" + ("B" * 4) + "B"
+    EXTENDED_HEADER_STRUCT = struct.Struct(EXTENDED_HEADER_STRUCT_FMT)
 
     IROM_ALIGN = 65536
 
@@ -3666,10 +3668,17 @@ class ESP32FirmwareImage(BaseFirmwareImage):
             checksum = ESPLoader.ESP_CHECKSUM_MAGIC
 
             # split segments into flash-mapped vs ram-loaded, and take copies so we can mutate them
-            flash_segments = [copy.deepcopy(s) for s in sorted(
-                self.segments, key=lambda s: s.addr) if self.is_flash_addr(s.addr)]
-            ram_segments = [copy.deepcopy(s) for s in sorted(
-                self.segments, key=lambda s: s.addr) if not self.is_flash_addr(s.addr)]
+            # (same test as is_flash_addr(), with the map bounds bound locally)
+            rom_loader = self.ROM_LOADER
+            irom_start, irom_end = rom_loader.IROM_MAP_START, rom_loader.IROM_MAP_END
+            drom_start, drom_end = rom_loader.DROM_MAP_START, rom_loader.DROM_MAP_END
+            flash_segments = []
+            ram_segments = []
+            for s in sorted(self.segments, key=operator.attrgetter('addr')):
+                if irom_start <= s.addr < irom_end or drom_start <= s.addr < drom_end:
+                    flash_segments.append(copy.deepcopy(s))
+                else:
+                    ram_segments.append(copy.deepcopy(s))
 
             # check for multiple ELF sections that are mapped in the same flash mapping region.
             # this is usually a sign of a broken linker script, but if you have a legitimate
@@ -3756,17 +3765,14 @@ class ESP32FirmwareImage(BaseFirmwareImage):
             # kinda hacky: go back to the initial header and write the new segment count
             # that includes padding segments. This header is not checksummed
             f.seek(1)
-            try:
-                f.write(chr(total_segments))
-            except TypeError:  # Python 3
-                f.write(bytes([total_segments]))
+            f.write(bytes((total_segments,)))
 
             if self.append_digest:
                 # calculate the SHA256 of the whole file and append it
-                f.seek(0)
-                digest = hashlib.sha256()
-                digest.update(f.read(image_length))
-                f.write(digest.digest())
+                with f.getbuffer() as image_data:
+                    digest = hashlib.sha256(image_data[:image_length]).digest()
+                f.seek(image_length)
+                f.write(digest)
 
             if self.pad_to_size:
                 image_length = f.tell()
@@ -3774,14 +3780,14 @@ class ESP32FirmwareImage(BaseFirmwareImage):
                     pad_by = self.pad_to_size - (image_length % self.pad_to_size)
                     f.write(b"\xff" * pad_by)
 
-            with open(filename, 'wb') as real_file:
-                real_file.write(f.getvalue())
+            with open(filename, 'wb') as real_file, f.getbuffer() as image_data:
+                real_file.write(image_data)
 
     def load_extended_header(self, load_file):
         def split_byte(n):
             return (n & 0x0F, (n >> 4) & 0x0F)
 
-        fields = list(struct.unpack(self.EXTENDED_HEADER_STRUCT_FMT, load_file.read(16)))
+        fields = list(self.EXTENDED_HEADER_STRUCT.unpack(load_file.read(16)))
 
         self.wp_pin = fields[0]
 
@@ -3826,7 +3832,7 @@ class ESP32FirmwareImage(BaseFirmwareImage):
         fields += [0] * 4  # padding
         fields += [append_digest]
 
-        packed = struct.pack(self.EXTENDED_HEADER_STRUCT_FMT, *fields)
+        packed = self.EXTENDED_HEADER_STRUCT.pack(*fields)
         save_file.write(packed)
 
 
@@ -3834,7 +3840,8 @@ class ESP8266V3FirmwareImage(ESP32FirmwareImage):
     """ ESP8266 V3 firmware image is very similar to ESP32 image
     """
 
-    EXTENDED_HEADER_STRUCT_FMT = "B" * 16
+    EXTENDED_HEADER_STRUCT_FMT = "<BBBB11sB"  # wp_pin, 3 bytes of SPI drive strengths, reserved, append_digest
+    EXTENDED_HEADER_STRUCT = struct.Struct(EXTENDED_HEADER_STRUCT_FMT)
 
     def is_flash_addr(self, addr):
         return (addr > ESP8266ROM.IROM_MAP_START)
@@ -3846,11 +3853,17 @@ class ESP8266V3FirmwareImage(ESP32FirmwareImage):
 
             checksum = ESPLoader.ESP_CHECKSUM_MAGIC
 
-            # split segments into flash-mapped vs ram-loaded, and take copies so we can mutate them
-            flash_segments = [copy.deepcopy(s) for s in sorted(
-                self.segments, key=lambda s: s.addr) if self.is_flash_addr(s.addr) and len(s.data)]
-            ram_segments = [copy.deepcopy(s) for s in sorted(self.segments, key=lambda s: s.addr)
-                            if not self.is_flash_addr(s.addr) and len(s.data)]
+            # split segments into flash-mapped vs ram-loaded, and take copies so we can mutate them.
+            # Segment data is only ever replaced, never changed in place, so shallow copies are enough
+            flash_segments = []
+            ram_segments = []
+            for s in sorted(self.segments, key=operator.attrgetter('addr')):
+                if not len(s.data):
+                    continue
+                if self.is_flash_addr(s.addr):
+                    flash_segments.append(copy.copy(s))
+                else:
+                    ram_segments.append(copy.copy(s))
 
             # check for multiple ELF sections that are mapped in the same flash mapping region.
             # this is usually a sign of a broken linker script, but if you have a legitimate
@@ -3866,14 +3879,12 @@ class ESP8266V3FirmwareImage(ESP32FirmwareImage):
 
             # try to fit each flash segment on a 64kB aligned boundary
             # by padding with parts of the non-flash segments...
-            while len(flash_segments) > 0:
-                segment = flash_segments[0]
+            for segment in flash_segments:
                 # remove 8 bytes empty data for insert segment header
                 if segment.name == '.flash.rodata':
                     segment.data = segment.data[8:]
                 # write the flash segment
                 checksum = self.save_segment(f, segment, checksum)
-                flash_segments.pop(0)
                 total_segments += 1
 
             # flash segments all written, so write any remaining RAM segments
@@ -3888,41 +3899,37 @@ class ESP8266V3FirmwareImage(ESP32FirmwareImage):
             # kinda hacky: go back to the initial header and write the new segment count
             # that includes padding segments. This header is not checksummed
             f.seek(1)
-            try:
-                f.write(chr(total_segments))
-            except TypeError:  # Python 3
-                f.write(bytes([total_segments]))
+            f.write(bytes((total_segments,)))
 
             if self.append_digest:
                 # calculate the SHA256 of the whole file and append it
-                f.seek(0)
-                digest = hashlib.sha256()
-                digest.update(f.read(image_length))
-                f.write(digest.digest())
+                with f.getbuffer() as image_data:
+                    digest = hashlib.sha256(image_data[:image_length]).digest()
+                f.seek(image_length)
+                f.write(digest)
 
-            with open(filename, 'wb') as real_file:
-                real_file.write(f.getvalue())
+            with open(filename, 'wb') as real_file, f.getbuffer() as image_data:
+                real_file.write(image_data)
 
     def load_extended_header(self, load_file):
         def split_byte(n):
             return (n & 0x0F, (n >> 4) & 0x0F)
 
-        fields = list(struct.unpack(self.EXTENDED_HEADER_STRUCT_FMT, load_file.read(16)))
-
-        self.wp_pin = fields[0]
+        (self.wp_pin, spi_drv_1, spi_drv_2, spi_drv_3,
+         reserved, append_digest) = self.EXTENDED_HEADER_STRUCT.unpack(load_file.read(16))
 
         # SPI pin drive stengths are two per byte
-        self.clk_drv, self.q_drv = split_byte(fields[1])
-        self.d_drv, self.cs_drv = split_byte(fields[2])
-        self.hd_drv, self.wp_drv = split_byte(fields[3])
+        self.clk_drv, self.q_drv = split_byte(spi_drv_1)
+        self.d_drv, self.cs_drv = split_byte(spi_drv_2)
+        self.hd_drv, self.wp_drv = split_byte(spi_drv_3)
 
-        if fields[15] in [0, 1]:
-            self.append_digest = (fields[15] == 1)
+        if append_digest in [0, 1]:
+            self.append_digest = (append_digest == 1)
         else:
-            raise RuntimeError("Invalid value for append_digest field (0x%02x). Should be 0 or 1.", fields[15])
+            raise RuntimeError("Invalid value for append_digest field (0x%02x). Should be 0 or 1.", append_digest)
 
         # remaining fields in the middle should all be zero
-        if any(f for f in fields[4:15] if f != 0):
+        if reserved != bytes(len(reserved)):
             print("Warning: some reserved header fields have non-zero values. This image may be from a newer esptool.py?")
 
 
@@ -4008,6 +4015,17 @@ class ESP32C2FirmwareImage(ESP32FirmwareImage):
 
 ESP32C2ROM.BOOTLOADER_IMAGE = ESP32C2FirmwareImage
 
+# Firmware image class for each chip name, ESP8266 images are detected from their magic byte instead
+_CHIP_IMAGE_CLASSES = {
+    'esp32': ESP32FirmwareImage,
+    'esp32s2': ESP32S2FirmwareImage,
+    'esp32s3': ESP32S3FirmwareImage,
+    'esp32c3': ESP32C3FirmwareImage,
+    'esp32c6': ESP32C6FirmwareImage,
+    'esp32h2': ESP32H2FirmwareImage,
+    'esp32c2': ESP32C2FirmwareImage,
+}
+
 
 class ELFFile(object):
     SEC_TYPE_PROGBITS = 0x01
@@ -4022,11 +4040,23 @@ class ELFFile(object):
     SEG_TYPE_LOAD = 0x01
     LEN_SEG_HEADER = 0x20
 
+    FILE_HEADER_STRUCT = struct.Struct("<16sHHLLLLLHHHHHH")
+    SEC_HEADER_STRUCT = struct.Struct("<LLLLLL16x")  # padded to LEN_SEC_HEADER, so iter_unpack walks whole entries
+    SEG_HEADER_STRUCT = struct.Struct("<LLLLLLLL")
+
     def __init__(self, name):
         # Load sections from the ELF file
         self.name = name
         with open(self.name, 'rb') as f:
-            self._read_elf_file(f)
+            try:
+                elf_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files can't be mapped, parsing reports the missing header
+                elf_data = b''
+            try:
+                self._read_elf_file(elf_data)
+            finally:
+                if isinstance(elf_data, mmap.mmap):
+                    elf_data.close()
 
     def get_section(self, section_name):
         for s in self.sections:
@@ -4034,18 +4064,18 @@ class ELFFile(object):
                 return s
         raise ValueError("No section %s in ELF file" % section_name)
 
-    def _read_elf_file(self, f):
-        # read the ELF file header
+    def _read_elf_file(self, elf_data):
+        # read the ELF file header, elf_data is the whole file (normally an mmap of it)
         LEN_FILE_HEADER = 0x34
         try:
             (ident, _type, machine, _version,
              self.entrypoint, _phoff, shoff, _flags,
              _ehsize, _phentsize, _phnum, shentsize,
-             shnum, shstrndx) = struct.unpack("<16sHHLLLLLHHHHHH", f.read(LEN_FILE_HEADER))
+             shnum, shstrndx) = self.FILE_HEADER_STRUCT.unpack(elf_data[:LEN_FILE_HEADER])
         except struct.error as e:
             raise FatalError("Failed to read a valid ELF header from %s: %s" % (self.name, e))
 
-        if byte(ident, 0) != 0x7f or ident[1:4] != b'ELF':
+        if ident[0] != 0x7f or ident[1:4] != b'ELF':
             raise FatalError("%s has invalid ELF magic header" % self.name)
         if machine not in [0x5e, 0xf3]:
             raise FatalError("%s does not appear to be an Xtensa or an RISCV ELF file. e_machine=%04x" %
@@ -4055,13 +4085,12 @@ class ELFFile(object):
                              (self.name, shentsize, self.LEN_SEC_HEADER))
         if shnum == 0:
             raise FatalError("%s has 0 section headers" % (self.name))
-        self._read_sections(f, shoff, shnum, shstrndx)
-        self._read_segments(f, _phoff, _phnum, shstrndx)
+        self._read_sections(elf_data, shoff, shnum, shstrndx)
+        self._read_segments(elf_data, _phoff, _phnum, shstrndx)
 
-    def _read_sections(self, f, section_header_offs, section_header_count, shstrndx):
-        f.seek(section_header_offs)
+    def _read_sections(self, elf_data, section_header_offs, section_header_count, shstrndx):
         len_bytes = section_header_count * self.LEN_SEC_HEADER
-        section_header = f.read(len_bytes)
+        section_header = elf_data[section_header_offs:section_header_offs + len_bytes]
         if len(section_header) == 0:
             raise FatalError("No section header found at offset %04x in ELF file." % section_header_offs)
         if len(section_header) != (len_bytes):
@@ -4069,41 +4098,45 @@ class ELFFile(object):
                              (len(section_header), len_bytes))
 
         # walk through the section header and extract all sections
-        section_header_offsets = range(0, len(section_header), self.LEN_SEC_HEADER)
-
-        def read_section_header(offs):
-            name_offs, sec_type, _flags, lma, sec_offs, size = struct.unpack_from("<LLLLLL", section_header[offs:])
-            return (name_offs, sec_type, lma, size, sec_offs)
-        all_sections = [read_section_header(offs) for offs in section_header_offsets]
+        all_sections = [(name_offs, sec_type, lma, size, sec_offs)
+                        for name_offs, sec_type, _flags, lma, sec_offs, size
+                        in self.SEC_HEADER_STRUCT.iter_unpack(section_header)]
         prog_sections = [s for s in all_sections if s[1] in ELFFile.PROG_SEC_TYPES]
 
         # search for the string table section
-        if not (shstrndx * self.LEN_SEC_HEADER) in section_header_offsets:
+        if not 0 <= shstrndx < len(all_sections):
             raise FatalError("ELF file has no STRTAB section at shstrndx %d" % shstrndx)
-        _, sec_type, _, sec_size, sec_offs = read_section_header(shstrndx * self.LEN_SEC_HEADER)
+        _, sec_type, _, sec_size, sec_offs = all_sections[shstrndx]
         if sec_type != ELFFile.SEC_TYPE_STRTAB:
             print('WARNING: ELF file has incorrect STRTAB section type 0x%02x' % sec_type)
-        f.seek(sec_offs)
-        string_table = f.read(sec_size)
+        string_table = elf_data[sec_offs:sec_offs + sec_size]
 
         # build the real list of ELFSections by reading the actual section names from the
         # string table section, and actual data for each section from the ELF file itself
+        # split the string table once, names that share a suffix with another name
+        # (offset into the middle of a string) fall back to a scan from their offset
+        string_offsets = {}
+        offs = 0
+        for name in string_table.split(b'\x00')[:-1]:  # the last part is not NUL terminated
+            string_offsets[offs] = name
+            offs += len(name) + 1
+
         def lookup_string(offs):
-            raw = string_table[offs:]
-            return raw[:raw.index(b'\x00')]
+            name = string_offsets.get(offs)
+            if name is None:
+                name = string_table[offs:string_table.index(b'\x00', offs)]
+            return name
 
         def read_data(offs, size):
-            f.seek(offs)
-            return f.read(size)
+            return elf_data[offs:offs + size]
 
         prog_sections = [ELFSection(lookup_string(n_offs), lma, read_data(offs, size)) for (n_offs, _type, lma, size, offs) in prog_sections
                          if lma != 0 and size > 0]
         self.sections = prog_sections
 
-    def _read_segments(self, f, segment_header_offs, segment_header_count, shstrndx):
-        f.seek(segment_header_offs)
+    def _read_segments(self, elf_data, segment_header_offs, segment_header_count, shstrndx):
         len_bytes = segment_header_count * self.LEN_SEG_HEADER
-        segment_header = f.read(len_bytes)
+        segment_header = elf_data[segment_header_offs:segment_header_offs + len_bytes]
         if len(segment_header) == 0:
             raise FatalError("No segment header found at offset %04x in ELF file." % segment_header_offs)
         if len(segment_header) != (len_bytes):
@@ -4111,18 +4144,13 @@ class ELFFile(object):
                              (len(segment_header), len_bytes))
 
         # walk through the segment header and extract all segments
-        segment_header_offsets = range(0, len(segment_header), self.LEN_SEG_HEADER)
-
-        def read_segment_header(offs):
-            seg_type, seg_offs, _vaddr, lma, size, _memsize, _flags, _align = struct.unpack_from(
-                "<LLLLLLLL", segment_header[offs:])
-            return (seg_type, lma, size, seg_offs)
-        all_segments = [read_segment_header(offs) for offs in segment_header_offsets]
+        all_segments = [(seg_type, lma, size, seg_offs)
+                        for seg_type, seg_offs, _vaddr, lma, size, _memsize, _flags, _align
+                        in self.SEG_HEADER_STRUCT.iter_unpack(segment_header)]
         prog_segments = [s for s in all_segments if s[0] == ELFFile.SEG_TYPE_LOAD]
 
         def read_data(offs, size):
-            f.seek(offs)
-            return f.read(size)
+            return elf_data[offs:offs + size]
 
         prog_segments = [ELFSection(b'PHDR', lma, read_data(offs, size)) for (_type, lma, size, offs) in prog_segments
                          if lma != 0 and size > 0]
@@ -4130,10 +4158,8 @@ class ELFFile(object):
 
     def sha256(self):
         # return SHA256 hash of the input ELF file
-        sha256 = hashlib.sha256()
         with open(self.name, 'rb') as f:
-            sha256.update(f.read())
-        return sha256.digest()
+            return hashlib.sha256(f.read()).digest()
 
 
 def slip_reader(port, trace_function):
@@ -4147,8 +4173,8 @@ def slip_reader(port, trace_function):
     in_escape = False
     successful_slip = False
     while True:
-        waiting = port.inWaiting()
-        read_bytes = port.read(1 if waiting == 0 else waiting)
+        # take everything that is waiting, or block for a single byte if nothing is
+        read_bytes = port.read(port.inWaiting() or 1)
         if read_bytes == b'':
             if partial_packet is None:  # fail due to no data
                 msg = "Serial data stream stopped: Possible serial noise or corruption." if successful_slip else "No serial data received."
@@ -4157,36 +4183,49 @@ def slip_reader(port, trace_function):
             trace_function(msg)
             raise FatalError(msg)
         trace_function("Read %d bytes: %s", len(read_bytes), HexFormatter(read_bytes))
-        for b in read_bytes:
-            if type(b) is int:
-                b = bytes([b])  # python 2/3 compat
-
+        # scan for the next delimiter or escape byte and copy the plain runs in between in one go,
+        # instead of appending the packet one byte at a time
+        pos = 0
+        end = len(read_bytes)
+        while pos < end:
             if partial_packet is None:  # waiting for packet header
-                if b == b'\xc0':
-                    partial_packet = b""
+                if read_bytes[pos] == 0xc0:
+                    partial_packet = bytearray()
+                    pos += 1
                 else:
                     trace_function("Read invalid data: %s", HexFormatter(read_bytes))
                     trace_function("Remaining data in serial buffer: %s", HexFormatter(port.read(port.inWaiting())))
-                    raise FatalError('Invalid head of packet (0x%s): Possible serial noise or corruption.' % hexify(b))
+                    raise FatalError('Invalid head of packet (0x%s): Possible serial noise or corruption.' %
+                                     hexify(read_bytes[pos:pos + 1]))
             elif in_escape:  # part-way through escape sequence
                 in_escape = False
-                if b == b'\xdc':
-                    partial_packet += b'\xc0'
-                elif b == b'\xdd':
-                    partial_packet += b'\xdb'
+                if read_bytes[pos] == 0xdc:
+                    partial_packet.append(0xc0)
+                elif read_bytes[pos] == 0xdd:
+                    partial_packet.append(0xdb)
                 else:
                     trace_function("Read invalid data: %s", HexFormatter(read_bytes))
                     trace_function("Remaining data in serial buffer: %s", HexFormatter(port.read(port.inWaiting())))
-                    raise FatalError('Invalid SLIP escape (0xdb, 0x%s)' % (hexify(b)))
-            elif b == b'\xdb':  # start of escape sequence
-                in_escape = True
-            elif b == b'\xc0':  # end of packet
-                trace_function("Received full packet: %s", HexFormatter(partial_packet))
-                yield partial_packet
-                partial_packet = None
-                successful_slip = True
-            else:  # normal byte in packet
-                partial_packet += b
+                    raise FatalError('Invalid SLIP escape (0xdb, 0x%s)' % (hexify(read_bytes[pos:pos + 1])))
+                pos += 1
+            else:
+                packet_end = read_bytes.find(b'\xc0', pos)
+                escape = read_bytes.find(b'\xdb', pos, end if packet_end == -1 else packet_end)
+                if escape != -1:  # start of escape sequence
+                    partial_packet += read_bytes[pos:escape]
+                    in_escape = True
+                    pos = escape + 1
+                elif packet_end != -1:  # end of packet
+                    partial_packet += read_bytes[pos:packet_end]
+                    partial_packet = bytes(partial_packet)
+                    trace_function("Received full packet: %s", HexFormatter(partial_packet))
+                    yield partial_packet
+                    partial_packet = None
+                    successful_slip = True
+                    pos = packet_end + 1
+                else:  # packet continues in the next read
+                    partial_packet += read_bytes[pos:]
+                    pos = end
 
 
 def arg_auto_int(x):
@@ -4211,29 +4250,38 @@ def div_roundup(a, b):
 
 
 def align_file_position(f, size):
-    """ Align the position in the file to the next block of specified size """
+    """ Align the position in the file so that the next byte is the last one of a block of specified size.
+
+    This is done with a single relative seek: when reading it skips the padding, when writing the gap is
+    zero-filled by the file object on the next write.
+    """
     align = (size - 1) - (f.tell() % size)
-    f.seek(align, 1)
+    if align:
+        f.seek(align, 1)
+
 
+_FLASH_SIZE_RE = re.compile(r"(\d+)([KM]B)")
+_FLASH_SIZE_UNITS = {"KB": 1024, "MB": 1024 * 1024}
 
+
+@functools.lru_cache(maxsize=32)
 def flash_size_bytes(size):
     """ Given a flash size of the type passed in args.flash_size
     (ie 512KB or 1MB) then return the size in bytes.
     """
-    if "MB" in size:
-        return int(size[:size.index("MB")]) * 1024 * 1024
-    elif "KB" in size:
-        return int(size[:size.index("KB")]) * 1024
-    else:
+    match = _FLASH_SIZE_RE.match(size)
+    if match is None:
         raise FatalError("Unknown size %s" % size)
+    return int(match.group(1)) * _FLASH_SIZE_UNITS[match.group(2)]
 
 
 def hexify(s, uppercase=True):
-    format_str = '%02X' if uppercase else '%02x'
-    if not PYTHON2:
-        return ''.join(format_str % c for c in s)
-    else:
-        return ''.join(format_str % ord(c) for c in s)
+    hex_str = s.hex()
+    return hex_str.upper() if uppercase else hex_str
+
+
+# byte translation table for the ASCII column of HexFormatter, non-printable bytes are shown as '.'
+_HEX_ASCII_TABLE = bytes(c if 0x20 <= c < 0x7f else ord('.') for c in range(256))
 
 
 class HexFormatter(object):
@@ -4259,15 +4307,13 @@ class HexFormatter(object):
 
     def __str__(self):
         if self._auto_split and len(self._s) > 16:
-            result = ""
-            s = self._s
-            while len(s) > 0:
-                line = s[:16]
-                ascii_line = "".join(c if (c == ' ' or (c in string.printable and c not in string.whitespace))
-                                     else '.' for c in line.decode('ascii', 'replace'))
-                s = s[16:]
-                result += "\n    %-16s %-16s | %s" % (hexify(line[:8], False), hexify(line[8:], False), ascii_line)
-            return result
+            s = bytes(self._s)
+            result = []
+            for offs in range(0, len(s), 16):
+                line = s[offs:offs + 16]
+                ascii_line = line.translate(_HEX_ASCII_TABLE).decode('ascii')
+                result.append("\n    %-16s %-16s | %s" % (line[:8].hex(), line[8:].hex(), ascii_line))
+            return "".join(result)
         else:
             return hexify(self._s, False)
 
@@ -4372,11 +4418,8 @@ def load_ram(esp, args):
         sys.stdout.flush()
         esp.mem_begin(size, div_roundup(size, esp.ESP_RAM_BLOCK), esp.ESP_RAM_BLOCK, seg.addr)
 
-        seq = 0
-        while len(seg.data) > 0:
-            esp.mem_block(seg.data[0:esp.ESP_RAM_BLOCK], seq)
-            seg.data = seg.data[esp.ESP_RAM_BLOCK:]
-            seq += 1
+        for seq, offs in enumerate(range(0, size, esp.ESP_RAM_BLOCK)):
+            esp.mem_block(seg.data[offs:offs + esp.ESP_RAM_BLOCK], seq)
         print('done!')
 
     print('All segments done, executing at %08x' % image.entrypoint)
@@ -4420,13 +4463,19 @@ def detect_flash_size(esp, args):
             print('Auto-detected Flash size:', args.flash_size)
 
 
+_IMAGE_HEADER_START_STRUCT = struct.Struct("BBBB")
+_FLASH_PARAMS_STRUCT = struct.Struct("BB")
+
+
 def _update_image_flash_params(esp, address, args, image):
-    """ Modify the flash mode & size bytes if this looks like an executable bootloader image  """
+    """ Modify the flash mode & size bytes if this looks like an executable bootloader image.
+    Returns the image unchanged, or a bytearray with the header bytes patched.
+    """
     if len(image) < 8:
         return image  # not long enough to be a bootloader image
 
     # unpack the (potential) image header
-    magic, _, flash_mode, flash_size_freq = struct.unpack("BBBB", image[:4])
+    magic, _, flash_mode, flash_size_freq = _IMAGE_HEADER_START_STRUCT.unpack_from(image)
     if address != esp.BOOTLOADER_FLASH_OFFSET:
         return image  # not flashing bootloader offset, so don't modify this
 
@@ -4438,6 +4487,26 @@ def _update_image_flash_params(esp, address, args, image):
         print("Warning: Image file at 0x%x doesn't look like an image file, so not changing any flash settings." % address)
         return image
 
+    flash_params = None
+    try:
+        if args.flash_mode != 'keep':
+            flash_mode = {'qio': 0, 'qout': 1, 'dio': 2, 'dout': 3}[args.flash_mode]
+
+        flash_freq = flash_size_freq & 0x0F
+        if args.flash_freq != 'keep':
+            flash_freq = esp.parse_flash_freq_arg(args.flash_freq)
+
+        flash_size = flash_size_freq & 0xF0
+        if args.flash_size != 'keep':
+            flash_size = esp.parse_flash_size_arg(args.flash_size)
+
+        flash_params = _FLASH_PARAMS_STRUCT.pack(flash_mode, flash_size + flash_freq)
+    except FatalError as e:
+        # unsupported setting, only an error if this turns out to be a valid image (checked below)
+        params_error = e
+    if flash_params == image[2:4]:
+        return image  # header already has these settings, no need to parse the whole image
+
     # make sure this really is an image, and not just data that
     # starts with esp.ESP_IMAGE_MAGIC (mostly a problem for encrypted
     # images that happen to start with a magic byte
@@ -4449,25 +4518,63 @@ def _update_image_flash_params(esp, address, args, image):
               (address, esp.CHIP_NAME))
         return image
 
-    if args.flash_mode != 'keep':
-        flash_mode = {'qio': 0, 'qout': 1, 'dio': 2, 'dout': 3}[args.flash_mode]
+    if flash_params is None:
+        raise params_error
+    print('Flash params set to 0x%04x' % struct.unpack(">H", flash_params))
+    if not isinstance(image, bytearray):
+        image = bytearray(image)  # only copy immutable images, a bytearray is patched in place
+    image[2:4] = flash_params
+    return image
 
-    flash_freq = flash_size_freq & 0x0F
-    if args.flash_freq != 'keep':
-        flash_freq = esp.parse_flash_freq_arg(args.flash_freq)
 
-    flash_size = flash_size_freq & 0xF0
-    if args.flash_size != 'keep':
-        flash_size = esp.parse_flash_size_arg(args.flash_size)
+def _get_file_size(argfile):
+    """ Return the size of an input file, from its file descriptor where there is one """
+    try:
+        return os.fstat(argfile.fileno()).st_size
+    except (AttributeError, io.UnsupportedOperation):
+        # in-memory files (e.g. io.BytesIO) have no descriptor, measure them by seeking to the end
+        argfile.seek(0, os.SEEK_END)
+        size = argfile.tell()
+        argfile.seek(0)
+        return size
 
-    flash_params = struct.pack(b'BB', flash_mode, flash_size + flash_freq)
-    if flash_params != image[2:4]:
-        print('Flash params set to 0x%04x' % struct.unpack(">H", flash_params))
-        image = image[0:2] + flash_params + image[4:]
-    return image
+
+def _compress_image(image):
+    """ Compress an image for flash_defl_begin/flash_defl_block. The loader inflates zlib
+    streams, so either encoder works; libdeflate is used when the 'deflate' package is installed.
+    """
+    if deflate is not None:
+        return deflate.zlib_compress(image, 12)
+    return zlib.compress(image, 9)
+
+
+_FF_CHUNK = b'\xFF' * 0x10000  # erased-flash filler, sliced rather than building multi-megabyte buffers
+
+
+def _map_input_file(argfile):
+    """ Return the contents of an input file. Files with a descriptor are memory-mapped read-only
+    rather than read onto the heap, anything else (empty files, io.BytesIO) is read as bytes.
+    """
+    try:
+        return mmap.mmap(argfile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, io.UnsupportedOperation, ValueError, OSError):
+        return argfile.read()
+
+
+@functools.lru_cache(maxsize=8)
+def _md5_of_erased_flash(size):
+    """ Return the MD5 hex digest of 'size' bytes of 0xFF, hashed in chunks instead of building the whole buffer """
+    md5 = hashlib.md5()
+    for offs in range(0, size, len(_FF_CHUNK)):
+        md5.update(_FF_CHUNK[:size - offs])
+    return md5.hexdigest()
 
 
 def write_flash(esp, args):
+    """ Write the files in args.addr_filename (and args.encrypt_files) to flash.
+    The input files are closed once used: straight after being read, or by verify_flash when args.verify
+    is set. Callers passing in their own file objects can't read them again afterwards.
+    """
     # set args.compress based on default behaviour:
     # -> if either --compress or --no-compress is set, honour that
     # -> otherwise, set --compress unless --no-stub is set
@@ -4512,20 +4619,17 @@ def write_flash(esp, args):
     if args.flash_size != 'keep':  # TODO: check this even with 'keep'
         flash_end = flash_size_bytes(args.flash_size)
         for address, argfile in args.addr_filename:
-            argfile.seek(0, os.SEEK_END)
-            if address + argfile.tell() > flash_end:
+            file_size = _get_file_size(argfile)
+            if address + file_size > flash_end:
                 raise FatalError(("File %s (length %d) at offset %d will not fit in %d bytes of flash. "
                                   "Use --flash_size argument, or change flashing address.")
-                                 % (argfile.name, argfile.tell(), address, flash_end))
-            argfile.seek(0)
+                                 % (argfile.name, file_size, address, flash_end))
 
     if args.erase_all:
         erase_flash(esp, args)
     else:
         for address, argfile in args.addr_filename:
-            argfile.seek(0, os.SEEK_END)
-            write_end = address + argfile.tell()
-            argfile.seek(0)
+            write_end = address + _get_file_size(argfile)
             bytes_over = address % esp.FLASH_SECTOR_SIZE
             if bytes_over != 0:
                 print("WARNING: Flash address {:#010x} is not aligned to a {:#x} byte flash sector. "
@@ -4555,8 +4659,9 @@ def write_flash(esp, args):
         # As both list are already sorted, we could simply do a merge instead,
         # but for the sake of simplicity and because the lists are very small,
         # let's use sorted.
-        all_files = sorted(all_files + encrypted_files_flag, key=lambda x: x[0])
+        all_files = sorted(all_files + encrypted_files_flag, key=operator.itemgetter(0))
 
+    image_digests = {}  # address -> (size, md5) of each plain image written, reused by --verify
     for address, argfile, encrypted in all_files:
         compress = args.compress
 
@@ -4568,55 +4673,84 @@ def write_flash(esp, args):
 
         if args.no_stub:
             print('Erasing flash...')
-        image = pad_to(argfile.read(), esp.FLASH_ENCRYPTED_WRITE_ALIGN if encrypted else 4)
-        if len(image) == 0:
-            print('WARNING: File %s is empty' % argfile.name)
-            continue
-        image = _update_image_flash_params(esp, address, args, image)
-        calcmd5 = hashlib.md5(image).hexdigest()
-        uncsize = len(image)
-        if compress:
-            uncimage = image
-            image = zlib.compress(uncimage, 9)
-            # Decompress the compressed binary a block at a time, to dynamically calculate the
-            # timeout based on the real write size
-            decompress = zlib.decompressobj()
-            blocks = esp.flash_defl_begin(uncsize, len(image), address)
-        else:
-            blocks = esp.flash_begin(uncsize, address, begin_rom_encrypted=encrypted)
-        argfile.seek(0)  # in case we need it again
-        seq = 0
-        bytes_sent = 0  # bytes sent on wire
-        bytes_written = 0  # bytes written to flash
-        t = time.time()
-
-        timeout = DEFAULT_TIMEOUT
-
-        while len(image) > 0:
-            print_overwrite('Writing at 0x%08x... (%d %%)' % (address + bytes_written, 100 * (seq + 1) // blocks))
-            sys.stdout.flush()
-            block = image[0:esp.FLASH_WRITE_SIZE]
+        mapped_file = _map_input_file(argfile)
+        try:
+            image = mapped_file
+            if args.verify:
+                argfile.seek(0)  # verify_flash reads it again once everything is written
+            else:
+                argfile.close()  # not needed any more (a mapping stays valid), release it now
+            write_align = esp.FLASH_ENCRYPTED_WRITE_ALIGN if encrypted else 4
+            if isinstance(image, mmap.mmap) and len(image) % write_align:
+                image = image[:]  # needs padding, which a read-only mapping can't take
+            image = pad_to(image, write_align)
+            if len(image) == 0:
+                print('WARNING: File %s is empty' % argfile.name)
+                continue
+            image = _update_image_flash_params(esp, address, args, image)
+            calcmd5 = hashlib.md5(image).hexdigest()
+            uncsize = len(image)
+            if not encrypted:
+                image_digests[address] = (uncsize, calcmd5)
             if compress:
-                # feeding each compressed block into the decompressor lets us see block-by-block how much will be written
-                block_uncompressed = len(decompress.decompress(block))
-                bytes_written += block_uncompressed
-                block_timeout = max(DEFAULT_TIMEOUT, timeout_per_mb(ERASE_WRITE_TIMEOUT_PER_MB, block_uncompressed))
-                if not esp.IS_STUB:
-                    timeout = block_timeout  # ROM code writes block to flash before ACKing
-                esp.flash_defl_block(block, seq, timeout=timeout)
-                if esp.IS_STUB:
-                    timeout = block_timeout  # Stub ACKs when block is received, then writes to flash while receiving the block after it
+                # flash_defl_begin needs the compressed size up front, so the image is compressed in one go.
+                # Nothing reads the uncompressed data afterwards, so don't keep a reference to it
+                image = _compress_image(image)
+                # Work out how much data each compressed block expands to, to dynamically calculate the
+                # timeout based on the real write size
+                decompress = zlib.decompressobj()
+                blocks_uncompressed = [len(decompress.decompress(image[offs:offs + esp.FLASH_WRITE_SIZE]))
+                                       for offs in range(0, len(image), esp.FLASH_WRITE_SIZE)]
+                blocks = esp.flash_defl_begin(uncsize, len(image), address)
             else:
-                # Pad the last block
-                block = block + b'\xff' * (esp.FLASH_WRITE_SIZE - len(block))
-                if encrypted:
-                    esp.flash_encrypt_block(block, seq)
+                blocks = esp.flash_begin(uncsize, address, begin_rom_encrypted=encrypted)
+            seq = 0
+            bytes_sent = 0  # bytes sent on wire
+            bytes_written = 0  # bytes written to flash
+            t = time.time()
+
+            timeout = DEFAULT_TIMEOUT
+            erased_block = b'\xff' * esp.FLASH_WRITE_SIZE  # padding source for the last uncompressed block
+            last_progress = None
+            last_progress_time = None
+            # loop invariants, looked up once rather than for every block
+            write_size = esp.FLASH_WRITE_SIZE
+            image_len = len(image)
+            is_stub = esp.IS_STUB
+            send_block = esp.flash_defl_block if compress else esp.flash_encrypt_block if encrypted else esp.flash_block
+
+            for offs in range(0, image_len, write_size):
+                # only update the progress line when the percentage changes, at most every PROGRESS_UPDATE_INTERVAL,
+                # but always show the first and the last block
+                progress = 100 * (seq + 1) // blocks
+                now = time.monotonic()
+                last_block = offs + write_size >= image_len
+                if progress != last_progress and (last_block or last_progress_time is None or
+                                                  now - last_progress_time >= PROGRESS_UPDATE_INTERVAL):
+                    print_overwrite('Writing at 0x%08x... (%d %%)' % (address + bytes_written, progress))
+                    sys.stdout.flush()
+                    last_progress = progress
+                    last_progress_time = now
+                block = image[offs:offs + write_size]
+                if compress:
+                    block_uncompressed = blocks_uncompressed[seq]
+                    bytes_written += block_uncompressed
+                    block_timeout = max(DEFAULT_TIMEOUT, timeout_per_mb(ERASE_WRITE_TIMEOUT_PER_MB, block_uncompressed))
+                    if not is_stub:
+                        timeout = block_timeout  # ROM code writes block to flash before ACKing
+                    send_block(block, seq, timeout=timeout)
+                    if is_stub:
+                        timeout = block_timeout  # Stub ACKs when block is received, then writes to flash while receiving the block after it
                 else:
-                    esp.flash_block(block, seq)
-                bytes_written += len(block)
-            bytes_sent += len(block)
-            image = image[esp.FLASH_WRITE_SIZE:]
-            seq += 1
+                    if len(block) < write_size:
+                        block = block + erased_block[len(block):]  # Pad the last block
+                    send_block(block, seq)
+                    bytes_written += len(block)
+                bytes_sent += len(block)
+                seq += 1
+        finally:
+            if isinstance(mapped_file, mmap.mmap):
+                mapped_file.close()  # every block has been sent, release the mapping (and the file lock on Windows)
 
         if esp.IS_STUB:
             # Stub only writes each block to flash after 'ack'ing the receive, so do a final dummy operation which will
@@ -4643,7 +4777,7 @@ def write_flash(esp, args):
                 if res != calcmd5:
                     print('File  md5: %s' % calcmd5)
                     print('Flash md5: %s' % res)
-                    print('MD5 of 0xFF is %s' % (hashlib.md5(b'\xFF' * uncsize).hexdigest()))
+                    print('MD5 of 0xFF is %s' % _md5_of_erased_flash(uncsize))
                     raise FatalError("MD5 of file does not match data in flash!")
                 else:
                     print('Hash of data verified.')
@@ -4676,7 +4810,7 @@ def write_flash(esp, args):
             print('WARNING: - cannot verify encrypted files, they will be ignored')
         # Call verify_flash function only if there at least one non-encrypted file flashed
         if not args.encrypt:
-            verify_flash(esp, args)
+            verify_flash(esp, args, image_digests)
 
 
 def image_info(args):
@@ -4710,7 +4844,7 @@ def image_info(args):
         digest_msg = 'Not appended'
         if image.append_digest:
             is_valid = image.stored_digest == image.calc_digest
-            digest_msg = "%s (%s)" % (hexify(image.calc_digest).lower(),
+            digest_msg = "%s (%s)" % (image.calc_digest.hex(),
                                       "valid" if is_valid else "invalid")
             print('Validation Hash: %s' % digest_msg)
     except AttributeError:
@@ -4738,36 +4872,13 @@ def elf2image(args):
 
     print("Creating {} image...".format(args.chip))
 
-    if args.chip == 'esp32':
-        image = ESP32FirmwareImage()
-        if args.secure_pad:
+    image_class = _CHIP_IMAGE_CLASSES.get(args.chip)
+    if image_class is not None:
+        image = image_class()
+        if args.chip == 'esp32' and args.secure_pad:  # secure boot V1 padding is ESP32-only
             image.secure_pad = '1'
         elif args.secure_pad_v2:
             image.secure_pad = '2'
-    elif args.chip == 'esp32s2':
-        image = ESP32S2FirmwareImage()
-        if args.secure_pad_v2:
-            image.secure_pad = '2'
-    elif args.chip == 'esp32s3':
-        image = ESP32S3FirmwareImage()
-        if args.secure_pad_v2:
-            image.secure_pad = '2'
-    elif args.chip == 'esp32c3':
-        image = ESP32C3FirmwareImage()
-        if args.secure_pad_v2:
-            image.secure_pad = '2'
-    elif args.chip == 'esp32c6':
-        image = ESP32C6FirmwareImage()
-        if args.secure_pad_v2:
-            image.secure_pad = '2'
-    elif args.chip == 'esp32h2':
-        image = ESP32H2FirmwareImage()
-        if args.secure_pad_v2:
-            image.secure_pad = '2'
-    elif args.chip == 'esp32c2':
-        image = ESP32C2FirmwareImage()
-        if args.secure_pad_v2:
-            image.secure_pad = '2'
     elif args.version == '1':  # ESP8266
         image = ESP8266ROMFirmwareImage()
     elif args.version == '2':
@@ -4817,7 +4928,7 @@ def read_mac(esp, args):
     mac = esp.read_mac()
 
     def print_mac(label, mac):
-        print('%s: %s' % (label, ':'.join(map(lambda x: '%02x' % x, mac))))
+        print('%s: %s' % (label, bytes(mac).hex(':')))
     print_mac("MAC", mac)
 
 
@@ -4876,12 +4987,15 @@ def read_flash(esp, args):
         f.write(data)
 
 
-def verify_flash(esp, args):
+def verify_flash(esp, args, image_digests=None):
+    """ Verify flash contents against the files in args.addr_filename. image_digests optionally maps
+    address -> (size, md5) for images whose digest is already known (from write_flash).
+    """
     differences = False
 
     for address, argfile in args.addr_filename:
         image = pad_to(argfile.read(), 4)
-        argfile.seek(0)  # rewind in case we need it again
+        argfile.close()  # file is not read again, release it now
 
         image = _update_image_flash_params(esp, address, args, image)
 
@@ -4890,7 +5004,9 @@ def verify_flash(esp, args):
               (image_size, image_size, address, argfile.name))
         # Try digest first, only read if there are differences.
         digest = esp.flash_md5sum(address, image_size)
-        expected_digest = hashlib.md5(image).hexdigest()
+        known_size, expected_digest = (image_digests or {}).get(address, (None, None))
+        if known_size != image_size:
+            expected_digest = hashlib.md5(image).hexdigest()
         if digest == expected_digest:
             print('-- verify OK (digest matched)')
             continue
@@ -4902,15 +5018,15 @@ def verify_flash(esp, args):
 
         flash = esp.read_flash(address, image_size)
         assert flash != image
-        diff = [i for i in range(image_size) if flash[i] != image[i]]
+        # compare a flash sector at a time and only look at individual bytes in sectors that differ
+        diff = []
+        for offs in range(0, image_size, esp.FLASH_SECTOR_SIZE):
+            end = min(offs + esp.FLASH_SECTOR_SIZE, image_size)
+            if flash[offs:end] != image[offs:end]:
+                diff.extend(i for i in range(offs, end) if flash[i] != image[i])
         print('-- verify FAILED: %d differences, first @ 0x%08x' % (len(diff), address + diff[0]))
         for d in diff:
-            flash_byte = flash[d]
-            image_byte = image[d]
-            if PYTHON2:
-                flash_byte = ord(flash_byte)
-                image_byte = ord(image_byte)
-            print('   %08x %02x %02x' % (address + d, flash_byte, image_byte))
+            print('   %08x %02x %02x' % (address + d, flash[d], image[d]))
     if differences:
         raise FatalError("Verify failed.")
 
@@ -4949,7 +5065,7 @@ def merge_bin(args):
         raise FatalError(msg)
 
     # sort the files by offset. The AddrFilenamePairAction has already checked for overlap
-    input_files = sorted(args.addr_filename, key=lambda x: x[0])
+    input_files = sorted(args.addr_filename, key=operator.itemgetter(0))
     if not input_files:
         raise FatalError("No input files specified")
     first_addr = input_files[0][0]
@@ -4963,12 +5079,17 @@ def merge_bin(args):
     with open(args.output, 'wb') as of:
         def pad_to(flash_offs):
             # account for output file offset if there is any
-            of.write(b'\xFF' * (flash_offs - args.target_offset - of.tell()))
+            pad_len = flash_offs - args.target_offset - of.tell()
+            for offs in range(0, pad_len, len(_FF_CHUNK)):
+                of.write(_FF_CHUNK[:pad_len - offs])
         for addr, argfile in input_files:
             pad_to(addr)
-            image = argfile.read()
-            image = _update_image_flash_params(chip_class, addr, args, image)
-            of.write(image)
+            mapped_file = _map_input_file(argfile)
+            try:
+                of.write(_update_image_flash_params(chip_class, addr, args, mapped_file))
+            finally:
+                if isinstance(mapped_file, mmap.mmap):
+                    mapped_file.close()
         if args.fill_flash_size:
             pad_to(flash_size_bytes(args.fill_flash_size))
         print("Wrote 0x%x bytes to file %s, ready to flash to offset 0x%x" %
@@ -4982,6 +5103,16 @@ def version(args):
 # End of operations functions
 #
 
+# names of the module functions taking an ESPLoader connection object as first argument, worked out once
+_ESP_OPERATIONS = frozenset(name for name, func in list(globals().items())
+                            if isinstance(func, types.FunctionType) and
+                            func.__code__.co_varnames[:func.__code__.co_argcount][:1] == ('esp',))
+
+# (memory type, capacity) pairs of the XMC flash chips recognised by their RDID value alone
+_XMC_STRICT_IDS = frozenset([(0x40, cpid) for cpid in range(0x13, 0x21)] +
+                            [(0x41, cpid) for cpid in range(0x17, 0x21)] +
+                            [(0x50, cpid) for cpid in range(0x15, 0x17)])
+
 
 def main(argv=None, esp=None):
     """
@@ -5053,37 +5184,50 @@ def main(argv=None, esp=None):
 
     subparsers = parser.add_subparsers(
         dest='operation',
-        help='Run esptool {command} -h for additional help')
+        help='Run esptool {command} -h for additional help',
+        action=LazySubParsersAction)
 
     def add_spi_connection_arg(parent):
         parent.add_argument('--spi-connection', '-sc', help='ESP32-only argument. Override default SPI Flash connection. '
                             'Value can be SPI, HSPI or a comma-separated list of 5 I/O numbers to use for SPI flash (CLK,Q,D,HD,CS).',
                             action=SpiConnectionAction)
 
-    parser_load_ram = subparsers.add_parser(
+    def add_load_ram_args(parser_load_ram):
+        parser_load_ram.add_argument('filename', help='Firmware image')
+
+    subparsers.add_parser(
         'load_ram',
-        help='Download an image to RAM and execute')
-    parser_load_ram.add_argument('filename', help='Firmware image')
+        help='Download an image to RAM and execute',
+        builder=add_load_ram_args)
+
+    def add_dump_mem_args(parser_dump_mem):
+        parser_dump_mem.add_argument('address', help='Base address', type=arg_auto_int)
+        parser_dump_mem.add_argument('size', help='Size of region to dump', type=arg_auto_int)
+        parser_dump_mem.add_argument('filename', help='Name of binary dump')
 
-    parser_dump_mem = subparsers.add_parser(
+    subparsers.add_parser(
         'dump_mem',
-        help='Dump arbitrary memory to disk')
-    parser_dump_mem.add_argument('address', help='Base address', type=arg_auto_int)
-    parser_dump_mem.add_argument('size', help='Size of region to dump', type=arg_auto_int)
-    parser_dump_mem.add_argument('filename', help='Name of binary dump')
+        help='Dump arbitrary memory to disk',
+        builder=add_dump_mem_args)
 
-    parser_read_mem = subparsers.add_parser(
+    def add_read_mem_args(parser_read_mem):
+        parser_read_mem.add_argument('address', help='Address to read', type=arg_auto_int)
+
+    subparsers.add_parser(
         'read_mem',
-        help='Read arbitrary memory location')
-    parser_read_mem.add_argument('address', help='Address to read', type=arg_auto_int)
+        help='Read arbitrary memory location',
+        builder=add_read_mem_args)
 
-    parser_write_mem = subparsers.add_parser(
+    def add_write_mem_args(parser_write_mem):
+        parser_write_mem.add_argument('address', help='Address to write', type=arg_auto_int)
+        parser_write_mem.add_argument('value', help='Value', type=arg_auto_int)
+        parser_write_mem.add_argument('mask', help='Mask of bits to write',
+                                      type=arg_auto_int, nargs='?', default='0xFFFFFFFF')
+
+    subparsers.add_parser(
         'write_mem',
-        help='Read-modify-write to arbitrary memory location')
-    parser_write_mem.add_argument('address', help='Address to write', type=arg_auto_int)
-    parser_write_mem.add_argument('value', help='Value', type=arg_auto_int)
-    parser_write_mem.add_argument('mask', help='Mask of bits to write',
-                                  type=arg_auto_int, nargs='?', default='0xFFFFFFFF')
+        help='Read-modify-write to arbitrary memory location',
+        builder=add_write_mem_args)
 
     def add_spi_flash_subparsers(parent, allow_keep, auto_detect):
         """ Add common parser arguments for SPI flash properties """
@@ -5111,105 +5255,116 @@ def main(argv=None, esp=None):
                             default=os.environ.get('ESPTOOL_FS', 'keep' if allow_keep else '1MB'))
         add_spi_connection_arg(parent)
 
-    parser_write_flash = subparsers.add_parser(
+    def add_write_flash_args(parser_write_flash):
+        parser_write_flash.add_argument('addr_filename', metavar='<address> <filename>', help='Address followed by binary filename, separated by space',
+                                        action=AddrFilenamePairAction)
+        parser_write_flash.add_argument('--erase-all', '-e',
+                                        help='Erase all regions of flash (not just write areas) before programming',
+                                        action="store_true")
+
+        add_spi_flash_subparsers(parser_write_flash, allow_keep=True, auto_detect=True)
+        parser_write_flash.add_argument('--no-progress', '-p', help='Suppress progress output', action="store_true")
+        parser_write_flash.add_argument('--verify', help='Verify just-written data on flash '
+                                        '(mostly superfluous, data is read back during flashing)', action='store_true')
+        parser_write_flash.add_argument('--encrypt', help='Apply flash encryption when writing data (required correct efuse settings)',
+                                        action='store_true')
+        # In order to not break backward compatibility, our list of encrypted files to flash is a new parameter
+        parser_write_flash.add_argument('--encrypt-files', metavar='<address> <filename>',
+                                        help='Files to be encrypted on the flash. Address followed by binary filename, separated by space.',
+                                        action=AddrFilenamePairAction)
+        parser_write_flash.add_argument('--ignore-flash-encryption-efuse-setting', help='Ignore flash encryption efuse settings ',
+                                        action='store_true')
+
+        compress_args = parser_write_flash.add_mutually_exclusive_group(required=False)
+        compress_args.add_argument('--compress', '-z', help='Compress data in transfer (default unless --no-stub is specified)',
+                                   action="store_true", default=None)
+        compress_args.add_argument('--no-compress', '-u', help='Disable data compression during transfer (default if --no-stub is specified)',
+                                   action="store_true")
+
+    subparsers.add_parser(
         'write_flash',
-        help='Write a binary blob to flash')
-
-    parser_write_flash.add_argument('addr_filename', metavar='<address> <filename>', help='Address followed by binary filename, separated by space',
-                                    action=AddrFilenamePairAction)
-    parser_write_flash.add_argument('--erase-all', '-e',
-                                    help='Erase all regions of flash (not just write areas) before programming',
-                                    action="store_true")
-
-    add_spi_flash_subparsers(parser_write_flash, allow_keep=True, auto_detect=True)
-    parser_write_flash.add_argument('--no-progress', '-p', help='Suppress progress output', action="store_true")
-    parser_write_flash.add_argument('--verify', help='Verify just-written data on flash '
-                                    '(mostly superfluous, data is read back during flashing)', action='store_true')
-    parser_write_flash.add_argument('--encrypt', help='Apply flash encryption when writing data (required correct efuse settings)',
-                                    action='store_true')
-    # In order to not break backward compatibility, our list of encrypted files to flash is a new parameter
-    parser_write_flash.add_argument('--encrypt-files', metavar='<address> <filename>',
-                                    help='Files to be encrypted on the flash. Address followed by binary filename, separated by space.',
-                                    action=AddrFilenamePairAction)
-    parser_write_flash.add_argument('--ignore-flash-encryption-efuse-setting', help='Ignore flash encryption efuse settings ',
-                                    action='store_true')
-
-    compress_args = parser_write_flash.add_mutually_exclusive_group(required=False)
-    compress_args.add_argument('--compress', '-z', help='Compress data in transfer (default unless --no-stub is specified)',
-                               action="store_true", default=None)
-    compress_args.add_argument('--no-compress', '-u', help='Disable data compression during transfer (default if --no-stub is specified)',
-                               action="store_true")
+        help='Write a binary blob to flash',
+        builder=add_write_flash_args)
 
     subparsers.add_parser(
         'run',
         help='Run application code in flash')
 
-    parser_image_info = subparsers.add_parser(
+    def add_image_info_args(parser_image_info):
+        parser_image_info.add_argument('filename', help='Image file to parse')
+
+    subparsers.add_parser(
         'image_info',
-        help='Dump headers from an application image')
-    parser_image_info.add_argument('filename', help='Image file to parse')
+        help='Dump headers from an application image',
+        builder=add_image_info_args)
+
+    def add_make_image_args(parser_make_image):
+        parser_make_image.add_argument('output', help='Output image file')
+        parser_make_image.add_argument('--segfile', '-f', action='append', help='Segment input file')
+        parser_make_image.add_argument('--segaddr', '-a', action='append', help='Segment base address', type=arg_auto_int)
+        parser_make_image.add_argument('--entrypoint', '-e', help='Address of entry point', type=arg_auto_int, default=0)
 
-    parser_make_image = subparsers.add_parser(
+    subparsers.add_parser(
         'make_image',
-        help='Create an application image from binary files')
-    parser_make_image.add_argument('output', help='Output image file')
-    parser_make_image.add_argument('--segfile', '-f', action='append', help='Segment input file')
-    parser_make_image.add_argument('--segaddr', '-a', action='append', help='Segment base address', type=arg_auto_int)
-    parser_make_image.add_argument('--entrypoint', '-e', help='Address of entry point', type=arg_auto_int, default=0)
+        help='Create an application image from binary files',
+        builder=add_make_image_args)
+
+    def add_elf2image_args(parser_elf2image):
+        parser_elf2image.add_argument('input', help='Input ELF file')
+        parser_elf2image.add_argument(
+            '--output', '-o', help='Output filename prefix (for version 1 image), or filename (for version 2 single image)', type=str)
+        parser_elf2image.add_argument('--version', '-e', help='Output image version', choices=['1', '2', '3'], default='1')
+        parser_elf2image.add_argument(
+            # kept for compatibility
+            # Minimum chip revision (deprecated, consider using --min-rev-full)
+            "--min-rev",
+            "-r",
+            # In v3 we do not do help=argparse.SUPPRESS because
+            # it should remain visible.
+            help="Minimal chip revision (ECO version format)",
+            type=int,
+            choices=range(256),
+            metavar="{0, ... 255}",
+            default=0,
+        )
+        parser_elf2image.add_argument(
+            "--min-rev-full",
+            help="Minimal chip revision (in format: major * 100 + minor)",
+            type=int,
+            choices=range(65536),
+            metavar="{0, ... 65535}",
+            default=0,
+        )
+        parser_elf2image.add_argument(
+            "--max-rev-full",
+            help="Maximal chip revision (in format: major * 100 + minor)",
+            type=int,
+            choices=range(65536),
+            metavar="{0, ... 65535}",
+            default=65535,
+        )
+        parser_elf2image.add_argument('--secure-pad', action='store_true',
+                                      help='Pad image so once signed it will end on a 64KB boundary. For Secure Boot v1 images only.')
+        parser_elf2image.add_argument('--secure-pad-v2', action='store_true',
+                                      help='Pad image to 64KB, so once signed its signature sector will start at the next 64K block. '
+                                      'For Secure Boot v2 images only.')
+        parser_elf2image.add_argument('--elf-sha256-offset', help='If set, insert SHA256 hash (32 bytes) of the input ELF file at specified offset in the binary.',
+                                      type=arg_auto_int, default=None)
+        parser_elf2image.add_argument('--use_segments', help='If set, ELF segments will be used instead of ELF sections to genereate the image.',
+                                      action='store_true')
+        parser_elf2image.add_argument('--flash-mmu-page-size', help="Change flash MMU page size.",
+                                      choices=['64KB', '32KB', '16KB'])
+        parser_elf2image.add_argument(
+            "--pad-to-size",
+            help="The block size with which the final binary image after padding must be aligned to. Value 0xFF is used for padding, similar to erase_flash",
+            default=None,
+        )
+        add_spi_flash_subparsers(parser_elf2image, allow_keep=False, auto_detect=False)
 
-    parser_elf2image = subparsers.add_parser(
+    subparsers.add_parser(
         'elf2image',
-        help='Create an application image from ELF file')
-    parser_elf2image.add_argument('input', help='Input ELF file')
-    parser_elf2image.add_argument(
-        '--output', '-o', help='Output filename prefix (for version 1 image), or filename (for version 2 single image)', type=str)
-    parser_elf2image.add_argument('--version', '-e', help='Output image version', choices=['1', '2', '3'], default='1')
-    parser_elf2image.add_argument(
-        # kept for compatibility
-        # Minimum chip revision (deprecated, consider using --min-rev-full)
-        "--min-rev",
-        "-r",
-        # In v3 we do not do help=argparse.SUPPRESS because
-        # it should remain visible.
-        help="Minimal chip revision (ECO version format)",
-        type=int,
-        choices=range(256),
-        metavar="{0, ... 255}",
-        default=0,
-    )
-    parser_elf2image.add_argument(
-        "--min-rev-full",
-        help="Minimal chip revision (in format: major * 100 + minor)",
-        type=int,
-        choices=range(65536),
-        metavar="{0, ... 65535}",
-        default=0,
-    )
-    parser_elf2image.add_argument(
-        "--max-rev-full",
-        help="Maximal chip revision (in format: major * 100 + minor)",
-        type=int,
-        choices=range(65536),
-        metavar="{0, ... 65535}",
-        default=65535,
-    )
-    parser_elf2image.add_argument('--secure-pad', action='store_true',
-                                  help='Pad image so once signed it will end on a 64KB boundary. For Secure Boot v1 images only.')
-    parser_elf2image.add_argument('--secure-pad-v2', action='store_true',
-                                  help='Pad image to 64KB, so once signed its signature sector will start at the next 64K block. '
-                                  'For Secure Boot v2 images only.')
-    parser_elf2image.add_argument('--elf-sha256-offset', help='If set, insert SHA256 hash (32 bytes) of the input ELF file at specified offset in the binary.',
-                                  type=arg_auto_int, default=None)
-    parser_elf2image.add_argument('--use_segments', help='If set, ELF segments will be used instead of ELF sections to genereate the image.',
-                                  action='store_true')
-    parser_elf2image.add_argument('--flash-mmu-page-size', help="Change flash MMU page size.",
-                                  choices=['64KB', '32KB', '16KB'])
-    parser_elf2image.add_argument(
-        "--pad-to-size",
-        help="The block size with which the final binary image after padding must be aligned to. Value 0xFF is used for padding, similar to erase_flash",
-        default=None,
-    )
-    add_spi_flash_subparsers(parser_elf2image, allow_keep=False, auto_detect=False)
+        help='Create an application image from ELF file',
+        builder=add_elf2image_args)
 
     subparsers.add_parser(
         'read_mac',
@@ -5219,77 +5374,92 @@ def main(argv=None, esp=None):
         'chip_id',
         help='Read Chip ID from OTP ROM')
 
-    parser_flash_id = subparsers.add_parser(
+    subparsers.add_parser(
         'flash_id',
-        help='Read SPI flash manufacturer and device ID')
-    add_spi_connection_arg(parser_flash_id)
+        help='Read SPI flash manufacturer and device ID',
+        builder=add_spi_connection_arg)
+
+    def add_read_status_args(parser_read_status):
+        add_spi_connection_arg(parser_read_status)
+        parser_read_status.add_argument('--bytes', help='Number of bytes to read (1-3)',
+                                        type=int, choices=[1, 2, 3], default=2)
 
-    parser_read_status = subparsers.add_parser(
+    subparsers.add_parser(
         'read_flash_status',
-        help='Read SPI flash status register')
+        help='Read SPI flash status register',
+        builder=add_read_status_args)
 
-    add_spi_connection_arg(parser_read_status)
-    parser_read_status.add_argument('--bytes', help='Number of bytes to read (1-3)',
-                                    type=int, choices=[1, 2, 3], default=2)
+    def add_write_status_args(parser_write_status):
+        add_spi_connection_arg(parser_write_status)
+        parser_write_status.add_argument(
+            '--non-volatile', help='Write non-volatile bits (use with caution)', action='store_true')
+        parser_write_status.add_argument('--bytes', help='Number of status bytes to write (1-3)',
+                                         type=int, choices=[1, 2, 3], default=2)
+        parser_write_status.add_argument('value', help='New value', type=arg_auto_int)
 
-    parser_write_status = subparsers.add_parser(
+    subparsers.add_parser(
         'write_flash_status',
-        help='Write SPI flash status register')
+        help='Write SPI flash status register',
+        builder=add_write_status_args)
 
-    add_spi_connection_arg(parser_write_status)
-    parser_write_status.add_argument(
-        '--non-volatile', help='Write non-volatile bits (use with caution)', action='store_true')
-    parser_write_status.add_argument('--bytes', help='Number of status bytes to write (1-3)',
-                                     type=int, choices=[1, 2, 3], default=2)
-    parser_write_status.add_argument('value', help='New value', type=arg_auto_int)
+    def add_read_flash_args(parser_read_flash):
+        add_spi_connection_arg(parser_read_flash)
+        parser_read_flash.add_argument('address', help='Start address', type=arg_auto_int)
+        parser_read_flash.add_argument('size', help='Size of region to dump', type=arg_auto_int)
+        parser_read_flash.add_argument('filename', help='Name of binary dump')
+        parser_read_flash.add_argument('--no-progress', '-p', help='Suppress progress output', action="store_true")
 
-    parser_read_flash = subparsers.add_parser(
+    subparsers.add_parser(
         'read_flash',
-        help='Read SPI flash content')
-    add_spi_connection_arg(parser_read_flash)
-    parser_read_flash.add_argument('address', help='Start address', type=arg_auto_int)
-    parser_read_flash.add_argument('size', help='Size of region to dump', type=arg_auto_int)
-    parser_read_flash.add_argument('filename', help='Name of binary dump')
-    parser_read_flash.add_argument('--no-progress', '-p', help='Suppress progress output', action="store_true")
-
-    parser_verify_flash = subparsers.add_parser(
+        help='Read SPI flash content',
+        builder=add_read_flash_args)
+
+    def add_verify_flash_args(parser_verify_flash):
+        parser_verify_flash.add_argument('addr_filename', help='Address and binary file to verify there, separated by space',
+                                         action=AddrFilenamePairAction)
+        parser_verify_flash.add_argument('--diff', '-d', help='Show differences',
+                                         choices=['no', 'yes'], default='no')
+        add_spi_flash_subparsers(parser_verify_flash, allow_keep=True, auto_detect=True)
+
+    subparsers.add_parser(
         'verify_flash',
-        help='Verify a binary blob against flash')
-    parser_verify_flash.add_argument('addr_filename', help='Address and binary file to verify there, separated by space',
-                                     action=AddrFilenamePairAction)
-    parser_verify_flash.add_argument('--diff', '-d', help='Show differences',
-                                     choices=['no', 'yes'], default='no')
-    add_spi_flash_subparsers(parser_verify_flash, allow_keep=True, auto_detect=True)
-
-    parser_erase_flash = subparsers.add_parser(
+        help='Verify a binary blob against flash',
+        builder=add_verify_flash_args)
+
+    subparsers.add_parser(
         'erase_flash',
-        help='Perform Chip Erase on SPI flash')
-    add_spi_connection_arg(parser_erase_flash)
+        help='Perform Chip Erase on SPI flash',
+        builder=add_spi_connection_arg)
+
+    def add_erase_region_args(parser_erase_region):
+        add_spi_connection_arg(parser_erase_region)
+        parser_erase_region.add_argument('address', help='Start address (must be multiple of 4096)', type=arg_auto_int)
+        parser_erase_region.add_argument(
+            'size', help='Size of region to erase (must be multiple of 4096)', type=arg_auto_int)
 
-    parser_erase_region = subparsers.add_parser(
+    subparsers.add_parser(
         'erase_region',
-        help='Erase a region of the flash')
-    add_spi_connection_arg(parser_erase_region)
-    parser_erase_region.add_argument('address', help='Start address (must be multiple of 4096)', type=arg_auto_int)
-    parser_erase_region.add_argument(
-        'size', help='Size of region to erase (must be multiple of 4096)', type=arg_auto_int)
+        help='Erase a region of the flash',
+        builder=add_erase_region_args)
+
+    def add_merge_bin_args(parser_merge_bin):
+        parser_merge_bin.add_argument('--output', '-o', help='Output filename', type=str, required=True)
+        parser_merge_bin.add_argument('--format', '-f', help='Format of the output file',
+                                      choices='raw', default='raw')  # for future expansion
+        add_spi_flash_subparsers(parser_merge_bin, allow_keep=True, auto_detect=False)
+
+        parser_merge_bin.add_argument('--target-offset', '-t', help='Target offset where the output file will be flashed',
+                                      type=arg_auto_int, default=0)
+        parser_merge_bin.add_argument('--fill-flash-size', help='If set, the final binary file will be padded with FF '
+                                      'bytes up to this flash size.', action=FlashSizeAction)
+        parser_merge_bin.add_argument('addr_filename', metavar='<address> <filename>',
+                                      help='Address followed by binary filename, separated by space',
+                                      action=AddrFilenamePairAction)
 
-    parser_merge_bin = subparsers.add_parser(
+    subparsers.add_parser(
         'merge_bin',
-        help='Merge multiple raw binary files into a single file for later flashing')
-
-    parser_merge_bin.add_argument('--output', '-o', help='Output filename', type=str, required=True)
-    parser_merge_bin.add_argument('--format', '-f', help='Format of the output file',
-                                  choices='raw', default='raw')  # for future expansion
-    add_spi_flash_subparsers(parser_merge_bin, allow_keep=True, auto_detect=False)
-
-    parser_merge_bin.add_argument('--target-offset', '-t', help='Target offset where the output file will be flashed',
-                                  type=arg_auto_int, default=0)
-    parser_merge_bin.add_argument('--fill-flash-size', help='If set, the final binary file will be padded with FF '
-                                  'bytes up to this flash size.', action=FlashSizeAction)
-    parser_merge_bin.add_argument('addr_filename', metavar='<address> <filename>',
-                                  help='Address followed by binary filename, separated by space',
-                                  action=AddrFilenamePairAction)
+        help='Merge multiple raw binary files into a single file for later flashing',
+        builder=add_merge_bin_args)
 
     subparsers.add_parser('get_security_info', help='Get some security-related data')
 
@@ -5320,13 +5490,7 @@ def main(argv=None, esp=None):
 
     operation_func = globals()[args.operation]
 
-    if PYTHON2:
-        # This function is depreciated in Python3
-        operation_args = inspect.getargspec(operation_func).args
-    else:
-        operation_args = inspect.getfullargspec(operation_func).args
-
-    if operation_args[0] == 'esp':  # operation function takes an ESPLoader connection object
+    if args.operation in _ESP_OPERATIONS:  # operation function takes an ESPLoader connection object
         if args.before != "no_reset_no_sync":
             initial_baud = min(ESPLoader.ESP_ROM_BAUD, args.baud)  # don't sync faster than the default baud rate
         else:
@@ -5348,9 +5512,10 @@ def main(argv=None, esp=None):
         if esp.secure_download_mode:
             print("Chip is %s in Secure Download Mode" % esp.CHIP_NAME)
         else:
-            print("Chip is %s" % (esp.get_chip_description()))
-            print("Features: %s" % ", ".join(esp.get_chip_features()))
-            print("Crystal is %dMHz" % esp.get_crystal_freq())
+            # query everything first, then print the banner in one write
+            print("Chip is %s\nFeatures: %s\nCrystal is %dMHz" % (esp.get_chip_description(),
+                                                                  ", ".join(esp.get_chip_features()),
+                                                                  esp.get_crystal_freq()))
             read_mac(esp, args)
 
         if not args.no_stub:
@@ -5373,7 +5538,7 @@ def main(argv=None, esp=None):
                 print("WARNING: ROM doesn't support changing baud rate. Keeping initial baud rate %d" % initial_baud)
 
         # override common SPI flash parameter stuff if configured to do so
-        if hasattr(args, "spi_connection") and args.spi_connection is not None:
+        if getattr(args, "spi_connection", None) is not None:
             if esp.CHIP_NAME != "ESP32":
                 raise FatalError("Chip %s does not support --spi-connection option." % esp.CHIP_NAME)
             print("Configuring SPI flash mode...")
@@ -5386,33 +5551,16 @@ def main(argv=None, esp=None):
         # XMC chip startup sequence
         XMC_VENDOR_ID = 0x20
 
-        def is_xmc_chip_strict():
-            id = esp.flash_id()
-            rdid = ((id & 0xff) << 16) | ((id >> 16) & 0xff) | (id & 0xff00)
-
-            vendor_id = ((rdid >> 16) & 0xFF)
-            mfid = ((rdid >> 8) & 0xFF)
-            cpid = (rdid & 0xFF)
-
-            if vendor_id != XMC_VENDOR_ID:
+        def is_xmc_chip_strict(flash_id):
+            # flash_id holds the RDID bytes lowest first: vendor, memory type, capacity
+            if flash_id & 0xFF != XMC_VENDOR_ID:
                 return False
+            return ((flash_id >> 8) & 0xFF, (flash_id >> 16) & 0xFF) in _XMC_STRICT_IDS
 
-            matched = False
-            if mfid == 0x40:
-                if cpid >= 0x13 and cpid <= 0x20:
-                    matched = True
-            elif mfid == 0x41:
-                if cpid >= 0x17 and cpid <= 0x20:
-                    matched = True
-            elif mfid == 0x50:
-                if cpid >= 0x15 and cpid <= 0x16:
-                    matched = True
-            return matched
-
-        def flash_xmc_startup():
+        def flash_xmc_startup(flash_id):
             # If the RDID value is a valid XMC one, may skip the flow
             fast_check = True
-            if fast_check and is_xmc_chip_strict():
+            if fast_check and is_xmc_chip_strict(flash_id):
                 return  # Successful XMC flash chip boot-up detected by RDID, skipping.
 
             sfdp_mfid_addr = 0x10
@@ -5428,11 +5576,12 @@ def main(argv=None, esp=None):
             esp.run_spiflash_command(0xAB)  # Release Power-Down
             time.sleep(0.00002)
             # Check for success
-            if not is_xmc_chip_strict():
+            if not is_xmc_chip_strict(esp.flash_id()):
                 print("WARNING: XMC flash boot-up fix failed.")
             print("XMC flash chip boot-up fix successful!")
 
         # Check flash chip connection
+        flash_id = None
         if not esp.secure_download_mode:
             try:
                 flash_id = esp.flash_id()
@@ -5445,7 +5594,7 @@ def main(argv=None, esp=None):
         # Check if XMC SPI flash chip booted-up successfully, fix if not
         if not esp.secure_download_mode:
             try:
-                flash_xmc_startup()
+                flash_xmc_startup(esp.flash_id() if flash_id is None else flash_id)  # reuse the ID read above
             except Exception as e:
                 esp.trace('Unable to perform XMC flash chip startup sequence ({}).'.format(e))
 
@@ -5495,6 +5644,10 @@ def main(argv=None, esp=None):
         operation_func(args)
 
 
+# pseudo serial ports on macOS which are never an Espressif chip
+_IGNORED_PORT_SUFFIXES = ("Bluetooth-Incoming-Port", "wlan-debug") if sys.platform == "darwin" else ()
+
+
 def get_port_list():
     if list_ports is None:
         raise FatalError(
@@ -5502,35 +5655,74 @@ def get_port_list():
             "Please try to specify the port when running esptool.py or update "
             "the pyserial package to the latest version"
         )
-    port_list = sorted(ports.device for ports in list_ports.comports())
-    if sys.platform == "darwin":
+    port_list = sorted(map(operator.attrgetter('device'), list_ports.comports()))
+    if _IGNORED_PORT_SUFFIXES:
         port_list = [
             port
             for port in port_list
-            if not port.endswith(("Bluetooth-Incoming-Port", "wlan-debug"))
+            if not port.endswith(_IGNORED_PORT_SUFFIXES)
         ]
     return port_list
 
 
+@functools.lru_cache(maxsize=32)
+def _read_file_arguments(path, mtime_ns, size):
+    """ Return the arguments read from an "@" text file. mtime_ns and size are only part of the cache key,
+    so an edited file is read again.
+    """
+    import shlex
+
+    args = []
+    with open(path, "r") as f:
+        for line in f:
+            args.extend(shlex.split(line))
+    return tuple(args)
+
+
 def expand_file_arguments(argv):
     """ Any argument starting with "@" gets replaced with all values read from a text file.
     Text file arguments can be split by newline or by space.
     Values are added "as-is", as if they were specified in this order on the command line.
     """
+    if not any(arg.startswith("@") for arg in argv):
+        return argv
     new_args = []
-    expanded = False
     for arg in argv:
         if arg.startswith("@"):
-            expanded = True
-            with open(arg[1:], "r") as f:
-                for line in f.readlines():
-                    new_args += shlex.split(line)
+            st = os.stat(arg[1:])
+            new_args += _read_file_arguments(arg[1:], st.st_mtime_ns, st.st_size)
         else:
             new_args.append(arg)
-    if expanded:
-        print("esptool.py %s" % (" ".join(new_args[1:])))
-        return new_args
-    return argv
+    print("esptool.py %s" % (" ".join(new_args[1:])))
+    return new_args
+
+
+class LazySubParsersAction(argparse._SubParsersAction):
+    """ Subparsers action which only adds a command's arguments when that command is parsed.
+
+    add_parser() takes an optional 'builder' function, called with the new subparser the first time it is used,
+    so only the selected operation pays for setting up its arguments.
+
+    argparse has no public base class for subparser actions, so this subclasses the private
+    argparse._SubParsersAction and relies on its add_parser(), __call__() and choices mapping.
+    Checked against Python 3.8 to 3.13.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(LazySubParsersAction, self).__init__(*args, **kwargs)
+        self._builders = {}
+
+    def add_parser(self, name, builder=None, **kwargs):
+        parser = super(LazySubParsersAction, self).add_parser(name, **kwargs)
+        if builder is not None:
+            self._builders[name] = builder
+        return parser
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        builder = self._builders.pop(values[0], None)
+        if builder is not None:
+            builder(self.choices[values[0]])
+        super(LazySubParsersAction, self).__call__(parser, namespace, values, option_string)
 
 
 class FlashSizeAction(argparse.Action):
@@ -5539,32 +5731,34 @@ class FlashSizeAction(argparse.Action):
     (At next major relase, remove deprecated sizes and this can become a 'normal' choices= argument again.)
     """
 
+    # deprecated megabit size -> equivalent size in bytes
+    MEGABIT_SIZES = {
+        '2m': '256KB',
+        '4m': '512KB',
+        '8m': '1MB',
+        '16m': '2MB',
+        '32m': '4MB',
+        '16m-c1': '2MB-c1',
+        '32m-c1': '4MB-c1',
+    }
+
+    KNOWN_SIZES = {**ESP8266ROM.FLASH_SIZES, **ESP32ROM.FLASH_SIZES}
+    KNOWN_SIZES_AUTO_DETECT = {**KNOWN_SIZES, 'detect': 'detect', 'keep': 'keep'}
+
     def __init__(self, option_strings, dest, nargs=1, auto_detect=False, **kwargs):
         super(FlashSizeAction, self).__init__(option_strings, dest, nargs, **kwargs)
         self._auto_detect = auto_detect
 
     def __call__(self, parser, namespace, values, option_string=None):
         try:
-            value = {
-                '2m': '256KB',
-                '4m': '512KB',
-                '8m': '1MB',
-                '16m': '2MB',
-                '32m': '4MB',
-                '16m-c1': '2MB-c1',
-                '32m-c1': '4MB-c1',
-            }[values[0]]
+            value = self.MEGABIT_SIZES[values[0]]
             print("WARNING: Flash size arguments in megabits like '%s' are deprecated." % (values[0]))
             print("Please use the equivalent size '%s'." % (value))
             print("Megabit arguments may be removed in a future release.")
         except KeyError:
             value = values[0]
 
-        known_sizes = dict(ESP8266ROM.FLASH_SIZES)
-        known_sizes.update(ESP32ROM.FLASH_SIZES)
-        if self._auto_detect:
-            known_sizes['detect'] = 'detect'
-            known_sizes['keep'] = 'keep'
+        known_sizes = self.KNOWN_SIZES_AUTO_DETECT if self._auto_detect else self.KNOWN_SIZES
         if value not in known_sizes:
             raise argparse.ArgumentError(self, '%s is not a known flash size. Known sizes: %s' %
                                          (value, ", ".join(known_sizes.keys())))
@@ -5576,9 +5770,10 @@ class SpiConnectionAction(argparse.Action):
     """
 
     def __call__(self, parser, namespace, value, option_string=None):
-        if value.upper() == "SPI":
+        upper_value = value.upper()
+        if upper_value == "SPI":
             value = 0
-        elif value.upper() == "HSPI":
+        elif upper_value == "HSPI":
             value = 1
         elif "," in value:
             values = value.split(",")
@@ -5590,7 +5785,7 @@ class SpiConnectionAction(argparse.Action):
             except ValueError:
                 raise argparse.ArgumentError(
                     self, '%s is not a valid argument. All pins must be numeric values' % values)
-            if any([v for v in values if v > 33 or v < 0]):
+            if any(not 0 <= v <= 33 for v in values):
                 raise argparse.ArgumentError(self, 'Pin numbers must be in the range 0-33.')
             # encode the pin numbers as a 32-bit integer with packed 6-bit values, the same way ESP32 ROM takes them
             # TODO: make this less ESP32 ROM specific somehow...
@@ -5616,22 +5811,21 @@ class AddrFilenamePairAction(argparse.Action):
                 address = int(values[i], 0)
             except ValueError:
                 raise argparse.ArgumentError(self, 'Address "%s" must be a number' % values[i])
+            if i + 1 == len(values):
+                raise argparse.ArgumentError(self, 'Must be pairs of an address and the binary filename to write there')
             try:
                 argfile = open(values[i + 1], 'rb')
             except IOError as e:
                 raise argparse.ArgumentError(self, e)
-            except IndexError:
-                raise argparse.ArgumentError(self, 'Must be pairs of an address and the binary filename to write there')
             pairs.append((address, argfile))
 
         # Sort the addresses and check for overlapping
         end = 0
-        for address, argfile in sorted(pairs, key=lambda x: x[0]):
-            argfile.seek(0, 2)  # seek to end
-            size = argfile.tell()
-            argfile.seek(0)
-            sector_start = address & ~(ESPLoader.FLASH_SECTOR_SIZE - 1)
-            sector_end = ((address + size + ESPLoader.FLASH_SECTOR_SIZE - 1) & ~(ESPLoader.FLASH_SECTOR_SIZE - 1)) - 1
+        sector_mask = ESPLoader.FLASH_SECTOR_SIZE - 1
+        for address, argfile in sorted(pairs, key=operator.itemgetter(0)):
+            size = _get_file_size(argfile)
+            sector_start = address & ~sector_mask
+            sector_end = ((address + size + sector_mask) & ~sector_mask) - 1
             if sector_start < end:
                 message = 'Detected overlap at address: 0x%x for file: %s' % (address, argfile.name)
                 raise argparse.ArgumentError(self, message)
@@ -5639,349 +5833,275 @@ class AddrFilenamePairAction(argparse.Action):
         setattr(namespace, self.dest, pairs)
 
 
+class _LazyStubCode(object):
+    """ Class attribute holding compressed stub code, only decoded the first time a stub is needed """
+
+    def __init__(self, encoded):
+        self._encoded = encoded
+        self._code = None
+
+    def __get__(self, obj, owner=None):
+        if self._code is None:
+            import base64
+            self._code = marshal.loads(zlib.decompress(base64.b85decode(b''.join(self._encoded.split()))))
+            self._encoded = None
+        return self._code
+
+
 # Binary stub code (see flasher_stub dir for source & details)
-ESP8266ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNq9PWtjEze2f2VmEhI7OEWaGdszPIrtBBcKbGlYAt2bbjNPutyWDW56Sbt0f/vVeUmasZPAttsPDtZYIx2dc3TeEv/aPW8uzndvB+XuyUWRnVxodXKh1Mz80ScXbQuf5U/wyH1y88nw1/vmQSZdTSNT9JGeWeq3\
-ZzP59nDOL+SpHQr+5jSljk8uKmirIDg3/ePC/ElMzzE8g/lMhwJga8wQkxX8+rVppfA6DD2BL1qemEHUGAD58oUZVwUAwffwzsJMNUbIFPXV5QEACV+53+IF/L09sQ+iA/wrb5pJmpImgfemBp74fmgeCgj0xQDV\
-4OJux10QvpYeJ7uwFFp7NukiXD784tD8cRB+A8MsAUudTt90OsEriYGmRlhvG/BVRTjlDvERTwPUEPwbXlgxxs2nwJZlgsxnAuGI5v5XD+ePiJOKin8tUtsYGBAUDDw7OTErL+grAYMDnwrTdVeuN2ADcL/pWVZ1\
-mZBm6HV0k/R+5GUQ9mzDzL/rjZhuApdB7ixdZd4gZeeXzlbJhr3t1foDJNwALNgGjGRHyyveEO19GKGW/ZjZx0QxXfZQkbmVnMvXZ+ZP4zV0LI27Hpil8uYvU69RQ6PAxh3vhbYjNiofMhiq8WSIKruktz9iT1nd\
-RgZQXQhplzIAustYuU+PshISzghvtlG4xisk3Oxwif+MnuA/Fw8tG33J38r0EX+rqs/4W53l+M30rmVoWE6Dq5g92ZG5+V0jRMqaAM5B3NF+xFe0hn0bFVsR7kpaUFwYyVTFhRFqdVyAwIkLkGVxwahqWLpWFkUw\
-RcJyqkwZORWxvpr4CAaQ4sfR1ADSGnRUBqsldmAIYM+p6mDPjAiitsjpZewHFNDhbzy5/hdPSJjfG1kRZL7Aa3FI7ztg8Kn2nx7R8PXaiqDXFB5GhDEEgoYHKiXBdtCViQh/wMMl/eH4efyxz98Z+iCrGrGetyz4\
-6YuWLyVDpnh5MUNZb6AObWRNmNqykGf0mp78JO8wAmv+pSfcc/dUx9EceCxCWQ5wVNv4ZLz4+iAuoh3kNiMKdJVMoXvA6ijz9xa9ncT4DygsVIhaRUELOlUP9u3cA+gRFVGXo3QVRV8fEIMQswgjpQQniDldRA9I\
-tMHPm2eMg5BERtsacEvASsJDISbN+PnUG79pyIzIBZgxcYzSZk/XlS8gPBTB9viC9iEi0ryc424+2U0PgKLwtAIjgQVXO1kFLffOJu/k4QIQCbxJ/Y/huZm3AvtGAepk9GyKT47cyAWPDMSo0D4wpMriX8jayexc\
-rieAnftgw48ZLq/trqVI+I2J4z9dbdtXlx94ragEAUndYT+Xn0lwV6AC+vPyFAB6ORUUt0QyM8NjmRW0q5v4FWOoxNcXRMNafwGc+T3OCLJQV94rmd9TYc+vGIXWypCf4w6Ut9AQ4p+SqR2ReXC8ZFZRowVvsQat\
-tkQw+Q573WQDUSQzsFvm87hSD+QJ7YCcv2f2u90NDA5sP42bqASdQq9lgGx9zHxbW5hQlqgG4Pb0KLylwYietLyYfCxslDg+yy0vvKbdofQ/1sVfW9CAeRXRa1nHYAtGc3ix7b94DNTYAqVESrBFs2BEXarqFkB3\
-xtOqAI3yY4IaLP1Gj2hAFEgIJ1rdCOTfN8xVg/RqlPvFztVOPyfz0xuKYH65No7ZhLiSdZiPxQtZwgYeMyYzZvOuedIyEwM71bWn3oBesZNY2eRi82uPGS8TzwiXF5XekX7Q4ww5cB90J+yOjGZrYseTdsYYOLi0\
-9H+L6uVbkN/Z+D2KxQOhxyXTET+pGKcLyVS6fLqp3fFoYQ7usVqqgFKAvJhmr8ZgjsLmBnsDqE+2wCMYqk5ugjmzBbo8Zfad/M3Tm+j3yTvNwnOOBBBDn2ZK/iet/BV3yI4G+/AAeA63cSXSAhUazJeDhoE9prOn\
-8HrJqqX16X7EZhQItfLwmXFl/wpDTG+AHUpqbHyE/7Auhk0EnKi1OJj62UEwiwP6eerYBXWfAm0b7MCYsiYdENw57vIDn40MTurCx0l8BU4sN6BcB9Viu2TURVtWu0tjNPHC4g8e33biPIsd5ERqYDk3wtTpHvTy\
-xu2BUxt6grIK16CCdPOWQYisFKe+wANzEpFNzRIxNmqsTZhIqAsGn8diJao1Y+7hZ8Z20U2JBnywDeDFIXA+0rWxFs4RWe4H6tkhOptR18SckNcF0hKwXjW0znZ6l/CJ0hM9E1r4UuwZ1s0IV+tvbwZwTO/qTrCg\
-4MiJJfRDfgMwP7aMDZu1md2AvaP+Dn+fRQTWGjPEj41WK5l3mpqxnBFH2t75NPscXcW0SxqAnnYK+Qj12IGj1N/20Dp8/AIjGo8PxUR9Rr6Z2S1jmlNPSmDgR57pBbODikLcZIljmUYcGOI1xzGTdY9xk4xigxrE\
-z/iUPSdsVuPvoPngDLXuE3TBfBOxJYNZn+zCLh775hz6SqlvKAJGVboTuycY/GqYYXLP/622pl1zDfxaJZZBHeOsD9h2SuxeWBKzt7x0nYlPMWZaZvfg7X3PBVHcveOCyBie6xESPG0TbBHXNCCRYKPX6l5ArIke\
-oQbxjlNUNEWZ96eIyPxsOIwImOp2YF5EMF59+/Bpdi9imKvx/zL2J6zmG7LgVuTZWVcBpWqQBJb9rfx+8CUvfcLeZHO1e6OB45qIuMWMUwwHCbNa6mkjNGfUOWDhyVE4BBv9BdlutbchjJu+zS+j6ngvKkMcmHz4\
-nN0K3H/hO/j7jmIAAGkZR7jnR9TMhJvN2ncJ8jyG2bO4QDXPuDTQ7ebeJilgn1KPuECBy/ZoGYeTd7jio3C7DIdnj3lpxeEbXk+WHhU3cIab7LVYjfoXaJg1lcj2y6f0W64fwoB3n1NgpcmPhsBDJfwdD/6BoAyO\
-ip2y2AP5+Ats0iEJFrQE8q7BQh6dSvQLGJUwN6AfERWo4/RdXyKKlKGICPA3/JslQzAshsyOcbHDNnWDrYFY1WwyotBdheIQ6eQMN/QH4IHTAxj2RwxdlN8CnlbhNgsnJeYm+wYx/GKodCNkIoK3CoHCGvVmJhbE\
-RU70dZMDpnj+LfUGcPiB3ALixlPwMTpA0MsQnFOJAejIzAmmUvOSPLK6PGIzQxGqs/gb2ueZuiV+FsiUv0WLQh9BUJfYBbRbPX1w4SShThahPgpT4qBjlkjk1ATBC4D1mLwdigsGqeyoLBhziNPX4GIra+LSloOT\
-up2xpVXolxMXgVUtBvEhWMYAAcZaxECi2gDclh238fxoe23oEXL/ZnTQwRw6gYoflJO7AVOiFVYA/DMfCLynW0IFtIISFu8dlf2tSIZwe+l5WDXbhIY3aGdBNBBkFOIbfi33I2fFkaqYifjQhLkK7eomQIDNtxRA\
-ad9xLLRG1bY9BAYIwrn5t5oSjzbJnChSoWt5zDbN9snu3cFSbFRkXF42CKWrVv4cciKgeeq8/E3sXXRAk4/HRYG4KAQX+j/FBa+EYq/Y4BDqjFePrBOxd5cF7DwrcgLFYNDCExPmocpfyccxBL/eTInJYd3CcR26\
-N+pj1yprzNjmBIUKurgB36waEzItZUGighjhEALEGK0pj5jI5psWx5SX3W6JT+IvlSWiavyJtWu6tkQgZ0jSDoCydK2B9wDzdSwZp7aIvowEMEGEZtHQTr5y5h/F8ELSdm0NJv8kgmmHRD0QRRqiFvilDlp1Ckmc\
-9DXFZ1EAwhZtnEBAcEeQBJ1wsoiQGi49mfMRBL/L278s/TDjn7X9hQ1+JKCRx8FEyVG5WWJ3WAOBsLnFuweMYta+FjchxZ92KdgPfrAhLWjh8p/w9YGQ7QVtGuSn6TGnADL29Covapk4s0fFVyEo/KYzc7H0VfPV\
-1BhVHPDKHGMC1/xPsIZ1CJfqv9CcNeRtK/UMhKV6LdGMoAzgOxBVI4KfEiBgDz+7ERhtWRZja19pzrvUvp1bhmOrMt8Aid+8OP0nRpmAxfMl7Ql0U3HpO2wfoF+TdlXYty4SWyThayt2l6x7fJmLea8d6zUETpJE\
-r0HSjzCu8yuMsYAHsYjAMa1qBfaSWximLDoLW4UJrYpWCC7BlC3cXGIrKlscQASmhI1ZJhBzoxyOOhOWgFgtegnU5z31IcbJ0xVA/Aro9FRioRdLf3v8at7KC3RTUIzsExp0iTFgoIYOYV/WKFU4mJp1EmELK38i\
-9sja6RJdxPA7eseIKbcnQcHouiMjPLuNtWZxpdZkS3fyvCc7w7/a+crwxmtm09IXDvfiLp1ZOMCU6LE1gRcCIlkxRY0YPoGx50/sDF4/MZxxwMRJm9lXTEagDVrhWkLOlg+SjnJ9iMHJG6h0thWks1VUsZVpxfp9\
-T6xjWi28j2zIeo6yXJ4lqvR3feYjWwN53O6uZTctzHa4JUl2DUkaEeMoBld2t+UoNNB+n4rGfo8/7X6SvkY7LbyJVDh5u4GxzNhqe+8QJGxHmRtMdnQ32HCEzJB4wSjUCGME90mI6yqB4CUocGSaKesGJfJYP3GY\
-wFxppQ99WYZ7X+k7G7c8BrXA4KhwoadcHjQFbM9JEBmQB8JjhYQDYD0YL4qLmGt9uqMjucBowfAwsgPWGfFYPrg8lMLMQW8QcD9BpMJg4B7sIRNGNGxWEBMab3Q/Kj57ygxkRJgVZywaUi+SodpXjn81eaNxJGxN\
-yNZx+NnsFka3Yir+oTQwOLl6SLKmqL2MLbij6oAGybEy5/BLChflWJnw5XxvyEENnof95Rwc+4JDh81Y8y6qoPwn453cTvZuhhSVbCvAJCqt2RfsbcJ02as9iPixyC6rvW2kzQjBO8eY6qLII4oaHnyMWTNKnOr1\
-hOIIJ3wrJAZ7EM2FjPxuDY59oS44+Q1YnhIerFLMXE6d8REV2SLMzgKMsxe3CKi2nUXB2bv58XcuLgCzZdPpnbMLxrR6j6rwPTTPzvQiVCt8HyMm77gmhY0WnbFhCGUvhQZ8pWcEec6VL5Ax03pF4QWbxLJCYRHe\
-grejxSuXYDOv75IwwVTyJKCtlQe0k7B2rqAdVfAGKtWcrD+ArMAxZgLHihEOQrl6HcNE1W8U56KwWBMM+W3IG8II6O6kNnKEpOHZVer2c2XAzz8QPeiZYtBSLvvJ6IdCbQTmPQGjfrIROoxmhVN2hUgYTBchJ0HK\
-zHirNDUgocoCpG/wHkD5gEIgzM9+Vb+uIoF/731IKG8r6JajC/MShlsA3wE35WhcHy6K0Sr8jAS5nnoRW07aGbj2dwZewjTjHHXmVXVgpN/muqDjLes33YAdNuT4+ETE+uSGBFwZ9w12T+c/Q3Nvawb2i2K/hbyx\
-GIOSgaZqBuQRpYaadg12G6MRYqy6LS/JEneNP+BHBBXKIXPNHFt9INPcU92n8DM4SwbTA7W3g/aUBSsXcVUaR6nGSofJzQqNvddUXVWzS9MJX32EGaSlmGXyM3GGNYOc7dNwzBaV7r3rtazQCGFCBEjMvC697Tnt\
-1IFk5d2O6YNVWTzvTR6rP+9WYIMOsYQRwrcdChcPicKniMrYp3DSoXBBFM41jJmlS1exJ6WLIpKArClvSF2KhkqRjFB2prEUNw1OdhVK8yI67dLxKaElB/aUcFvPgrP2XQT+IyVATnYhITAGDdlWKzRQDJVfElSk\
-F/e2VgthxrSj0QctxQIgHg1e/JSMe+ui+vVDnpNDaQ+cC5l2gkUPEygDbsB+AdS6gL3I3KjYYQOdB24+lSmhHGsy9tCjNnImqNxNLvsq3LnOa3/PESqDmx3ICAESc3KsKxdEZN3TsuRGi6xsbaoDyLWDEfae35d1\
-qLnXohHEpbNE2L1bYkq1lLlRFVdMoW4oDvRnaE6k1tVAr7fv7M6pf9/TfUP7jCyptYrnSuKUYIeVC0wZGzTCP/GbWnxtdA5+YXdhylVd065u7bDK8yVVGUr4BcKgwG9tFTKDoshqNxi5+/1lGEMwJP5oqYxCa4Iz\
-vo0Vl4P+C74XrDmlVQ6IUMZzGjLJNFG9LS/IPq0hzVlmUmilS9AgVoBJzVaBphfUG2LQsnyWyvMtm35BLa69zL+rxviM2Z96W300p5QtZC4b0Px52tFD5QY9RNlE1kMLTwnBArZdRq+jh9Z00SHrn9yzQP5TXcQ1\
-CBvUUTeVc124VndimfXGkEsvctT8IWqJZy1dVcCmcsw/UEPNyTu6muxoX0P9lWLKUw1YMNRSJEUGYOXDi0RGzVQ6wupyq0Nd0i9sZOJQUzaJ2wTFxozrojkij4FbJC40wNSyQrkb0g+sznK5/pbNZ0LzzFVZdj12\
-KTPi8KdPdYwblX74s6WYJ7vTunyxpGMiXfMQWCqnELe2fCLZ6q3gMnZhQjpqaU6ZOWqhK6HWLUYimdJII9gYtgynImrocvsyY0Hl6nY6v6B5siKZJWyuYL0QWgwxW6Ic22xrT+VcQoj3APsHrqDCMo0pgFUs1tBy\
-iLBvB5fvIsmtq7jDy/9YRw1x88JHDQ4/C/TskaAm9lCDaU7xYydrImhoRFDxd0FN35j6kTPfbKS3tUTEPUQLYmYeYhRHeDFwjsiMl122NAiAofRNyMZLNXgLoGVpS5XBEkCjCtpIzlIYff+r4AVYVL+JuFJ7J0Qa\
-G/vkTck+AKcssZB6/H6D1fSpYTTNQX41+R+OqsebwmhXJr6MpbZzfd6joKBmGe70opcT/x0/bnnai1tOunaSy0Z3fbwl2wTo3YEs6Lh3GavT0WahCpyr2o917jqe3bYTWJd7docA+lcw9+906z5GlX4aGyCQk5uX\
-KtQuO/xBCnX5p2pTDiWC/mLCn3YJf4XPl3V9vq42zfQ28dOf6/CJzVzKntF7SYaBpGJH6o0pvbuzt8VSZYAi5C3n8WFTaihQJwHyccYXyTAslZu60Nv1Nlh9mQTJP0qC5FN2w1jg+EKkcK+VlPB0cmSPXIy3HRxy\
-YReisSwG74g7MdhnHLuzn0lsGMBuaq42L9AjY3lC6lzdjlbF3j2SAnLACq2fOUsLoE6BmMNTMZjztQIi5Eq/YvScXGUM6919LgfOit9OVvhDtbP84bpQbsgVOoU1fwhTewYfq/Dm6R4zDDpdxRlhZssjApCmwIM+\
-JNSh7AsVnir/ecyV97VfNMo7kd4vmSFYpcpzrIdUVoPHdyJ8EN8BRTrhckItEsv2UzQKZEPVWGDUpGLfvPDrUCTa+oEC0Jn1Ulbe6S4JGjYhFYq0sAtQW0yJ7qKbkWaVrUsJvJzhx4nSERtafMjF7Y2riwt6sjX/\
-79bTfIDV2FoaykZ3CnIhW+aXHxg22n7PpbIxn3OqMFHL1R0ACX15iqcCi9Qmox9wbb8kJcHzNg678bwDKhnUNsoAnPDksjKeT6BAnnQLwv7ovKAUcKCHdN5FlV+r8/ZTIlkjrBCAPEiRc51bN1296ka0oFAwj12h\
-oFnK/BvObqBGHUg2Tkpmh/SAinSm7MpiLF2GDo9QGm3lpavWy2ywT3phbG+Hg9vpYzj5UKFJnlzCPhmzT9ZnH1CcEHMt0NIt9AWfZ8ovhI2krIFSkBTIwhNXY5d/lFgcqwVgMsggNBi0CPeYJjEfYI6/hy+YOwS2\
-trnoMhxz6TdQEXuBq4BfxlzhPSWBjUmYMQtv2cF4hrDBwG9Bg9SZ1FuP/+0OXmN5dPpUcmP8Gf/GXasLBASz4zf6lV6+zS0SlU5PYQFt7CrI4RkgATKPjcDUOGGHJkbhPujEF3Ro1vZJr/htfMVvkyt+m3Z/A9ga\
-bmdldBtW8UUOqJ1tzQHTEaG7RJ172vG6Yl93watusL2cJKmKv4CMawvnFNsCz1osjIWwxlQPfsbq5DnbhrUUy7dy/kktQm3zzbP3fELMMN/8NrxDzCNnMiBEMd3n8lSsDJLa+cn6hQqYoAZBind3FEzOlkhax47D\
-6upYpDFzUsNZtoaryDDrl6x5pl4gV5I/klFEnY4B1eIoHA62Sqi8qumwFXx5wV+gY60hA9AWw63sZPWObF/zWgHR0uL5NyerM94S9jB1RVunVXi8pSy2g+D8WCzpBcVvMkWHX9ixlXgon5xpc7uFhvZk+goxPwRV\
-PiBTDutZ80FOg5Sx7LZbWs4YwCLQBWRKUJhGzsdMQ7bxco5aye0VuoXTfkY+cTljjnX+iX+GE+WXPZWVH8GzJZoY+y65X00OeZgm40y55lL6Yv04u570ny9n/ASOilR8ngaj0Fhm4Z/bUM36oJYquPrbzGcxVWh8\
-gIxpTc8uG6BzhCdZ99UqEHUtANeqUQAeErg+lV092QBtscSq8RL3VuJOj8TeeV83HR+iw2Mc6A2VF799/yOdPBnsO45Wcr9M3gW68Ws3YtoiVSyn8qiytC27qEdZma8vXrShuFRkvMNGzB9+m+0/4sM4qBHy3MlB\
-lLuQCyh5YNocGd8JY/mGQcOzDwqq7fGgV37Pza4r/Ml2dJY4wNOJT7ccFcfvUkQXhwfd+yuqOMQbKkK8oSLEGyqgrCvH+gj/vpn+/SSuRBQaTsic+tfDnIacnepcI0RizbsMghk3PjlH3yRk6xcEYpv1LlWo2ICw\
-h3rAlodTZrUEZ6A40y/BVJY32s49CMZLXuGNRpV/DAQNPIkp8ZFkejnkaHLL9/I44JnWVRbSpQ9QsSJbcfPtPVbwyxURFm+xj9F4Db0wt4dU/xyYUtvHBwwo3d00F97r3j2h2Wd3jx91LqjAuzmOz9cQZkugqMBD\
-RWtLytbufZm5K3ms0kv9NXtcgZSv9A8I/rkePBE+4MojDMA+cGvSKMwz6McJb/h3BeIFk4TVYKQi51sYuFndJHTvUQ3so/EGl+CBYzU83ohYpDJHkQht/wYPuawJVcpxxX3r6TqnBcH28QLt8ZFoqnaGd3OEBRGr\
-RqMBUpgN3ZK1zZmfpsu4Qz7XXbVXQITscPyTf1THFW7UaovEHxoBMWKZ1OPwyWBEJ5PB5KjzkTC6z9dX8fMTuXFHOqG0zfEU7JyZMsdD5OCd5vOT83cwz9dOTGOAJGFxzlFCdDFa4huEomIgWyZjNe9fkOOuesAQ\
-fwuLLCTkkppV7vLFRRBiaGqhO5cRg9ekMQbX3uOgWIcH7L0KAZ4pjOWAYDo8OcFXH95lndxCIqMCounqEYQvs3eATgA++5p9xNbd8RVsFBGt7wR+vUN49PbNuZzzShcYMFFP5o9u2K0PfcfDMea70y+jva1gNB8+\
-EB0UNXKtxMsNOi/TopvGATPNVeRXd3rkR+Ds+WOu0tZynUZdMp3LPmKlQ7Umyf07QUo5iCt33k0uG6f27IN2bY3Xyeg1EcVC6VxLgus27JiOyR15thY7wXK9iEgvkBO5iK2Ya4Ir/BJfv91e+Wr2rHslG9gnVAcH\
-tKjwMpdZ6j1DRzKXW688EqztW9ikuGftTnU3Xsmujfjwl2J0yPYdb7ioRMiU+bER8UYwO9LybU41ndtY3eNqD9mGrdq4DdtqIZ09eHDfVutw1HL3EH+nEPAxn6ms5XQcXjLCQ2H9cCZjTjdcD9VodwRCJXJDzFgw\
-se8MyK6gQi6tiBByFwnbX58kMByfuiuXzvk+hbL4D1j/B5+tvvcb537jwm986LJi1rstMO+3/avdsurOBv2Ra2fukPaoxdCWDQ/YAuYEJkWO9ZnUkMFaPSjdR5zCKBI0e+aOp2qf3sWhd8WKOqplN/9I+ZbNvFhI\
-8CGkXFyLFXTt93yDjytAfUSnXlbeOftLL4MjXtybO5iXn/dumSjkVrOa7QKZFN9haxQtvB13SwcflgLLPyiE9+6x2Vq0cGfl5Cn7guoWX8tWZBtueaszvtkTp3vF94NWPAVeAbH4kTQsyoz0kqIjrHDibSQRIUMI\
-vj0T95IWIJt9d00TFm+1D4QiCDQvpFb7DHlebKCWlJ81fIWSWfcrzqTkiQBAyXjMqcCagDPR7WufjYTHKOXm8s+CzqUsRI5WqcXTH0K+eqHtiZVy0xVNdBVKIa9EJyvclxArQ80HwXV7UJxTGXgUA4/8N+BGaotJ\
-gCaNDlyyp+ELKQiv9iLXqRxu2PnLMPwX7w68TcID+N8bZMqYoxtt+H9r0vABX3sDhCIJOnLByoLVQudgyURuO4IS/7Y92qe95+8oiDdlL+86b9teQzjx/DUv3ffp4hUC3rG9dggN+i/4uDRgr/LCC37e3R4kUVBi\
-1cQ0mJztG+/wCRFMIZf+PWglcPYYp4C3q2jYD7hYAwlvPBu7sxaa5sPbn5xAl4Hx/G0ssJedV5xRZl/D3n21UE62sJIKroVpJ3i0P4EDKuV4+OzQu7AudQfcBBVTPKCjmGV0GdlzIRh1VeXhMV3aYfiPtSR08gDI\
-qFIFn0wnXlwk3mS40efw0bGLR3Ivs4gBwB/78MMBg8uWQJEVcpMMsAuGsz3mqrjW7yCzVNXz6wDpg4tzQoTYDH8eJHKMgfJ8a+/EPnbdz7ujAO+R/u6n82IFt0lrNU2zNJmkmfmleXu++sV7OI7Nw7o4L/ja6c4l\
-ubj7xp4VLsXFck9Uwh8OoUEtJhi2dMtvyXasmuX2G9Wt2AZKb3rhNlvWchWrbUDU1Ta8FygKXsu1xeAj4qlLxYlO2+i84zUuaOz+4xekRmnQipOEavbSfrt8RDLnN3cDcBotv2hJR81YISfcgEJ7cPpN4xnp/mtm\
-vKzxb+Kk/uNzr3fJ1jch0ycSCDU7NyhJh+bSa3TmVpltfPWpwP7uxsKDClBoG/DFrmTtkuK+BZL02n3vs3dS1e4D+nSPgKx6e7s3t3+tFBp8nYBlxybq2Hr9+7E7d5LrDbdy615/3fs97rWTXjvttSe9dtZrV71M\
-Rj+z0ekf+I1OT/8qcH169eXSf+hHX9OOP5GHruOp63is355c055e086ubJ9f0Xp7RatzTfjGdnVle3XV3rn286n7dvJJODr/hHX3IW+vkQI9yHUPkv4d8boz3pbfuOk3OsPe8Rudqyg7FkqHIL3/ZiLrwVn02lWv\
-3SQbdon+E3fxf1sK/F4p8XulyO+VMr9XCl3X/sSPVi7gaXfgFHceBQrFZbEXIMh9gBIZtDttk467dKW7bP36xnIyjVWaZb/9P7DMz0g=\
-""")))
-ESP32ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNq1Wmt328YR/SsQZIuSIjdYEAQWTlNTTkLLcU79qhnZZU+NXQBxGkehZeZIcu3/3p3HYgcAmRx/6AdKeOxjdnbmzp1Z/Heyaa43k7uRmayuE+1+yeq6ze6trpUVN3DRu7FwY6FZeJOfwuWeu67cr4VGETyBUVP3\
-ri17jw/dnyyKNqvr0k3VpO42d79ZmC1JoNeMemnl/ue9EVbXFYyduZeapK/gWeKGbJKwnMTELYjgnhauKYyRwTggqeoNWFIzVbunSZADRm2Me1bDgvUvfKVh4q7ZfO6vzl0P37rKuq6kntW1UV4VEQsLOlTK3TVu\
-rbahZqWTU1WkFLn20glYufvE/UpoV0Jn99+1LbXQjdEr0C10nVLXTjvQVsu2MKhidZX8AyUpJ7otabstP+s62fSce8DURm5L+tCbyZYJYDUNm4icDHSp/XUBK3vAjWefuXSLS69EV1B6w2rAsZ3JKfff5jRcknx0\
-DTS9BLXXDb/Ug5XocnUhtVyuNgsym14z02/mevFm1AUvhvcgsfBGKIqVOjTCVkfsf62W/sZbXA88Q6MKSKW3lmc8pxo5546Ww9lRoiTqECAaAAP+tJeoM+gK1G+9s/HMiSW1BglSI1ZSCX/XA1nL9M3QsNDzlzfj\
-Rbk9cXvaprCuOIkiQoptC3POO5IcDcewMvL/BJkaK3RpPlO+0ex2zkABb/0P32TRAFRxXn0fxHGSTAkZWN4m6Aregg4RSC09R41nBeLlJcgU04ajA+EGEDiQY53B8PN5AKbbYVfEE+9NMBhMoMyclqvYPQEEYUQL\
-L9m//TP0R7ZZIyQxQsNCq78E+wB87MeA9OeBzt0qN8sPLDC6F8pXzdnrpiDflBCN3LC8Dy4aDzfohDBH2EfFmrKMY97vZLzpj+F7atGzqgkxEIlS0pgfuTY8cjEeuWtjF2TNycCStRyEB4fOOGD6BwPW3CbZtRxa\
-xt2UUTEV0TEN98rEQ+9HF2FRINyOHdB5aY0G6/an1n8Bw54TQnePgYzAmtxNvrdHc9aKjVeARpAbFGQGCkI7nH8L0s2/cTe2Ji2amoyy2xYVaEdPWz5+tvZV6E1mG20RSg2H+D6eo9kt3Q24Tx2z+gz0isEVcBz3\
-xwwG807Rk4flRapmhopH+7lDMwHpITXAjKiIYXixP6Ghu1mTzuphqjds/3uGgy9EzaQlo1VV+xL262R1YYK8CDezZy1F0l3GjFLoOWG1Ug+Qsbj1LL4Tq2PyU2fj/joXDoDUAOH9yXvysUYQBBCjLOdX1gdi3LvC\
-77zXOcxktzh0GHzbsMIuOJS6aaoqxDmdIix/4rucMFpa5s4J+BqDs4e5AMGeRBleTcV23LMDj7Kim+fh3I0N+LVrn7MWjPl8LcDi1xhY1i/gL6h3xuieStsZdy2ZgvzOr6FrgbYAWMdxxumsyfsMQqeLtwxiTFZh\
-LaD7it3GjoBhCbwMtZYG58P/+VvWhSGpe1yg5C0DSwa9K4Cz3BltEoa6lP0/0EWVPvLQeMXJB8LCR8oLYJkQgqxqH/g1HYBiCu8OBOSgydKO4cJtmoFNk9BVbtm8nknUzDN24MftQJX73TDynoD+NIfwnaGPyeqa\
-Eru2und2i3G9BcHdVV5tYVxW0IxKsTG2o/V8DTIgfsDg9pj5nmJLS0Mig9hC/HvsGrYVVC4VOVLKxCUQ1KMQATSsTbxitzTpHrcR1AaRu9kWSfaJh4xguCWLGnAH9VUwfAUOk57BG1ikPQUfOpSEFLxLH2mUKgP7\
-io+nyV9P2W/So/PyrMfkNEWKC4IuVcXMVGZD+Z7coa1DsU5PoNt59mQKnXKkmOcQYV89f7JanS58YiVJqt9frb8FtOGcEBP4W2ToCFlDy7PpgIhD3g+UEiFsygiY7gq7EqHt9894ddkz6DRDke++eAn/zrPkBezt\
-yy2JAlc8Hp+dPqT5Oa1f80zAfkGk7iYJBRSIcpS6SYafkL51L8WaC2JlRdnBhJvXPmXmAXWXOtTdmzehzUo0TzJRuqEczN9kzDGwxpGJco/nhF5usXZaJI9xi1KZj2+YOjTMKM49/Zi/PUbz0SlDgcpO+MpauvqB\
-/oFBzHgYyB5KStKuiRsmZCGOC553TOUH4r7AVABMOWeqy85tLmLAG0ifqkSUIUa+uefJBrAO5oC2C9dQ1kgfxUVKXhN8yFtoYh8Rfliw3b4R42hxKGH0kQ+1fEom0TawZqDS6viWiGJGXDMCoUR776kPmhz+XvmU\
-GtnTiDsqL86zII4oy00dyD+JA8wdMYtUJ1tomFBUT42mGZX7UtpOU1HMsVNcI/yxachU1RQ0NuUkl2OTFqmfnB72yRQCHWsazKezRlw3noYgza2Jg6BvW7rWHL0TkY/5Ndpi2xpx1566C3CQ5vhbYMGzL/o1TsCt\
-y1FFNOO1FSGS8dsbeBufsmZA8Qik9hCfgZjp09Xm5ukBWz9QOFtc0Ri4/pzH7fpPL/mCqiEwzDqOWigmJIf7/T06esqVWI/eNo6frjYSxk0aFK6NN3hu0fmEYbaGjolSxFIKT/wjDKlOmSWSjigKFUDD5ERm3T2v\
-MYxNvgH4sxAzGbAY6FKhES0onwxYLDTtlLmaFAACOWhKLxhvEtHWpl9i6brN76/fUSm4bdcYONnQ0XbSrjmYB/ZQVHmcCIrbIL64YYr2D4a5hGGS9XoDmv2R6rJIiqlU8dDbUxx0BURaeRaZE4Nz9gUbbC+Z/xUD\
-mKpKQQ4LuZ/+Tb950XvYhCdj44hFJO+NgZC2jCF+LA5Fdpgu3wAMpBWRIq0+bMEfTSCAGtPTBSkmSQ6YFM78WAvyYdrC6/1DQBldRKHubLIllo4RSgW0oxkfX3HRuOInhYiIGKwBu9XFKN045jy/hpVjes9JkLUx\
-OVpp+0cNVN5d0taBLBg+M8lkqD4BpBaWrlW7Sy9LKqJAfQT93naJd2hF+0BSTSC4KwaAQYFJLPNf46yKslE9XumSTKDlgrqu+hUZYbB+y/goqCplK6CexYIGxd2F9Ai0kGBm3ZnMQUiccBDlT0OmQF32A+r2USHp\
-6P+EAo+WO4O0u8WRVyDkNxGJhwGktwifr1VBhLLyIjwHVezTmxKtuhkCmk9JeB8q9mKW6HIkj/oMcRbEFR3OT700ej+6JoSGPLwZshJDtfsvBb3QQThdGtzuL254Onihp3ewwpJ7RgaZyZEYoEB72HTFKGh7xVpC\
-ERU5KPVHf0wEpmFZE2xAHb4MI5Y+ALTdYcwHIhFurguyd8zAUcySxpnw8YCPTzMfJTMZn9YYn/wrhOorTxeuItG9CL0S7hXK7FaWgJUQHGALIp/Nfw1kA0Zvm049oZCbJJ8wFOdcRMGTLz3cdX1FaSJZINLww/Mu\
-a1wYH9g5Lx7QEBk1ktz446f3cEAGdVgwHKu/kT7lZN5sr/Al+hPon9EZBvxnz1vPcNeX4vyHsUKLa6Yn16sNcRdUPR5IwQagBB134mM2zMCbwB/DEP3Oo37lcMo/aT/b3X41kRR6Iwq5zUBRebSllo8ljGyEkr29\
-/Tq01dkpBVwz/UjHRcgDG5+1fRUChvd1U5IxQsSsFcuXj+UDQLXKx5TDL66p2Ian7ybgAfhqrdZYBjtACS9FpaTWq4voBC6I9ffVeUFDgmTA+iyXo3ThT59zDoxte8ZAUbSiGihpj84PdkQEm+8xc7fezPRzhBrU\
-6B4ts21uWL82oDgQa398b+o+ntWsiIQJQgAut6K6i16wgmPy9tofPQELocOvHhiWr0kUTG0a9PkG3dy3AvJX/O05KwW8Oes0ABEX9JIhEuveeQ3PX+qfH8U0M6JQ7fbGG/LxJxg7JR9SHIhhiS2CxQ07VP5aZF1p\
-y3Cp95gBgm7TOJQ5lBYA2CHWDasdkLqndkU5wkRkgYUoKY3Yw+hrituYcq37D5t3/WL4GoknAY0pejmAm3oCQAhGlqeyGN14HlsjocdDVkHoyVZRXzAdnns1Ozg983o8gksxg3vsbzO8vSLjqztrnXKyk77jo0TI\
-pZU34ZaduBw58R5FTqwseE9uhsk5+XeUYT0i9ie55K37EVNITTt0sWZP5bKbrse4gZJO+cMKRdxv2AaUhcWPJuzsthDjd/B3trqc2Unjy687kkzI55HPGBMFbGlZOjtlbiDzkVKJOWZ+jj/Opd/9xjwfLQNpAPp7\
-bDlap3T4jU5SkCq0z4PtqfiExO+jEOmVr5oyfOsHXD0tiaw4AJ5Q3PbFOcHinm2rnRZcO01ZJawGrd6Od0jbu95vs/JH7H08BcgqXPqEofeIv6vCk4emU5TgRumlmISUBhU+dxl1OltiE0yqn/mc9bakieXiGItX\
-jz1DeEwH8IiM06N3JLbmsqamo/0DTGU3oaBAxZS7IQpWHP2aUlQxSPHPgsooPi5o6oqPExoOjJX6jl5AVQn05o/krE9+LYEMXmvprH/fFm4PcHuAN+l3/WTAGFqdKWFhPqXD+AaeUgHF1ZVIiysuaVkYDgK+//IB\
-1oBphRgVkQfwEquuFZXM8GMCOpC9JEF9VzBsSPu6w3M95hieW/Q8TCdDi5YMgsPxdIj3PqJbjqqWIotJ0ZQsHvzew0qm/7gDHHhKaWKdf5S2VBy9YG7cNkvK9MryEE488vtwGYtIlYczKAdFy/DBmVZ3doBeH56h\
-5cEWx1LHWx4CQQ5geDjl8iEeQFo6fLv151CrmnGbRsad/B9c6Bh9j9F9V+YPVbrq2yF7dcHMASqaVgbsrvDYnTVBj49kR/i25exdYeXyIGZ3yBkndn3Lkhzt+3mPkQb5gVsIyx2PTsQW1xZBsQxnhdjnDjffUuDo\
-Zqz9h2N+oXlviDgI1tfe5CTC72n//X5TXcJXtSopslnqVJq5N83F5vKme6hmOnEP62pT+c9vrTiPgTQBPlfFoyRgughyZv4T0TI6YcoJtPCmDG16bxrRBhaI/mrmVGTtbmCvw81MzA18lt9sRBvw3G5cxVEHb6Dq\
-uu3Nr0I+OMT4U2FnskMY50hoAHAPq6dm/mj74//jzW9y0eHxQ9q8nqQT3mlpGNM8mc2y7NP/AHBvDEs=\
-""")))
-ESP32S2ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNq1W+l31EYS/1fGw+GxCZtuSSO1WN4yDjwDIXnhCI7Jm7wgtaQlWdbPON7YZCF/+3ZdfUgyST7sh/Fo1FdVdR2/qm7/d/e8vzzfvbNod7eXyriPgs/r7aW2/scjehq6e+618q/LA/jacQ2t+wzbS6sW8AZmyVzb\
-0CSvV+5PsXCPdeE+bvYeOxnodAhtPLE17q+BSbQfu71sDNGHDa5rA+/UuZtFRYS3ywEWd2+ha+mmLmB6oFEnxNTUTXfurefIDbO33Iv+nnvdtMyxcVMY32ezCb0b19JLt0HRUJLK9rKFBWtYdMGUgui0Xtxgel17\
-7SjUTkrKfRvoXxKRtSOt0dzHjaprGOm+Xd/aRFJpzdZNXMPQnIZ6uUBfE/eFSTULquYPiEc7DmwNHekD7/wgmx3zCFi6jTcke8xd5hYAbnre/3gx3Ft5roCzh9x5/RdZt8h6Ew0FifcsBpzb6Zh237ak6ZT6wIpR\
-kdi7nhvNiBNTb09iKdfb80NSmKRbm3Zzo3gzuoqZ4T1QFloiQbFQU/X7drG5963aeA3Cbe0StcXpzkWM148e8Tp6Ym1X9BwrvFKfuVXhm7+ijxFCWHGdtEHSViyKF1SWJBgWztqIAe6F6m1GJNbZm7EOoZkfvZ/y\
-4sTvtm/IgJ2lAj8CbmDKDxrphHLUEXZTuvw50NTbSITtX6QvXf2YVRu9wRA+2FosZGN3RIbmC6DFDcrJAzCxfRAUtIIA1ZrEPBgWd1GhRzwDgpa0LBoKSp+cABnQI5h+s0m8j2xJ9EasBiaDBXS7IV41myF4Q/TH\
-0Mh2LO/Q7lhP24iSNhJvJNJ/BeWw/ai1yX4aCdxxeX70GxOMZoT0NRu2rhzoy8lzkbnVX4ApLse7cwoBB5gHNTeo7aZADjbgyempbBK96YUx78sdVx1x3cB3zorNEg2x6GvwDEhpRkLomxDU0MdlwRPDe00OBNtT\
-rdWRgmaRk89GEZLsvcGnxcQttWZKdt+PyYbx10mqY8tCTRZtVmJgMI1dB0ega2APAQMwZw9AHVaxeYFymD2D/hOAQLPcz9XdA1bsbO+4fpSoJprCbRCnwY1fEo+w6JhEa9/RLiJx7k+L8fS4eJrD0BIt5xgU+PsX\
-T7fbg0OJCyORi9Ia88AtVnJUA6031yl6gCPsExOSIOSdCwAWsBTLAke9yVhf9JzgOXAb++Vz5rF4DoPWSPKdl6/g67hQL2FzX42cH8oJ6b73wMO1ryLgpjB8gbL3FuPrBqjyOv8BIyqpR8bxM78NdHIsw0C5jsBY\
-zjtuxdoXzFw1Zc7oWyyVLMjcMKRLpGAiq8qnE/WMmDqLFJ3EXh9UML/JipSz5GEteytrIlgyo/U1Wwe2o8YhNgEHS8BzYKCGHcqJ17rP09Q0JW3MJpF+9MPwBoziAS3ficc0tBMCfNtxMG2nbEgoNgm8ff15tBoP\
-npGBCxwnrOroZyGQABHQVzyZUXugF0H1BkOoFxCdPBEG/OoeWSw9YSzMJSbOh2crFvQ9Q/wIMjhdccS1rktnUjWrRT72JxYSbs8HilUpgmgDGEXTjHxvPec3cQQvHZmtsndcgtQ0FB5TbNCKC6Zpm0jhmig2Xr0c\
-SXZ1K9mzCBow260ljUS4qb2QzgnPg9I0AY4q76DBjcKoevnY7zruMqokO3AM7jWFAWQG3BJIE4aCBTcDxMxmuSCmQSFgq4c68dxZ5DjY5JvICfbDVAeJeeG6YShjJ6rSzOEvr+DRsMSfZbRhMm3XJoKtg4fCVhsn\
-pdHHRMNlWmWmMSuaqhtj6Cqmn+i+k7GossA8PS8hDRshg8bjWaZgUHNg+O1zhMOwPWfs/Y2Vd8q+ILC8s0PLdbzCPKQ5JP1MxIFocPMAiNrct+xyixFIkqC3/kTQG+z3YbQPJxOiJnHzy+UGwd8RufyhW7LkcG+X\
-AEhxHvenHU0mUT6hh+nF4kc7u2u3OUCVIgYEJHYs/c2sAUdAAQymbYgUE7wc+W+bYKA+S+w3cotT24n0tJCADzhr0LzrtccBmOzrq/OlnqXdWIBpersNhPfZKFTPxPwmQrmo2GWqPHE7zlHMzPFJOHAYEAnnsgIT\
-jeicmolzkT9Sn9AFH+KUbOVOy7UJKCoA3ABvopvhFTMHSrNug5ahNq2fM3aYuhrUGrPhaKEfMkrPDh9E2siloXY9x0ke2MCkAkHh019ob/uofIKhot5cWMkH0NYqsVSxEVipmcNHfvK5aWPwSkUHjhUej2QY1z/y\
-L8Bw6z83MRGbmKFYQ8scNF3iG28EgJYOkwIgD2MnA4G8ZM7r7q9zDgyfYgp++hL+VrRVmNpksbpMh9ZcoPkPN8PQCvefQgYam2Olr9JCi8kO37L5cPkOla3hYM1ZesrIEVgGSi0LDhK/y7csi5ay9yBGMU4wbkhf\
-AQAO5UNKA3mes3jwb/TQZE/YgtoLrsJqhmRQLQUeIVO3engoDN0EqVSi/xRXQYy1nfrz15DXLeLY8nHGeD0XnQTjT7n2rh2XRLpI6JH1si5V89U0h+6/eXTwGMIZgeG3XDrONo/uohO5y+WebBOhdvOao5KSllB7\
-N5vNvVEpCSrpRm8YX5tofa02qTtkQM5PH8D7y3QmqlBh/UhtuNgNT5f09dTz9W3IX7Z+3iI6LxBXK2SKCI79wNNQH9sSPCRoYmiT8EenolDVxHGr43B2LOELlL0vBMsUp/xagT0R0lGPJeM1a5/7/t23MvEaS10L\
-34EmevtO5rPyZIo9fLr8VfqqCxlf/OqXp/D/xs9eMriGRE8MEyL5HnmHOKOc0eCebEqqgWCHqpBo2B8wzO6TU5b8mbzeI0AVta0bjna94NMOOkERAPOU/jVUztA7oGxfL0OSskfxFrPUCQCBmk8BWVe2WfIxkb2+\
-GY3O4/ALu5M9WcYZwg45Fiy4tXnk9ooqo1pcglCsT8ieEDdWr2LJUWVqGU4UEitG/DMcsHvqQOOBcr1/3dOMJGrCIVj07iB0d1LgDu6izWSP7oA0dziY9ESjPDfs3hTYBkacgRrGSXxt7zLa9pCvbaY6Aklp3Udi\
-4k/NuLI1n4ZlRmdXTFqHIpbKnoeKsok2ZgLU0BnvfaqRQkzarimBHJ0U5k+nqqOSgg/QKU7MBXWst37PEKacWQQz1OF5UIZ4NYccZxaEuXQ7V87i6kTy3m26WU8YycjqYfsg9NgclUySOqno6xyUMufowCHK8LnX\
-ePlB/x4Fpy7U4dqo9t8L+kDn2RH0oCopPRuO2ypKiYW5erLFO3jk8QwQy9DvPwCUu75FpqvLaZLMAsgI/TiniAegJfktLO7E2QF1Xj6MkoFuahg05B0n9lx9MSKL8f6YCWB+90ZQiEnOqispakgwzNmyeZlIV2rq\
-fsWiv1+dUM6AlHdPJ467IBmhM6lZD6qE1iLU4vjte3i7PAAFWLKZYCln9R5WxYYOINYzwm3aVhcw/ho8PsTH63jselNG52f8QEdtIObT5WKAw6pqdS3V7T3Gm1HdAv0ikGLKabHAZkuhI/bjTRGBUxYQufNQXyaP\
-To5YKMyXMakX2OlisbPBU/cFpJQXNKluZqtJN8jm4loNBMEkSjRZAg37YPmQmlEcjASvXeq+C/B1KJfkPKDbUPlCzueLBRzHlF8g0r85csSGygnsOFAWWSxGcRs9zqLtarvrs0YKkDTdZ380Hdb9MiUHxEjSMRw5\
-hJzDAcjHknUsg+wgT9EVC72kDZQCpkHVO+NEr4lSLS/Puo3weBVvRd2O0jaYWSJREH8dZc+mTRVFtcvxePT6Rxm5FFN+HlWusiPgZE0itQwPkrQSbf1v02TKKVQRqauNqEigm3hv0AHIqyfFMyChrSg27s4U9Euo\
-PaiblBFJkUGz5G1iYZfXVhBETLUI1yza4ohRQFDr/t+wzv4FX5BoOEWrAnTHbB6O7gyLdYZ9rrV1WHqEreUk16IXKmk3fanH3/o4ouMBIAf9QxHXAalGCHpkGWromZoQXmrRbiLbUJkSldyKRKNepHNE2K6hEgCu\
-ms/wqdoZPrEKaqZ8HrFf6A+50KHiAxhvLLJvvF9Nckxzm69NlIRXcJchN0YZlB9iJbkplQGeRxAQFujNtbPwKrIm7U8ddglW2HhXsNQPLrf64fL+gur9Wo85yC4IuaB3wdMtXPYFLgtRA9qCat34ZziT6WUyNhKo\
-hhjC/2cTGvSfpcGgEa3yQMXigpwZUNdHZSAsoOwckd1L6UQIM3WLm3rrPa8CDSa/jZUxrrjRJYWn6QRu18990Zf7cj2D6BMQhbtiYTt9XwhQdNC4ehWRJIFniK4Y4UFLjsvxmZymkyg+RFIXK0jxJA6uSQSKsRWH\
-QnxYRE1lbBqneAAlM1Q8SvGoUxKoVaxbVkcUo0bVqFFvEckYqbyzSGqP+9xsHVbwyldc+EKDSDZYbmTxoaUq0Q2tvoN5EBIeyq0My8dkTIj4wjgiKbnCMZhfAOnhieELWOV+MJgArQzfXxljTYMJRbAdhYeSwSAf\
-4n6/DFdZgAb0atEzI6XL7TmmxFp2Ri1gW5AOD+L4qK7OwoGrauMp0sHjcaYfL/kH/Zur+29340TonHlaz2SqAP4HvlzTCDZNwIJctcM0qLzLfdvigGJ3nX/cnnygs19UzyhGNrDVYtUtBwW4qNhxcIBa1ZgkMfAW\
-g8Rqj7W9potEpGwdJz9gFxq8rsI6pj+JdZjuZPEZPFCqtpg5qj3h6ibsl5X7ThXEhuKQM5gBy5t8qlcNcQ03FlB58wpPb6GK4BKvN6xY5sXlNTna3wFH27+XaoKoPmeDmBzbSJGkwtZKPdP7JqpN+GDUqX3Q91O+\
-bwl4gk6sx/6ufg3y/YFJQxPv0SKlY33xjxenfCxZeH6PKM1SBXpak6QN++RTavMT1ITkKoUj72QhugrEdRdSCSpZHUzIlugQ/bCJqqUoVr4Rqqudr0WaHE4ZMvgzY7lhV6Fwdx6P5EyXILxXQOEepudJyRaH278m\
-4wMRgWFtOPOzrJHxNWFAy+lFvf41Qlkipl0nSYejaBcYBDdQZgEqYD21l6yhw6wBbxJWmDhUQXMsZtzvAAr2p/NZA8eCLsO08Uf5WbAd0Ew74cTPss9gfJqDw5Pw/A1z77b36GcqC83n9x4NqrG176zoTY01p35c\
-dSHBwsFvgcW+pdxmFKNuWwhzUALB3Uc74JqIRUReXlGDyPkasb4+7nAYoomow1z0kQ19Gw55GrbXNpvNbYksVAtHNnWzLdkXph45w4SQ+0T3tppkIz6d6M/y9Y5vcFvRJIQRCBqWeLXuOSFjdLYVhRfDhBtE2JGp\
-y5aKKlxjKWQ7XL3MQDexSFQyLCjQs+9SaAUY3SdXTXQ7d/mu4sO+jMXFIvJ5xTjk2zviBIr6O5xgP4dlKpdSYajeY8Cg+pnRJR/jT8UcITBAbJ4OEjnUqdzjwkv2CLtAnQ2kSoZ8I8ac9eE+lzSxkA9prT6hGIo+\
-ON+jGN9LsoQyh00wN1HPz/mATe7i2Tsh0DYcYPt0k3rO+Vi2EoLxun3HFTUerbg42nPO3XV8QYsTakq2r9MRhSwRJ314UaQbFaWBdKrywvoIlTjUN2KzeCMfOJR8sOXbA01zAcMOgrMF79L68jqAC7lDLPeeTDQr\
-ejm5AwWBEVjD6z9U4TsjWmWoP6eRCzAm8CdiFhwT2euNNB4Iex6xIJHjWKNC8bfmNAUvlmSoVhZvAtzD+qXckS65gA+nnqVc0RPVqvbgELt8IXp8xLc/itWarbwuIthuS7kotLrGKXGdB8P8KiqtTeu2dIdtvNEy\
-Ng83HfGWeNLt8FAIXKG8M9KIKHI+jpb27po5n18RtiA+mxBcUv4jGLUQpz51/ayWkq+vN67YC1QMa8Ar2yyt5Ui6xLegYcQHUjRsHbhAoDGzglqtNmkxY/Z6mtq7JuvuIzqTiQdIVsP/e0U60Fn0s3W4wI5jGCCq\
-cnopzq/YyT9oCKNlMsUyunaXSG73swX+G9qPv5w3Z/DPaFpVea3WZVm4lv7k/Oy9f1lVunQvu+a8wf9aC8fLTyilwAN08Dn+B5BU09E6X1+i173vE7+26+hHR+gWfjzj4gMOrf1rOAfhGlC2uYhfq+gH6h9Neh7N\
-o0Of+DUEdqZs34+7kkbwwZ5XDL70o6LjMXwNVlfL7QL8V4RayNRXtfwff3RFxG3SAn5xjupd3vNERcosUzr7+D/q87Mo\
-""")))
-ESP32S3ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNqtXHt300iW/yq2miR2CNMqyZZKLLNtNxDI9MzZ8EoH2jtEKkkd+vTkQMZzEhjozz66r3pISljO2T9M5FI9b93n717z771tc73duz+p9jbXarG51vHmOk7Pun9i++Wv9M2UP3QPrk+25l5qc91W3aftvpujrmM8\
-oTdF0f3VXUNGA6HNjtA0wnYuNXXGlzm9LKE93naN/LKJ6W8cT7seWW8K7JVsuqM00LebSNVdl9itHNvx8OmOqYz/xfbiw8EiJlgEV1i7A3PzDA446R6L7phFN6SBTg2e8dA7vNGyTTV2dE1d7bEbf7tV1OLxcFoN\
-Z1/A9LBHFWymoG79s7eLu12X6offu8krvk4t14mf1cr1LuEQ0q3VNFSuvIIFC1h0wjsF0ik12SnoaEW3PVV2zxlfKF9V0e2rVNyHOUTBc9e30B5JKr3pZi1gaNrjBeir/b4wqWIqFfwB2ijYfgEd6QNtdpBJTnkE\
-LF35t5EccZexBeA0Tcmn8RbTLC/4nMPJnnDn5Tce3eDRS28okLthMuDc3d2onOUKpow/M1fkRPa64Ze6dxJdbC58Kheb7SFxS9CtCrt1o/gyahZMuYPYwBuPUEzUkPde4uuzl75o8eXWQxHeCjHvnDzl1aBn+X/p\
-OZT3gwkLdxy7J18ZyHaYgzvKL0Xqp27Z2LAqs8snlXcM7jWq2IrkvM9PKO8nH0fVV3eVbQKHimJQKKAPRrVYvBrsHPmFFZPKfnN7aoxHyOob99dfvdHCWCuUU/nCom4VPF+tr8NQ22b8Mf5hzl4+dESGv8jGsJcl\
-iQm06RoO0NTEsRqYsCyegSit4esUORV716iHDrp/+O4MTG1+4q0l/a0dP4Ljv0nfRF1rRqbQ1LyjEV2qFjPvCoBpksktxw5GvwfrADwD5lQLU1YGRA5p2ikAeszK4II7oW5amN1q325YTSqghL8pb6Hsb+FvOCFQ\
-NSFmaEpnhlAxJU59Qrsiqcf3IXulHiclnmZOejaNxLPEp8lAl1R6uO2mGVKujO90L9PBBWxI8sk4tXzN+OrcWrfAPzFOjFUBZ34KL+HEZg0MNPMFGZhIzzVqQrDnZbSfxg/WxVNrySI6WoyaM4WHCIRoCb6HSlEx\
-dX2rtn+iQ+nev1ia9h7ck0bu5xXMMjx727oPzrIQBgLDY8WS9DI9xvxo5RNoja7D7CHoCdBlJDVixEkGSIsQTdAzMqTcUCYWcNKSv2n9nWMv0shoEbu7K9LJahvMzOox4KomZnVbl0xdMUkqS4AmJayATILaa7XP\
-G2YvCLYze0A9SjVkIxyph+2NbByXY61TWr0C6kq3K2JNp4TAeaDbqZEAv8zXczWfzqHPnPgaFizy8Y0Ui5H2zB3ZemDwWUxpUF2NalMQ62wSjNubFTRE1+Pr14tbCAE3eMOxD5hU5heW22Rezp8drY/U0fQIOh65\
-s+t0fG2txiTCsxqmGA6Ui+mIdCnHnMl+i1XEfpSnskDbSzQjbYUnkEUcEQdiYxMYxOgdev5v+sZZ7H3PXJ9cMz8bp2NXpA91CgJWwlomnj+ELZdlNP+ur80Cw/muf/4D9qIzX8s5gpUDHfNVUyoG1DG6JgMKVCqm\
-bEJ134T6jA9sUvEzyroClTy88Tf9RjCxZGydoa3aMQMb2MA1hSpte7o4TuFIGZyvOoWOb14cbzZrj488c4lq7Lxbr8xIW8SL8zu/ko/XtH5XYwK/6dknHAnzP0fFztroscQ0jwdkP96SJkUnPz6+hkNedadL2XNk\
-U1cJ9WvvYhvmLWjL+326DdTLQGs2Evzdf3V8uiZ1f+i2SfGN7ITj8IElZ+uNzp66JN8ee1U0gqKbbWdayhxE6T1duY5/LiC47r6alC7SaXeJRLX60w1KbumddIwayh02dAQECTB/EdO4iGDQcgaXdD+ao1e2YGkL\
-veYNkdXzmVERjTgcGs2NsqENXKjR5EA4CzcHwyYrBFPqb5iyvnFKdAdJ/zQ/PLXwy7F9Wu3iaRa7bOTreNeTls+0QCmOMoSM6T0PVzFZyCxoyFPejnFepY/FDFR5SxQUz8+qRN27Oe15piNmoWGooK5xXxe+igPN\
-k+6yNkuZa9Ag3U1Kz7SPXGSh3RHI9GNQDhaE4JaWEQrs0EeSyuRhCGHRvTzykbDEfpnterzlYUbIzHKRmhmdSVT1w8Zq3PAhLtRDdEAyMYQaiQFLz0kHT7Iqw5hHrkibp6Mxb19LxKIW94Uygda3yM7N8Q6S6OlN\
-O25kDYxRKnPfeqfOW9eOPUGSqqfgaaSK4yg4VJk6uTKKDH8JI9PooSgQ8ENBy5d4hHaFooF3vGDZy95xvB1QIBMQj62vFasbOM8zP3y/gKUZBHTQu3lAD+h1czAAOhdOGaBIyQtm8byg1TVtHM4biWmHy+P9Wx0J\
-hq4sPR5KAh2N6jV6MXZXcjlyyz3tno8hAlb/eWMC1cPRhcwJrmzIeKzvbQdzGOLF1t/xZpCZYz20it5U9Q3xq6+67yesET0HHLWaxCBV1N9xJQolIZs3gtBsBFxeTdiVObctW/uUTae0WM32eTyA7/t/z8ijA/2L\
-bLBYPWKvLRHNvnpoWGEuejBBQpqh0P7dlplnGtTQzxRFMGqUW3N/ZK3eqZpBPPKXaIUexAnDm0BnJDxySPel8lip6k83YmqlLxJ3wGYcYpM1yuR46E2Y4RVqLcZVM5aMXwprc4vYNo9q4Vo76dclX1S6lgAeFZpi\
-JS2G4RalKlBJd0HbsAVHjAR1wYwjlje2MwUiUqee9tVEFMKKDmg9BHVS+uAeNKmcIvFMsrmBhVXIVmO3SDdx5lmMaUVaDt40IAUY/Jftawclqvy5YDKVMMoxXMRkdQX9n7O9D7UBKrQn3QXkxDgm+9GjLfuj1YgH\
-ZLLvHfwLV9g2x/8k3deJIAEuV6bn0XsCiCp6YDCK5e1CWNa3esas9cVrSNBuf4Fvh+Rm+vMFvCrZhYq3W9ZBxAC4Td7zDnAY2185pcLc0ARChmxyExzzKfr0CiiyJHNtQ6acyac5nk/cnSuGKxsvbyKODLzDcIXz\
-Af+iaYo8Jw4FWjY9FF8nh7+zkWDZhp0D8UrBIQZh9QlocaRR4rQU/s1+55NXpLECElVMdmA12AZcQ5s9IWXO0OslgxEFjP9EDzYLpaorTvchJT+T8wDgEoTvRgH7wqSFR0ed7BJhjEcwIRQgsDlDsGyi4S70qPat\
-WA58p0fHNzo9rEFE842r48Z5xeGw3FM8fVG1iOTQt/yfp+sj2q2WTG6p7sM2jsnK2ebKfdlnqw1xQLXw+rSGcp2suOMcVD3C9OYMIMYEGvDVEp6sMtVn0HuK/dhK4VjlEunH0uZyH2d6xesW5oDXDfBdwH8IHcJZ\
-V0FuiwcofvrMoQEeo+UQjT869l6CReMv1/bppSXoqQtzNnaNhZcob+Nwl5ZmGzty6yH0eHyKv689U1qxha13rVPU8qvGZUMY4V69ZK167N64MAh4bI5PdwCYptd6JrMtbEdG5uPFCtOoApK3Hl6u7QKooDPnBVCX\
-323XQqD1mQe9126QaHE1paiEmfsiKj03ZvkVYSqNg+LRjVgogQem8rAmQfVC2LkL6NGuudZF2OcZZnspqUQPpTwEBQXLoAQi+8wpdgyJ1SqdBJ2zYI2lb/pBqyU/RUyjhCPmUvMWCM78UUx5zvkqZ4dMLHT8idSV\
-UaueyjWppGjUCO5FcC+oJABgCAlW+9+F1RNrsgwdif8L+h0FMRStgi4lZWwkSxIvp6SVwS+HC4e6AsRItKQY7nIOoKYX7tbXlNaXdH9RW1iZYArGnxxCUTjnbsxBESXasmEjLGRn2LHicg1U2NpLhSx58uQGz5Kt\
-gapvfz8EqNdcNdErnzmOJn1G1YLahl5S7RzrolyTWPjEgiPpcgDp1JyrNZKrLQeGbEr2kBjskaMiz8J84NPUL7OQT+VlQDrXCPMCb/ji9Qg1yKA+dwzrk+VgczFGGcVbGUswDXz96ccBuRMCQwAeArKZBeZRED1N\
-XJ5PLRhf0KJMKvYBzA2o4ADG+l/JaeJVlQHwGT3iFJBYF0w9iUefvFtDJhcFrijfwYVBjr9kf6ZkVLtFCnfR5cX82TBTUbR+psJl6n+jfbh9QmpJAQ3MOawK7lp+drb9VZLVEDguH3jbW16JUgO6LNec2au725pM\
-ttEjSRmQm4wsqF4L4Hc5Rr5f+nsCp+/Ec4pqB9Hi34rmJpx/xXAHxw2YA1Nn5JbyNi/k5MHSipMrAKvU6d1Q7JhlnosFPz5mgAn0AyINI4pGUmlPeom9pqcm0P39wJBRyX69ejtGm7/3Gz/8KO6wK8sBxyX/TMpY\
-x69YaQw39prdZHU6ttTP/UbHNSeDXYC70TZrxvZMKLtAqYqKNZBJ8mCnC4f/c+tHaI3Wi4hJi7c2+wjplmgN+jh5xuGKySGqTe7A4xN8nGI8MZWh6SU/UC0R0PZ9NAHLqpLZTqgK5lQsqUeiTmWi6JkLkVgBF14k\
-xKQgU9wHT61JE1gqjfxtEXN2vX+aTAnqbVsoemoXT2gM5uOHWCRZX0mwSwdMV1tHochHQgwJsOGoFKV4pO4oudmDsLHNInZTCSFRjBOZ5PtOsrudIUqAod8OMQHqxbZ9j2ASq1ekTOLBTKhYG5yhk+A94BzCHQ7F\
-k/5Am7lxokuYJH7/HvfwM1WHYGhYYDhwJGwWOYoBGVC7Jtw1Z0ZrkLkuOUrLg/uNvfgt75FQggrXXTdBy45rQWVcWeYQGgSjseymPYlAAR2uPOclOQHTU9AYtAIVI4xl7RlBPQzUO3EHYMB5iJNgc63jARMHC27z\
-my2rLUUCi18jur5LijMQZGasTrJ2rpfvQWQnDtavFifMd45Vm/+GtT5F4s+QZ0yJxDVAA2ASEOSBSiXEd9lYai7I0SrqGw5bZ8R53bZfeWRhXTVUy0oQk4b2QkmO90xMMS1cf1rmDoaizMUJeznmkAKpNWdajWBV\
-hPj7JykYakR/Mh1aQXSyUk5tttolG9FglFchfq+lXHbkXAbP1RGjbkOU081oD3qlqb9mnHTNga+55T4aPgXeYT3AW/u34jd6FTrL8c233qXUSXApJ2iHauJqXXm5H6cMhF0ThnT8DFEO7k1+KKDkLoEicE9x9ocv\
-I/zGTpJIvTaERHrHGbpAVUvdT7eRPQaPM3Lk7czoqC3ewi08njgvLzyD4FWl20FRyQ5e8Q4KyA2ji8IStpAK7CkDr6wXdXroai+8TSy+YROHgp/Mlm4Pk2vijMFOFIftRrmSArhhuzVdAAxXJ3cvK6f8EcNK7yEX\
-ZuyLS/FS5U2U431sbVYDxOKKdQqrf4KSrnfIvBqgTOxZC7BHBdqkaO7cu5gzXWhkW1sw/gkwMBYBTVJEYCWCjjTbHlczi/1filsi1VkiclpP5BV6nlcs3PHVxBueu1Exj5L1LPhOh1He1sGQFqi5/+Fh6aAhjKWT\
-yybG8ZcN+7gInWJ9vu4zgb4ih4XY8FfkgFNbWHpYefGM5/2JmfCtcpxx51b/CxQIwKPAR0Y/9uVKq09DrUD88wVLJOGUyBrZL4HAPkI2PRGeeUuzaHlgR/B6s5VKOo3EjydAeVzaeqf4K4A3Lu8YV/74cGQ46KS/\
-2G2dn9/cebPnh8JbiZr6ZHE1kQjTLQa60Ls9nf0ZOz5ak+Y0SzQyfsZfI/BbUtBjhdrgA/ohL4d7MCjSmMeHh+Xs4Jr4QapmWebfI/q/i3u59PCKzk24mMzggYoVQzpduDotw6G8ip8UBG8BN+do31q6/D+89Ifv\
-HOps9wbdbrIpAgffM7foV6AzqBBlCrVdzUcHFYkqVrUErfsej+Rc/OIVdDjdQ8E6mx8A8bkOynDlpgZkkSrSA5WmEeS/A8t8IZoDvaQLLJH/+QUlBRosJ7SnBvcQtra4x7mgIPO/zzpNnwNGiefNcY/bCWWwTbz/\
-GWZP6KvKzsmj68K/i490SpO99XwLyMJhBlkzPyA9k8j5DEp7essqGqTvlExHQG0ust7zQJn8sBe5+Rc9+JEWmOTn4j0E7c3y2SDLd4zuOanxKg7CJYhhckLt2yxha4gAbSOufo3hDpaO5y7gIRZF7Lr5wKmE+pbg\
-6ZKrORKMdN/K18UVa23kvyk7vhV6T7Pl6U5wDnYCuqu8OPmNnO1x/EHkXGpyQ8H+wD5zzZELP1tdxfk3FHmomFwsRd1gjTJqMWivIM4F662l+hGyVdBgEucv9V1I3HHq3ExM+484y6UUh8SiTIYGxUZEXLmLzpRx\
-474Ws+MhWJYrxn8S/sVCUFqiWm+BpSxwO1DhlYzUffJXXCpiEilOQLcgMvRzASQQqoycYGAtv0ow67EoSO47cFhjKaGjm0Q+2+PoM2Pb4VrZooNmb4JIumHUy/4aq+R9Ga+qRShmywV7F6rN/edS8vr6Z6h5zvdf\
-vYY/pzmlROYct9ajUceVzwuW7J5XlVx6m6ArOE3xcWLJfPIY899QjMy+5J7vZxaHB1yXVHH8hvvRdF1o8pZzEpcylt9vsopXXGzTScGWXWupKYW6ImtvS7G3YQ1HKXWoYm8VCTPGzYwR42/WloSUQhu8q7l0RWoe\
-CGZ4QJoOMYNAFVQjN4MZTEL4EdhWvSADxRl/T7lrfwjAeDJsBgLXki/eMhpsHSFbhGsrm3uTgkYng4aj6TrmykZgdsCDsT6OilguacMytDT7rmbnFo8mlAUzkIWp9BeaF57v3jNE4PMUjFxTsRMyl8FCjbcIyr5i\
-rCrjasAa8ouOufI5FCtmkKdtTkhGdDtL3Y+XdBt55jOTAr3ZzgkFytqDWyIPNBxiz3SUgQRKjqzfni3I1tBWaq6sk6Um3lKe0tbJcKbGt3fZn1hrDKoK7W9npRzDYqMzlumca5bBDzG+x5AJgi8+G6Z/PxPHuOrC\
-Xa4UyncjVgjZmM70CjFj+EULrQs1wiaSiVtwB8LcWCQVnqA9isL9ZAbHsEcWZ8PyT7tiLb+PlYNmwRSRV2MaUG/vYIL/18Hbf27LS/gfD1Sc52lexHnSvWkutpcfpVGrPIu7xrrclvRfI7iyhr8DM+VQtqjbfPUE\
-cj5Q0FHV1PCC/rgG2ka3ygo0mZLaEXh6JQ1YDFznK/6VTtf3gF6t6Bu3dw3n/YYprfLHzcsW1LBP++ZfdUANy6XsHcnbLX+v3/D/87TP69kGQGjSYAP8y8WiHZb8BrkILumX/v4vGEY//f7ZV/rHfv/pWAfvp3bK\
-m7k239A5/lpnf8/9qr2RmSczN6eKff27x0zs83yc5EWWZ1/+A0uXT/8=\
-""")))
-ESP32C3ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNq9Wgtz1EYS/ivGTiCQVG60q9ckwV5jrxcbTCAFcUGWi6UZieAEH3aWYCrsf7/5uns0I+FdKnVVVymylubRPT3dX7/0961Fc7W49d1GfWt3fpUkm/Mrk950/xvNr1Tuft2/uijcQ3qK8Vmx716WO/MrW7o/aoym\
-fnSMP+SfcjPMZH6lk/lVWfNv4/apR5NNt4Ue7Tt6CoOOUulml6WbnWBJMn43v2ozN9zysHbrrAUpXpIk8jf+qdNHzGbpyFfa/dLbI7BZHBKzOE/1E04mh2pwTCObELenyxd0gIX7j5g36iFeuKc23ZlfOubdy3Y0\
-qfe3HJkSi5J7bns72sehDjcdQZVVg/M4nm75Ha851tK9dTs1jvNEu31aN2LcEepWpFnwUuV41akTWAUChXtKnPSbjEfLbIb/QQrgDfNp5MOzwI3KZoZF0+S0anGAZ8uiU2rZzb3Hyz35Ws0vd7E9WMj4DhUmakdU\
-u5cm4VNBlnosAnaLwKT70wqTuuSptG8WjuUZ9EutW7p8JsRscf1iMBWW1sU7iG1nlzUDO5E0MLHyalztmKlQJpV+T0tkdjHDHbohqJBXrJKfbT7jh979eXaTXNTF2wtp9BYUXNjnm97iaZW/UGxcyMY6eeX5ENIp\
-hNc4aiTsgv8gq+NrEXYrLMQRYSDEex54r4tcjrjisPSQH7iHHORarxpbvI+hfUShrH/AsZjCDR5p9QkrME4P6bSGjLxn3bKljbdshE827MLZCczw4wNHwzJk0G5tUawY8JvLtXu0sqBS+/22IqGMisiiStGqMX73\
-lmJ75QkxDzlPAx1oTal7JxoS1TtLIc0UJhEPnlJ4Tsye29ny7kNhBRwuGLLo4rXYIyPPEdkY37kWmh07BN9mfk7Ak04LLbZgZwGjeRv3m+wb6Dixhh1SwBnkXDLNOmWMchAB6hl00OwXTIuQRfGu0EHj7VUDL2US\
-iVsQu81FosrZUonDFzdFJuRPoJZiTbq8R7eyOxPnwSgGiL5q9MQr/tZXX4hTMCyt4GBw5YcDL+PdR+QGvizEC5hm549wHpUJIGs5lCn5GYpbqg33oDwgY/Y04GM9mrHwyH6LjW1xULqIVWAm/iefXEMUsAn50Klo\
-y+kqTsSc7DgT8PeOqueQdoPbNB5MvPZ67Cm9GmWzLd65KQJvUG4Tozkd+xV8WMHuFMZkZKSFJ7bfsVAgJfzWpHHuHybXWzzABrNbwAfGMP+YHcTQPPwd0t2tthDy+RidSXjAN37EHNK16aE5OGrtmDklsG54ABbG\
-1nYbMlU3WcGT8XP21iQgc988Y5Xgx33zbxYCnGWd3SV4uD+5CcwFI+yjVupWkwwcDg4N6fMpJySbOS2cTxjj3F5zYnS+z5s7/ZmzfEQdXKyCkMVFKz3VeJ29QcgxgLRVykaRHeQJhAQZsu3RxPGaUNyQ8R9KrQNM\
-k+G+EX5o+KPIt3UYPd+TAAUz1Uymj7zVQAIErQcUC1QX7u/6CVsNqSdmZICY8pHsnXfRyVULxtrlX2GkzXcueLXVgk2GL+pagPZH+bDDT05vL6fx3ER8MsvvlYRqeGF6GxBab/I9kVqmq2UPDITGVZZC0kh2Ph7x\
-/q30BptH4JJG4xn/bcSfU9wyhoPPGaVVFJNxrGZYdW0a7VgILo/NO0E79QaxDoVFMnFFxD9QiH64i4CkChFuHPdNi/BsKA70Mn/eD5w5SKTYuuat2uYiWmxpnEPXFbnPHb6OWoRXEzuG71avP54YiBcCBZ7p8Q6A\
-GgSzCxCqHwlYWqhw9hp/LcCGBU5ppCzZz4yrxJAEnqUgVluxpHXSYfiCzy54QGkCBYOyivEcx9JAouzbdfo24fX9nf2OKjsLsSdtX8124aZT9grvRH0y1jWwqmP7ji6CxrWEGQLOupAovksBBosBzh3pbt6dz2NX\
-ksGVmoT8NTk8wrE6iLKtJmdAy2r/CGhZHd5xt6Gro/lllN5VlAOZP3Fwb1KvH4mJwNlnR+sgXt6Nr0H5xva2ubluG1yRegR/RCqa7j5heGTRgkr+LLKKLu/CuWxyIZrn7usRJPgT4g6nb3b8b1Y2SsjaTbgux4at\
-jwCOLlG2sChjETHXZ9DUc6/H74MYe3BebItCGlFIuuNtn7NKGNB2rvlblivyFPrNOfI32ThSBcXe1YcNXUkA9qu214u/kSSgzF4ZoMOJF5FdfpBKAEUIPcUVADVVbF1jntj4ssNqqqdYvvxbKJnvWe1pdyOZjY7k\
-JtSG1NlMaibSiLa7OF628QZDhtE9/3RsPh7PF4Y9X4UtxqgnwL6RGZI6Z2LaADEEoLUuNlkVsTFlHWtVkdKREUdH9Is8tkVIi5Faoswq3SU23uO1IKuuJhJ8sTX9DFzq0X70GdrQlMiUnnFiCVUwtH7/w0uc6tjR\
-p7ulOFfV65WEDD1dSiA3niZiobksS34wPwazgqtpRhy0tBTgDfP6QuQSI7Pokq2kTAABVGIL7DX4zqDd5MwQT2ecPupkJsk3XqTiuSP0jQgP0fj/jb6nIHNxV8C3GT+5+0wPbZZtuUmGNr79Gatq808g/PHZUwj1\
-6RGigur5nRdQshfz818w+ODsIQYfHh1j8Ph2FReTTnYPwcdFuLu2yyqmgswNX6Q1UtioGBQoh20Yue2IY6Xu74pCDlqLOY2oJpQJa5uKD9ZgPN/mSSvVHZW32sVPiAJtVMikkNjl5/txTB3VZLss2Txcvg9Y0xY7\
-kjxw4iaBBmEakg0KhY1Xmgl7hpXXgSKRy4BYb3Ud9kq8OgkXKtE3AnZz4fYUMa0tH/sCFb0/D6xiD9JRqRckwcAWWxteawpJL8rWl0TzftgKE0tGgQgtq8O2/u4NEdflXlTNKFWcZ4wHFGoJygdVt6DPoYZXUxHN\
-r/fCSSSwHnOwCMG1ze73GJn+BiO90NVY6ilFFP9LZe/GK/K1kEXb1QKxZTmRevgg429oqvbcfyC2n+T9ejit0JQ9GnqHNE91VS5zOgXxkqGgzKbT6Xrfa1thK0OdXCUHoXDLePq5DRo16EzIdfCmAVFWp9hqfUWl\
-9XfJJTzzK1WeMskda8nRJdhCauC1u0ym610KDmqodhvXLwDofrtOVSiubHc7YYVyGoFRnA1wje2Id7s8Wx95lo1YTi0uFwUTXUkXpZDCRsnuFHdF7+vwvqQakQO/hdR0IW9IhpoDY0nba+41YCqoNTIO9Y3nK8LK\
-Y2pRJL40/IQehW+V38ajbkNNiol8HwrqpvhaCjeS1PpE3imH4cw2XotTlrUHpL1thusqQ/CSTO9D+E/yf0bmFVLAwizE8tJhx6K16TB5bbLoFQWlwH/iRCe7fO0r7IRshSKC6RpPYZPQKZvPZ4NMYNQHZ6dvc7q6\
-hSin9lfHV3UszPTv19FAN6nx3SWKJQ/EtzVdCfhhcEdUJ2v5CFX5wSv+exEctcEOBAJL3gMRVV38xZh6HmIa8hBo6dRdzrsnPBSDuojkDq0vcdCdEZnX7KdbE7tEyS5irkpLx2KWzlcxdIDLvY6bpCvejaJ2WtJZ\
-AHzWvo8zEo44LtJn+XEedJJ6hu/SdxzwkVRddOuD31TaU9kP/o3hN7VNn+cSQTZ8CU01tNTDmaGu08iZLOb+xSfHxFYAzpe1WSJ3adqpn9a5vLKKUnzyh0kIdTW6H+XIF873cTa3uo6buj6bIPxFFKFnbwUOIRwn\
-F8OI6S2aYmjFUcoQ7GpfWScb09BXONJE3f3BC88y5muuGw12ORVSPtDCVoRT0h2ANlP623NRb8epL8jfxh83CM+ywDKzhAusbbCrygRYoueU++x8kFec1JHRCfxQl6pgblrxrCXUpKWy5B+bHG+RezHLpQ/7zeSY\
-A9YaCq6lkEs6Se7pjzBRLJkIA7XtxzCGFriRsv5qWfyO2jjAG1UzLrl9ds0Z1iRnvMYmUqZbt6ZSr5+Ajk8q0THn4PKG5Emlh6lmAEi+HU3BtEXPif6i7hPdE1ZrWd36rw2ycDVKnvnqXo642THcYBQ26HrNtUg+\
-oUJEJZjQeBIPxN339g+3Ddtuqb23glQavJ0n5RyVOWOloXqMd/l15ByvpxuXEUeBCXi/Vm+x8rI4t76Qyo1v/XmfwcNCtqtnDPyxiUKrcD2Czq13deo+eJwFlCeBNOYgoDfj2y+x934Q+aOhC+cZv2MGvoMoXvJr\
-3uVvkfxgTSNCwaU2aeA58V84QACZeKqmU5cDyTsS8caFtMcaDpMoIeqJjE0Yz9agaYtuuJefE4V07HjuEiSrXtQzimK7OrpbL/VExvP44vOgNOsVfp1RPke92QQ0lHZ07b0XqaxlmKY4PihxFaIK+r5EwpirOt1r\
-3kvnkZo8lLU2jBP4HXKHNrahdvZMXMhwBc0gg9n7dLCV5Tb9lRrXkv8BPu0aJ2DUicTlNqiuV19fzFHiYaHE1sxCjkiBfd1p6/Il1rxnGLL6/v4quhM4tHL/KRWHJ/4wJuS93C6/Byoz4aldRr2vRpRqJKqJhhX0\
-yvpPk3BJkG6d9TGnYBZs82mEzbpGurV1x6ebW1+xP1bqmBWiHH/pi3MeAqj3n3GNlWrSAbZRTzVfiiqN57cOqYnbiohzL/JY3vKxBNnw+KtDn0odEJD4KByRdu0Nlns+r/v35r9tsAqHqbrDWM6iET2PBxZPdfpE\
-cnv/kYPKDlgCdXujJ0nJgix9hPSF8JlII7rrWhPCOA4WQp9+x2mIfOiSxj2hbYijg1bqgRcsBbIIgJLBoFbRyq6+v0FfepW+WGRCkCvNN93IRxHi80z6fZy/US61CQov2T1fr9Mb90J0RJUj6h+m1H+hMHhTnLtU\
-wenLAQLGCYo6aSKZd79Nrx2Q/kLWfR6cGRTI5O+4gGxKrC/zKOvy/vp6Prevb9VTqRC5GX0U2fiPGg1fqEWxrO5qMrsykq5GFqXuapLpookyuuwiktIghvwcThv1be+rSijfg6jZriKzJHGcSGhO6Uvhv+eRT7S6\
-HnpcaBpLaoOX9IGL+KXVruNfUZ1aba+aefq1aGX6P/qwWAXa4k3Y0WSfKq2AdKQSlQAmFIe+XEgY4f22FQBWHXI5NQ7gjLrLyLrKQISWTw2S2GCc8uwKYFuPHvRB6ANJYkqpAvqaujdkr5IIJOoQhF2KRVpKUe6H\
-O2zMZFu6kvisVcI7mGDLAcrl/Xswne9YdePgsK43Z6P78gERVbuoUZJ95DCpy+MrUSkpfQXFlux9pTV8MyyGUo2q8B35kyjYKTnFE124FPFaFibXjLelwD462WLjaWQRNSeRqKI2n0nhFjrflUiLcAotauDxoKII\
-X0vKptQLSQdJTj92n+++oRULFiIhA/ppiD6a8Y9vcUzDUYeq4+bMWwE9SSXLjIx32X0DKp9oddVfKy5Xe8Uy0twSJ0+KpKQoboQTinUl7tRRZ9Q7jkqHyDX2/rRZHtb1lL/9FMRWg5R8+hxjtV6nGIh0Xkdf90bZ\
-dCNVSHJuZV9hQ7NjPfIwGPLK/0i0PuKUtbJM1m/btNwea/PHLXpT+dMD9Kby5zfRm8pfAGfhjPIHLbpT+cMD3FB+PF907alb32zQ9/q//rmoLvHVfqKKIk2SMlVupDlfXH7oXo6zMnUvbbWo6PN+CG4iCuDEeE6f\
-29P9lpPf+IearXhPQOb+esw/l/MF3rYjniaDH/lpkwdr1Xt0l0wUmuspkYuiAQcnbsEGP1Ql/6I/qZp4HVWPLktp9GIMl0jf2Nuq9+If//yMfcNuZZ/MLZFhLHKV5KlO8uV/AaGtV00=\
-""")))
-ESP32C6ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNq9Wmt31EYS/SvGQyCwOaRbbwUwY5jxGIMJZHE4kCEgtSQHb/BiZxzMCfPft29VtdSSPePds3v2gz16dHdVV1fdeumvm4v6fHHzh43y5vb8XOvN+bmJbth/wfxcJfbX/pXp/Lyxf0q9x5AZLqP5eRaN5+dVZseU\
-MiZyY0IeQX/KDjJ2ZK7tlJJ/azu6DMabE3sbTCxhhZeWZGZHZ5kdrTFFh2d21di+bvh1budVFVPDFK3lmrl7xvxmlnyR2196umcf2qsFMYydFT9hj7K9Ghs2sgrzv3xDO1hgCrg36ikeLGSDzfzUbsA+b4JxORlZ\
-Uhke64ePLW/BBBt7vGmJqrgY7MnyddMtesnWlvapXam23OvcrtPYN8Zuo2xEoilPVZbdPLJCK0AgtXfaHkId89ssnuEfJAHeMJ7efDnouFHxzLB46oRmLXZwX7H4lFq2Yx/ydEe+VPPTbSwPFmI+R4WBuSWa24dG\
-864gzjwUGdtJYNJeVsJknvFQWjfutuUYdFMrO3V5IMSq9PLJYKqbWqYxGBxvs3ZgpSzmv7JwOl08MFOhTPqd0hQZLfpUwgKgSU6/Mr6vkhnf9I7QcawTURpnP6TYI+i57IAPe8TDCnemWDiVhXN92GdFRZBfLVYY\
-pCxfsr9WMYTjAnOxUZgKsZ907JORJjJz9a7pPhHZJCDdOE0Z8YKGFhT9qtwNtsikrvGbJn/F+oyVIKnGkN33DF6WrPwla2GYbT1l6/76xJKoGERoMSuNmyveuMVFCxySVVUqG7ezRp5wgtSzr0x0LMTvo6VYYvaK\
-eIfIpx0Z6FCW9zY0pJk/WAplpjDuWHCE2lttHtl1K157KKkOoOn05RxJ89IJBu6RsfGx50Ku5YRA3cyPCYGiaWoHGBhFNXOAPRFiemKg5iRcLS9KiDdjamXESGWBglToAfiepEyI8EXxktBB46w2B2rKIBKz7hSS\
-JKmsOWXYdpqINMi5QCHFoPLsIZ3G9kzcCGMZsPq8zsdO8UffXhf3YBjpO1eDo3488DfOkXj+4JtU3IGpH/ze7UfFAsu5bArTcQ99xTUpfeCQGROmHVCWwYzlR1acbmyJt8pT7/hn4oqS8SVkAZ+QEO2LVpyu4mXD\
-3qgwFg/gvFXPK213/jNzcOKUliFhJgoQz0a8fp12XEGhjY/ntN9DeLGUfSoMyMibBv64+oGlAfHgtyRts38YXI74BRvJdgov6AP9c3YRQ6Nw50fntsIuyOtDFWYSIfBR7zF7dFh5zwgsnSZkHgmla14XRsUGdgvD\
-1A1Wax2+Zk9NojG75gDCd7cT8ytvH46yjO8TGOwiEsmIC/ZNK0+RwgHf02C7kDvvb0xSmdNO5mNGNLvWnBidT8T5NfQgarXAxikIV2yk0tOID/FHhBsDALuctTFBhBXFlGmQOQdjy6imgCHmC6XWYaOJU/huE3dh\
-XHt2mQfJVfSIRW3q9HC+eN/3e5pM/ZFgC6Pnkl1xA8qNQ51QTAEP64E5hSvw1jH7UQhZhTyd+mO1OFoWz6HICqpvegsQ/m7yMZDKRatxBMBm8tcsnHwoGZV0ksnEErPEw4vIex/ztRHfTPFICGcdMfQqL9ziMMzw\
-alXkrZgK2IbmzOUCHxHDaC/KXxHQD468H8kiuCi64NUP6aZpd28oxHMyf92PiTn+IzspeammPvEmV/Seo9IVOc5tPo5ShFcSO4bPNl+/PTEBJwSKKaN96xJril3iExAqnwkKVohU4w+4WoCNChiUIyGJf2YlJIYk\
-oGQss4ML1uZct6ax4L2LuVMGQBGezGKgxrZyAE18Z72+Zeq74cpuRRUfdQElLV/MtuF7I4b7M1EfibHBau7ZpvIOgt7nojQCvHkqAXob3Q8mA3tb0u2422uh6Rb8otHkeykGIowqOyE2xfgIMFhM9gCDxePb9hzy\
-Ym9+6uVsBSU25g9s2RnTh2diHHDc8d467GZXYeJL4LuuesvcWL9Mpq4/A/qRckbbLxgrWajQuOTAs4c2mcK+Kn0iOmdP6hlk9xNQz2paFf7KakZZVrMJn2TZqMo9BKw2Aa5gS6ZC4FseQUePnQZ/7sSoe2e1Japo\
-RBXpdLdcIiqevWkd7h2WKxIO+k1c/B56SqDYbbpIoM31Yblq6wrXqRGzxocGoPDKyadafpH0npx+T18FN03hG1XIA2tXTFh3VAi2dLn8S4iZu6zwRMDI/nJPbkJwyAAbSMl0atFzG5bLMs5UyCTa+5/2zdf9+cKw\
-fyuwRIgiAYL2/IGocyxGDfiC+yvzdFOch5EMYr0qMiZiLbhj+kVy2iBEhRcsxXMX0TZx8hmPBVbzYiyBFRvUzwClHvln68nTpvsGdcBJIhTC0BKTL2+xt33LAh0yBbCqXLcwwqZoKUFaONVipImrHETmx86y4Gfq\
-gKslDQVvw2TdyceHZdGoqpDcHwIoxBzYZfCxQcHJkyFKjjmYyfVMsuiYS1Dktj3o9QgPofj/Db1kAqcn9wWA6/DFfVxcMF026VoPTX3rSvs6vgDlz49eQrIv9xAXFK9vv4GmvZkf/4KXT46e4uXTvX283L9V+JWi\
-V9uPwchJd4CNZBDsMoCNNZ9mZaRMUTA+UGpaM4JXAUdL7XVBQQfNxZhalBMahbl1wYlHjffJFg9aZ3KobRRWYIgG9eoA2KWOFCqOmG8X4pW96Jh/tVRlEAMb3VwMiHWcS/zFNVcUBMr3SAur7HlXJ8pSL09LBSEK\
-yQoDfp5JzGrUaMMFm64+6UWh7bCgm+7OxgiZPHOhPgddL5hprqQM1vSyikvLXX6AS7FkSaUrt4ozDC0hcMhhHc6mqad38Wb6GyzqLMe70q/M9atq1w7JPWLzjVeNUwxArjzdzaKZNQ3P3VZy2sB0q1+eztlBLUDF\
-CJoAI73dK/1+OvNLa/BF8XQ6XQ+1jdT+CUCAkkrvdBVVBsQr10gv9g/krNzSDhFWgrPjw+oVND/L3sEbTp2sSXInEEJxIflcz1wOA0TBlKwh7ScnmgK+ZrvphODKVoQOHKBP2kLWMZ/g6dEVNCMxCIRaVJoA25kU\
-mqmKkLFZIvii52X3PKNSjAWihVRLITw4DqrCh2wkCN1Q1MdQkKrlfRH2xyvCrX3qBWhXdH1Bt8K0Sm7hNm+60g8TuduVrU36N6mSSIpZ5YIimuYm/bnYZVaKLMyjLbAAl1vo6S6Efpb8ZzQOkY2lZiEqFg37Ajrf\
-GuaRSnuPKK2tb4FqhTqus+HLlZ4Un5DxCr2vO4R5P5/PBtG5oFotYGlVDfWZVNykyd3J8UntC0f947UhOro2teviUHi3I26mbousT7uaANWkGt5EkX1xKv9ZREftph1BuYzXQIRD9Vgg53EXY2TJDsCyzT4fCQPp\
-oEIhsTzVeBOmoTXR+MD+Eh0BZ3WNhAc9lrKK9lTKnrJV/Lhe02Us6bZUBoQE+NQsdTEBpAoTMesiZvd/cA/ihyihwU47pUdX6Xtn0g6EgG3U6YJS6hCe3HO3AOTm9b1lImFdzSdRF0NrfTwzv2HTMFuM/ZMlgIHA\
-Ap12pWOWzH0a9t4Na71bVnhJd9oVfVwImiNOyAJXn55wdFGXnwTxIAPGt5Q1Jm2G2n3CqRVgpSL/pylGuUeC0Jxy0MqEKs26pf4MI1eivoWLa4Q+cQcZtI4VctHZQGE6BKH7iFvQnBIdck5EBiJgQb2alFkBGyXZ\
-wJLNy+jfN7l3SU7ALJcuZDbjA477SuhjLjVOquaHNK8bKFZHhAGw1df+IkoK3asEkalT1IyBs1SXo1rVlXNOMEcf8ZxKS31r3RyjPr0AHZeQoYvMefU1yTFcqtsMwYOrCkxkJhEhNWLohDA1FzRqXAs+7s5Fyb07\
-tzoOuPw/XCPo1mibr6VIXlMqX4j11o7KE3HKQxJy2tQMJH+wglTUOSZHyroVc8RKQ+UM551Lz49dTtevvwWOiX8CSEesuSzL0XWpergumAN3fi0021rAwG8a7YUrkV9Ldd0lOutdMDjrEJnOtDY7HdIyBv3iO9on\
-nuMYelse8Q+MwIcB6Vt+zKv8JWIfzCGl0nyiddLxrKXlj55KWQmE16267Aima/GaqXSLasYdivx6ImP7xX1l0L8Eqjn5WVFIA4vHLlFGKHrRSeDFYKV3sE7qWt4n/qknncZcpfCXW+S4QInW9ECQis/kVaCplDrH\
-EjZ3ult0jp8+tXDRdRm9qz9LC07FjfTdaoYH/A75Qi8XgWYZvRLwH86gEWQn7y6+bGR6E/2dureSi6GsUYWrdr1R3eKGsvY9muoqH0o8HxS3QkvUpWkU7Jethi7fYs6CoacqdycrKcJ5Z5OX6N5TRkHbMFLmcB8T\
-mYegMhOe0ELCXirZMilSIOqI1g50qXLf5+B4INcy7oNMyixU9cXol/WL9Gn0rcvzRjcQcUg3vETZKvymay46w6fmd8xoTVXcDqnfS3qX83TlvjnSGOc6YSx4X+ryuQBZb/htWzhDrGYxxMXK+IqpdLbKTZIP/eNT\
-8mFVFWBPRbuniq6gzOXA1rV6Jh2itOv0q3iH5VA213rylDyloo9xrjs+tTRmHbiQqZsR7wP06TeMuviczirsSW6DJUd9Gz3wfpmglbnsZS4vid+2vLtBXz1lYZdyuzBUulV5Kd8FyIdFJrrrp1iU8WyCwluOLFZA\
-yKyLiuirNmq4RdS2oPh0k2fXXA01XGk3aozycqSlwNRvWucWQX8h4z7u/GhBvYAzrreaDPOzxMuMnJe+nMtHlzeuKb5CLYw+EazdJ36Gj9MieVdRzhDcVLLLFWb+8Bva3qL28q34xBPQIGxcj84A5aD3gSEU70lX\
-THP1ADJLksUr+WRCkxd0H7TIp0nOJZZ+jSeUcBsPqf4m3mh1CBd6ZV21tVLi34tCmv/Sc7nzp99SAk2JmUx8UWUFqT2VKAQ1oTj0kaFmmHcrE8rGZ7ysT85E9xleV5mH0HIJgfbNxSrPtqB25cCDPo18YiQolDqc\
-q0A7M2aV3GZ2JAg4FWOsKCXZ7c6wNuMt6eMBaSWog/Xx17Dz092HqPL+wHrbxoNGbc6C3VQEFYnyZ/FXyaYIJPdEmaQa1VYx4nUqsqGHVUiVzVzH+pUX1mRUInHnfyryrFh69NtssWstg1cjNphaJlELD5/9onId\
-S2kRet5WJFNhPpdDd9ZfUBSfS1qm1BvJ90gw37vvgNRHmrFgqREO0OcfQNPwx0/wOYYjD1X6zYtPAnHyjXAWk7Xel9yYHhm/0lrRdwWl3Jmn0voRr05KUzGN3Agfddgl2Xjo1CfzA9r0oruvvb4mpUpuxzZQugBY\
-qwGJM5IeKNerx9dq48D7lNXLlMlZN+LAsv6Klfr3IEY+3qCZP0oDjjqCL5imW9M0TLdJnjfo1SQvd9CrSV7fQK8meQM0hb9JnjTo1iRPd1DySvbnC69dQ9ikbn63QV+sv/tjUZziu3WtskCHKgoD+6Y+Xpx+aR8G\
-Oonsw6pYFPSBu/tqkRTglAq22IONN4697VCvEDfQdbl5KUEV1QOD9maLyvbcP/Qndjd3/Me11HDJ9172+GnLSB5cwd6v7UOLro6Lyl2+6d7iTOrhUr/TF9NqXLUv77RMSBlj+Ph/c0UXpxcpFhcYuikn1zvoKMmD\
-PFn+C4psGGw=\
-""")))
-ESP32H2ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNq9Wm1z1EYS/ivGm0DgrriZ1XsAs4Zdr7ExgRSEgiwJ0khy8AUfdtaHqbD//ebp7tGMZK99V3d1H+yVNG89Pd1Pv82ft5bN+fLW9xvVre3Fudabi3MT37T/xotzldpf+1dli/PW/in1Hl3meIwX53k0WZzXue1T\
-SZ/Y9Ym4B/0p28nYnoW2Qyr+bWzvajzZnNrX8dQurNBol8xt7zy3vTWG6OjMzprY5pabCzuurnk1DNFanpm6Z0xvbpcvC/tLX/fsR/u0JIKxs/JH7FG212DDRmZh+ldvaQdLDAH1Rj3Fh6VssF2c2g3Y7+14Uk1H\
-dqkcn/WjJ5a28RQbe7JpF1VJOdiTpeuWm/SSra3sVztTY6nXhZ2ntS3GbqNqhaMZD1WW3CK2TCuxQGbftD2EJuHWPJnjHzgB2tCfWr688tSoZG6YPU1Ko5Y7eK+ZfUqtur6PeLhbvlKL021MDxISPkeFjoVdtLAf\
-jeZdgZ1FJDy2g0CkfayFyCLnrjRv4rflCHRDazt09UoWq7PLB4MoP7TK7Kc8nmyzdGAmcAN/VelkunxoZrIyyXdGQ6S3yFMFDYAkOfnK+b1O5/zSO0JHsU5FaJz+kGCPIOeyAz7sEXcr3Zli4kwmLvRhnxQVg3+N\
-aOE4Y/6S/nWCIRSXGIuNQlWI/NSTT0qaysj1u6b3VHiTYunWScqIJzQ0ochX7V6wRV7qBre0xWuWZ8wETrWG9L6n8DJlHU7ZCMGs6xlr99d9u0TNIEKTWW7cWtPiJhcpcEhW15ls3I4aBcwZZ4F+5SJjEX4fr0QT\
-89dEO1g+88tAhvKit6HhmsXDlazMK0w8CW6h7lWbx3bemucecsoDNJ2cnCNJXjZFxz1SNj72QpbrKCFQN4tjQqB4ltkOBkpRzx1gT2UxPTUQc2KuloYK7M15tSpmpLJAAUKSh6B7mvFChC+Kp4QMGqe1BVBTOhGb\
-tRdI4qSy6pRj21kq3CDjAoEUhSryR3Qa23MxI4xlwOrzppg4wR99942YB8NI700NjvrJwN44QxLYg28zZ+OSye9+PwQYMZNbyL4wA94hsrnagFlwyIwBMw+U1XjO/CMtzja2xFoVWXD8czFF6eTyZYGgYBJtjSad\
-raNFVKmNErEDzmb1bNO2t6K5AxUnugwMcxGDZD7iaZvM0waxNiGq064PYcsytqxQIyMtLaxy/T3zBEzCb0UyZ//QuRpxA6vKdgZbGML9czYUQ9Vwp0int0Y7yPZDIObiJ/CB7zF5dGRFTxXsOm3ENBJWNzwvVIvV\
-7Da6qZss3Dp6w/aaWGN2jTWirVMGMzW/8PZhLqvkAUHCLvyRnKhgC3XlQY4HJgc7But5ixNizII2s5gwtNnpFkTrYipWsKUPcScI1mGB32Jdlp5QfEg+wu8YINnl1E0IKyw3ZrwG6fV4YgnV5Dkk/KDUVSBpkgxG\
-3CTen+uOLw+wuY4fM7dNkx0ulu+9AcSpa2L1YwEZhtEV2+QWK7cOfiLRBnxsBkoVrQFeR+zHjN+sTJ7Owr5aLC6z51B4Bek3vQkIiDf5GEjq4vUHD4QzxRtmTjHkjEo9Z3JRxjwNgCMO2hPhkxhpckwiWO2YMVgF\
-fhf7Y4Znq+NgxkxQNzJnLij4CGdGB+7+Gs9+cOR9lxZeRum92NC3m2X+3ZCv53j+pu8csyNI/nPFU7XNSTC4pnZ2T9cEO3f4OCphXkXkGD7b4urtiQo4JjBoH1jb2JATk5xgoeqZAGENlzX5gKclyKgBQwUik+Qn\
-FkIiSDxLgjOcU8nSXOhONZa8d1F3CgXI1ZNRjNXYVgGsSe5eJW+T28Np3XQqOfJuJc1dzrdhgWOG+zORHfG0QWcReKYqOAVqL0RiBHiLTNz0zscfDAb2dkt3/e5chUsEzbCORpMRJmeIMKryTGzLyRFgsJzuAQbL\
-J3fsORTl3uI0CN5KinDMH9i1U6YPz0Q5YMGTvavge8K4dgG7m7o3x80r57jxDLhHYhlvv2CUZI5io+mrQBO6eAo7qvWJSJs9pmdg3I/AOytjdfQLCxgFWu0mDJKloa724LPaGLiGFpkavm91BOk8drL72TNQ9w5q\
-S4TQiBDS0W65WFTMettZ27vMUcQc9Js6Fz4KJECxzXRuQBfuQ2fV1tV2E1CFgXlyaIAIrx2L6tUXCfLJ6PfkVUDTlKFGRdyxcSmF9avCJuWrP2Ulc4+lnWY3sr8i4JusNlydtaPiRRoRcuuZyzROT0gfuvcfD8zX\
-g8XSsGUrMUWEPAH89uKhCHIiGg3gguGrimxTzIaRIOJKWQZlmAhWmH4RnLbJlI1fJQa7jLeJjM/4LGhalBNxqViPfgIW9dZ+dvVxUnwf91TpFQeJkAZDU0y/vMPGDiwJdLzkuqrqmk2V8Urcs2imRT1TlzmIzQ9e\
-rWBe4IohW9KS2zYM1jPhS4jGIkt1KbE/GFCKLnTuvUg3GTD4xwn7MIWeSxSdcAqKrHUAusHCQxD+f4Pu+8XxyQMB3SZ68QAPF5SWdbLRQyXfukatyPfpo/fzo5fg6ss9uALlmztvIWVvF8c/o3H/6Ckan+4doPHg\
-dhlmiV5vPwEdJ/7wWokb2EoAFBs+ydpIiqJkVKCwtGHcrsfsIHXPJfkZNBZ9GhFMSBPGNiWHGw3a0y3udJW8I69RWn7BAdTrfV4XNpJ3OGK6nVdX9Rxi/tWSkYHba3R70QfWSSEuF+dbkQyo3iMYrPPnPkdksiA6\
-y9hRIuGS0F27XBL6qdGG8y9dbjJwPHMk1jjMl99Aq/i7c+3ZyXrBFHMKZTBhEEVcmucKHVryHSvKWblZnEZocXkjduNwMG0zu4eW2W9QpbMCbVWYkuun024cklHEztsgDacYeVxe2o+ikQ11L9xWCtrAbKufly7Y\
-Ji2xihEYSVggOn3T72dzMb0up5Yns9kVOQOjOIVBUyQCj0rv+FQqI+G1c0QXCwdyVm5qhwbr/Tc/jZUrSH6e/wozOBN2c5R/Aj6UF+LN6/XKIFlK2pD14xFNPl673Xo+uJQVoQP75NMuiXXMh3h6dM2akSgEfCxK\
-SIDsXJLMlDvIWS3hddH3yn/PKQFjgWgpmVLwD0aDMvCRwEHFCX10xVKNtJdRv78i3DqgOoB2wvGCXoVold7Ga9H6hA8vcs+nrE32F8mNSFRZF4Iimsam/bHYZV7J2ZjHWyAB5rbUs10w/Sz9z9Y4RACWmaVIWTys\
-Cehiaxg6Kh18oki2uY1Va+RwnRpfLvck+4SM14h+E/uS1GIxH7jlAmyNgKUVNaRkMrGSpnAnxyd1IBT1j9f65qjYNK6CQ37djpiZpkuwPvVpAMpEtbyJMv/iRP6zsI5KTTsCdDnPAe+GcrEAz2PvX+TpDvCyCzgf\
-CwHZICkhTjzld1NeQ2ta4wPbS1QDnNa14h30SMpr2lMle8rX0ePqTJeRpLvsGEAS+NOI1VRiunU9FbUuEzb/r+6D/WAlJNhJp9Tnan3/TEqBYLD1OJ1DStXBk/vuFZjcvrm/SsWla/gkmnKorU/m5jdsGmqLvv9k\
-DqAjsEBnPm3MnHlA3d67bp2By8sg1M58nse5nwX8hHzsctNTRsGm+iSIBx4wvmUsMVk7ROQT8IthpSYTqAlL7xMjNMcaNDOhSrt+qlydRbFLTN/Gww1Cn8RDBs1jmVx6HSiNRxB6j7n8zLHQIQdDpCACFlSnyZgU\
-kFGRDqxYvYz+fZPrlmQEzGrl3GUzecV+XwV5LCStSZn8iMb5jqJ1tDAAtv7an0RJens9T0+RKQbOUiqO0lPXjjnBGH3EY2otKa31YyafXmARF4mhfMzR9A0JLlx02w6Rg3MJvMJc3EGqwNDxYGghUNS62nviD0XJ\
-uzu0Jhlzxn84x9jP0VVdK2G7puhdfBjoEa+yLxZ5uIQcNVUByRisWSr2VsktZW2KOWKJoSSGM81VYMQuXzfMt40dEf8Aio5YbJmXo28k1+HKXw7ZuVnW7DIAA6NpdOCrxGHu1JWVyATtgsC5h2M608bseJhlAPo5\
-tLL7gdUYmlru8Xf0wI2A7B1/5ln+FLYPxpBQaT7RJvU0a6n1o4xS1YLfTScuOwLoWkxmJgWihkGHveyQZay8eK8NCpeANMc/ywqpWXHfFVK6Zc81GQcOWBUcrOO6lvY0PPXUS8x1Ar9OhY16j6ys6YEg5ZvJqkBY\
-KXJOxHP24lt6w0/XLJyDXcX7zWcpvKmklWpbw/CA3yFplYBni6IKgf9wBFQEwWAb769pxNWf+DFVbiUcq1zpfM3GS2Vucz1Zh0ZN+cSHEuMH8a1REXXBGvn7VSenq3cYs2QAqqvd6bpFN2C/8+lLZK/g1vFOjGQ5\
-3F0i8wirzIUmFI6wnVp2TeI0FqFEQQcSVbvrOTghsLZK+lCTMQl1c9EBZikjqRp956K90U04HVIMr5C1ir71VUWn/lT7ThizKYPr8fq9pBkLHq7clSONfq7+xYwPuS63BUiHo++6vBncNYskzl3GJabKaSyXRj70\
-j0/Jvap6jD2V3Z5qeoI8VwON1+qZ1IUyX+hXyQ7zoWpv9PgpoUpNd3G+cXRqqcg6iCGFNyPeB9an3yj2YSWdVdTj3AZzjqo1emADc8Esc1ljIY1Eb5fa3aBLT7l4+sp4T1RqVEUl1wLkXpGJ74VRFgU9m1jhHTsX\
-64Fkx/tGdK+NKm0x1SvIS93kCRrOhxpOtBs1QXY51hKa9gvWhYXSn0nFj71BLakUcMYZV5NjfJ4G8ZEz12sJfXR50ZocLSTF6J5g4+75GT5Ui+o+rZzDy6llo+sRZvtb2uSyCWKv5CRg08CFvA6sSzXuXTSEBO77\
-xJrLDZB+Ekdey6UJTUbRXWyRK0rOQlZhyicS1xsfKRcnxmk9N6Mgvau21jp+fxPJNP+lIXNSQL+VOJ3iQpnkouwKZAeCUQp8QnzosqFmvHczE9wmZzxtuJyJHzDOrtMTWcsFBzrUGys/2wLftUMRuiK5b8RHlMSY\
-S0Y7fWap3GZyxCc4Fa2sKTzZ9WfYmMmWVPIAueLjQQf5VuzidPcRMr7fs+h27qFRm/PxbiaMikT+8+SrRFaElnsiTJKZ6jIayVUisqGHSUmVz13B+nXg5eSULnHnfyr8rJl79NtusY2txq9HrDCNDKI6HnwAZLET\
-yZ5CzrsEZSbEF3LoDgBKcuoLCdGUeiuxHzHmb+4mkPpII5bMNYICuv0BWI1++ATjYzhbpqqwiPFJgE7uCucJaesDiZPpkwkTrzVdK6jkzTyVEpCYdxKamtcojNDRRD7gxkcnPnno32YX7X4TFDcpcnI7tr7wBcBa\
-D0gcoPSguVnfv1Ebr4IrrUHUTFa7FUuW92es1b8HMXJ3g0b+IIU4qgy+4DXdnKYVhzN93qJuk77cQd0mfXMTdZv0LdAUVifdb1G5SZ/uIP2VHiyWQemGsEnd+usG3Vz/9Y9leYr761rlYx2pOBrbluZ4efql+zjW\
-aWw/1uWypIvu7vYiCcApJW+pSD/uHrEdqhniBbIuLy/Fu6Lc4Lh72aIsPtcRw4H+5W74uZF8Llngyz4/7QgpxteQ90v30aKro6J2j299K86kGU71O92cVpO6a7zbESEpjeHn/80TPZxeXLG8QNAtObneQccqylK1\
-+hfcvBvW\
-""")))
-ESP32C2ROM.STUB_CODE = eval(zlib.decompress(base64.b64decode(b"""
-eNqtWgt3EzcW/ishaUOh3XZkz0MCNrHBiWOScEoPLEvqlM5oZljYki2pWZJDvb999d17ZWkc23QfJ8exZ0bSvbqP7z40n27PmqvZ7Xtb1e3pVaKmV8p9qsL9xif5+cn0yubTK92fXpXGfdPdx+6mLibuf7m/i/8/\
-uH+pe+JG2mbb/bOySEqLzM/cuv3pzP25S/c4OcENd9Wm+9PL6VXjbra9QTXacWQ0JqmHbvm6N3Lr9CbbjmCSlY58z33cWK0HxNNtv6Lqf3ArZO6i5VGmmLu7bqXGca6MW6d1T6zbQtUSM7JB93G8mnToCINA4a6U\
-dtMyfqqzMf5BCuAN4+nJ9fPATZKNLYumyWnW7BDXNYsuSeaLsQ95uidfJdPLIZYHC+5+A5Yw0Diixt20incFWZq+CNhNApPuZy1MGs1Dad0sbMsz6KfWbur8uRCri9WTwVSYWhVOsLbaH7JlYCVIgwaWwlBe7tsD\
-oZxjykeaIqML/lRudgIr8ral+brOx3zRUaHnWOViMT2hpcCa04TpyQ5Y2Ts8rPQ6xcKFLGzU68AKkU4hv8ZRI3kX/MPZctCM57jEXGzUFMJ+Htivilw2un7LdJ3zp4KeVevNZIdXs7SaGFftL7A/pnOLn7TmBRsz\
-xAAxtfCx3mDIbsv6kiXreMlGuK1r8FlMb5NL/n7saLg7upLV2qJY88AvLibAKsd6BRkmr7cTiaZXRN6lxcL6+H40Fz/UL4h5CPwg0IEFadPZ0TJRsz8X0kxhEPHgKYVrZR+5lWtefVlYtDTAKi0YvsgCjFgA4Rkh\
-ndgT4I9oLtgB9PXs9IJAKD0o3AALv6jHYkipX8aRUyMLY58KzCYpoA1y1kyzShmvHFzAfDIYox0VTItQJuFVYYnW+64BdsogEregd5uLRBPnVBqbL3ZFJrVmdzLiVkY/JK0MgTmKsdghGuD6qjEDb/47X30hAcLy\
-rpw4t0cw1BFUPtmktS7cwgkSQdjeMu4YGWY1bwDWS4ifCJTLaEujg0qV+CfPey1CdzeaXhdvZRmB+Lb5DMkIGGuaTRougu3sRuCU33WzIBpRfkVYbJk7I5YQ5NYRGdg/8BFTwNTZlGOhZpUug/vKHRPwNR/e77LH\
-2QaXcIEZbOoNfl0KKKX8acsFaMGMC2wqe8xIWwNk2Wyv6pI93Ii1wQSBzjCZitcjr4MIzC6ofcsETLFGtqAaU8b23rpLQVtatBwP77hZEEr2ev4h+BWCUGuCu/pPSeEg4icIjqaUK6YIQUzVGQc4mbqe92Rb0gLl\
-lFaZfajyALeqSCzl4C40XY6mFxP45Mv2DMI8m0SpDFE19jfeOKccb55wwIDcNZQBSqvNdOAtPAqeMKqm7qyx69dYsR8AnK6eAE1IuOnwZWxxsKr8OfKm9+/JfpAStsj46r8g6P0kcERxZxtJiSNW9x3XtTpDylXB\
-ogD6/bdsVo1YJSVcJsirY+G9b1kiVU++c45JgAyCrdXiOMJGXzubbewLBiGd1fNZZDhdm2eHW2U422tFtoUn80+ypr0fWaKVwGn4YUygS7DiHTTeo9SEp4vhkfEvrlTv1H46nc7sewlD/WvE9nnGLgk2EUaUnmTn\
-pOqcZrsbmzehxKXhr8bYDxMGkEocpDRDt0irPka307t0D64r5koGlnaoPtlksRxh6n7HaJ9zfkLKTSlaXp8jhT51XPQlYuKTVJuW/hmz5yx+h6aKxzQkoj8p+ySYVyORAZkOYoCzmaUcsQhw5xGpLiXVxA2kmq2W\
-bDhlmnAaii5uYplx5mHUmG9CPG3KoVnAbBmJlsHtvwazDogxruH21iow+4hIeD+GsxZEbHZ/2SM3aTS/gX3f330GI3k2vXgJVidvgQjl48fHeHh89wQPT6YXp5DI+WmEiL4KjarJp0ocxzb7v8SCkLpuHV/If23p\
-SztMOAiVVtUbs/yoDCi29hDBr02cPY6ljM0HK4ii+kJqRQkRrXewjhMSfD+TAtIXu52idhhKb+urEZ8/ecP0aZ9Lz3ZE8EVgDEmxjSvCgg2NUwWkXVbSBTyBfen6HouDrCbjigWoADe21Q4/4MxtCPs0can4PePd\
-clrtFUiKW59Z77JmbDqWFgOr+zFzuAgNnTTaI49ssmwYzgGJnKXfGcnShua+5IqfBGSPrAOZ1ifSdmR/EqDoIc3bo7LiaCA4ZptNOOPUWVUrgi6kz7sckGymNHE6WEDJlBidjgSzW7qRLsyh7o3Q9qh6k6V+R13n\
-77hzURUvhhNo4n0wC9gvN00O9oT1XCKsJHClJHCQOOX/jSR1eJ5Gv0tKc2kuxgAiYTiAUMxtShYFIrjNN6fOJeWtY1L+jfI4iex2UW+XlmMDVkEpVGYIq+rgb1JuczQXnF2U7N2K+9brPQLpLXFrLR6c6YHva+FX\
-og6XmKm6zY0kkf6WYyU7oOWMzwnXRzUVdc6m0/FNAK2WHYL2WlBFNGXH3IRlqhSZEj5p/QruigS0uCYBv4fXlGAZpDP+8TmmK9xHnwPhShXdck1RQtoOWy/HUGdSwutLCV/nVsVj3t3l281USy9ww59KdXuElD5V\
-bHbs0qW0IQvxas3OV7dyvwr3NQGks/qZNEIg+1ZJd60v1UvFzToMBbVGnlPCEY1PyElOx5LbEeTmT+nS+Ms7uDRtAGQmcj9UZbb4OoRjSLc2Ej4Uzc27c7FLXYny7KM9sDBEWqEOjlgrRu39Z2ReA6YL+y/f9/pj\
-pfeAK9du3b3J701UpVMvYUOJDdRGp0sjbagIMHyX1Xc4oITiHT+1xuuKdTMXo+wq1NUd6L82vh9L6c+hoFizaJSchOhCUaHlbLDU194LPoqkqHF8KEmj5jWQNFbFPxnWLqIMX0J25ZNHpR8JD1EPNxGuKfvIJSck\
-JRGZN4zI6PB5Xwwqi7jSNW2rkW3p9SxR+7FdxZJaxKueZSdrGI7E7t3veuSdfV00pNKV6l/14PTBwYNgp9SFn1BS7qWeqJGPnQCN9ssH/tLSti4fPH0gebRi/TR22WsnY0v9W7gvxl6zUBCfgAmqCJkdC+vPNMz6\
-YYuApMso9ZYoAqv0PV+DDqLu+fRxxEbSVL8KNGLTG2QzkDSmZnipKZhhosooYI9QgmlZGZlX0272Fl33U59G3sGPWwREWUAPWsoJugzOUdoAJnQNwK58pfma8z3yHAENashi98Y0fGXVL9t8JkFRws7nvhCxg3NO\
-MiqYJuVmSpLsPs0LA8UHiRoAtv69u0gi6efa6k6X5wjELWMSn4x8do7BHPWW59RK2nfr57B4tUbZYgQh6IDI0txbvp4TV2mX0YQbdJSmoKdqAWvUXSXNYCqZkHRpCeyzoI9Erllfz5EzmJsL9MMCi0OVSiSvqP2h\
-xZEbT+JYonZnfSXSY1bD+qmsn4Zo5Nd3gcS+YfNA5ePJe/43EJNUwZ9yuaR2h22TpbbzhXR6EoRtJLse2BOf/SfipdQoX4qSVkXZSxo3m32JRy50BM7GAYpJfY09DBDLSPNjHFOPo6CxHFh5xN8xAsd7xTnf5lU+\
-SbthaU4jomglInmelT+4g2Vngt3NwjIO+QZJNpOWNhTYMLrA3XVHZOytuK4tzh9geF5+ThRSRPJYtPjqspOL9KKMq4o06qWu5HkeqzsPprLZttn/IH+qR4PPXqOHbAPOybFG7eNHNrrDvXWlVnlVk8uBqeThV1X6\
-qPkoZXCCTiTVvg2DAb6X+cJZjKUzmbFA/PIMGkEO8ujmw1am1+krOn15ykpH4VW363Y9+Ci5WBYs1lstxUKpLBpp+tR2HCXKaQTw6mR+jjkfGa/r6mi0jiisAOWCHj3DWRzCFW/GSjep8Gc+D0FoLGy1c9mRbJzM\
-qSdGaYdsUbU/a4eSKtpZF2MEP+vmZsbLVkZWBVTg0mtnGwdS4sdGeqT9Lydd96cjrIzDrm070PwzO1epuHxP8P4AjXPY0oq0cy/9WPSViB5b7H/l50gV6dDEZ7tUY3qv5bOfN10t+rO6uod9lYt91bwijrT6S26v\
-kieSCRXh0C7JDlkYVXtrFXDXdLr+RWBVSY9k0WIkpHFMzIQF+u6n4ayR0vF+R4BbLEA6AjNLUU8LdDXSRuo8NEk00zeQii16kUFLLEtsSEbllI50WcibBgC29H5cXX0tbfokPeekYg2evApZEJep6LWldORCSdg2\
-zyb9tNLUohctBqhRUyV1TbeDZBygnpGvX3DWhgeE7eoDN7Otxnydh8aCB801fP64uotEyRVSlNrKaQ81oy0r1AG7GB1lr0N5kq7FmTPuClTNdNZEDYrsfSSlpVxxM14PTjpvDMH4jn3fNMA3+SfJ4sVYQIWCoj+f\
-llcOfISsoq4ORX1qc/Sl61qEdvQqUGuSk6hTnuxtGnkkb0ak/2MsYxP4ThpTgBhftGQ3jVZQOzKJUuATvNCbQ4rVVJp773gtb2P4Rp9Oq6j6TdfS8Km/ih3FGc1QYDvzrkbvOR1bOQ+R3pnv2XoHZlO8ZnlJLnAp\
-blhT8XEUdNfYwZ6cDzHUUnIHv2s5O7k8eohq+R7bK2/wH5ixPe4dSTebOmUN1fC/S+PDl9llaFGpRXP+4HOmMVluHiY6dNZ170WU42hujonqL4VcLcdc+G73OMhWvRc77CuNTKIOdkV+5ooh6WpQDpNEDX3ZghGt\
-e/cvKYc38qZPkpxh++f8Rs87GjZjmZH3o9mNfKPpD35FsLScZyRVIJYUv0aZZUuqhvnMFy8wyQnBoqMqHFX+qNTyADJ1ieyN78UDJhthhlJbSXdx01uQjw9VlKjGIZ8Wk0CLHSyK6tVZi7mJXqsHb+WbjMGchugS\
-V8X+RSsKXuVGbraKP4g1ZSKNRSomQbXNv2+fwd6fHeLIPX+5ewatn4H2j3h83J7g8ckh2MxPp7PFmcDtb7bozc1Xv83KS7y/qZKiSJXSaeKeNBezy+vFzX4/Sd3NupyV/kVPRBL2LHpHSw++mc7oncoU3z9MLyiV\
-afD9C19Ql4J753T7Cd82GhP+6p85E4kvSbT0siZA5QYdMSkaQNHA/XrobyDiyaN8ermYWRMm0wAsbok3eveUyKQ37/0/fl16ohGp3jIjt0XIsU6SnslMkc//DdOgaK8=\
-""")))
+ESP8266ROM.STUB_CODE = _LazyStubCode(b"""
+c-oCR4OmlGmiN6R50D2WQ5lD1$M-Hs5`>!fumTp!OMs|Vr-}o$v)d_&(`el~gUBq5OJ@)?x-I(+g0<FhwgLUxPNy?vwY8mY-HBLJ?c$bVxAl(}v8_Kl+K3h*kla1@1%ImF%uc@V<mKIW&bjCRp8Iab)@y5@sIOg@
+FCg@a9w`hVu5}2Z)(xaMo*~7JjR<W7P!xpbJ4o?17?(zg@nA?0YFW2tQ;3mYk8ZEgEWJ(~!$i7HVBCIx<3kkz0j<(Fry|9E-Bh9|*Wun-f#%MED=tBJDw6&eaIfdJ6^maH=_}&6Nao5a(bBJoWxLUb=m!RDTKIZY
+<6`N}qx8n6kxrAjnAgB>xg5ny#)JB#5b`G>v;*Wr8=}Pz&vz_%<uy{g2f*5^SN`FWUf~g{A_SP~DQ8CgY60E!3jGOB=oM(S0D22TQ&jvEMES(S*xPVLfS+#z`}_*Vnn|%9;58WE^*SlG|ArKAf$I(v@QDZF1ca6(
+0~ir11ez|udjsI(S4r^$a32C$dBAV|1K2qc<bZ4I?@6&L8GO2?B6Jnx-2pW3rXXbtz$*aDi;+_5LQ3``q}0y`sUJeh8w-%qb01Pp6d+~(=SXQii<Cu~NZAPE;sMgup>H(=usa?55$i7Lc02prjzPCF<Su3|k^n;D
+J|ewAcr6E$FJKqqJbC2seg^wn_>wG9_gm)hn~eB0Irz^+dW~ddgWZp^;%@=JfR*4<&YYx7q?ZZqVBq0=jgTRzj>3L{IZmH3eYd~Y{u^2PB5}M(q!)>&1Mw_#OqJm`L|Q?z(t$9aO<hOedV*D*T)^^1?AVBt7(N3#
+HaVA;$Znk3mSE1!GYUR1HNr_6If-q=20IqKPJ=ZEsH`k@V^GM9@zRpRzXfeJ^37?uY!`DITNcDdlDBs<_6Ky&1ICq2+Zo-<jOz@cJQ@Ctd2KBB0<z35@p{<cf1%+T!7H=AwP@HG@5OAe61hG=UMI_KM&5EZ_&eka
+qRghB4>z&C-ywb*Q2Ty`yuf2O;sVH=0RyfEU}xd4(`OID&qV%X`m-4Y-$KZ{mvt>f<|!0!IdbhoPX9;qjH@iO4d&T&EFT7X=NTUkzJ}meA0?cHWdHFzc(zODdKqOq`D9Bw%dOS9W+L$RrhfsgP}#pQhhJbey+Cas
+`{UDaV$b1cnaVQ}KKWR(>(>bNO!j$ouIEr@GaGD2+)5quBy~x+XBQ6s3hXOnI~Xq=sWhe!eI5#B2YP1ts&z=PU$2}TJ)2E@8YBqcFh5dp`h)=z0Gt~SUZUeb`-nPTK0QWT`Fhml)@3#~25GE&_pz>i!Y6n81HSr+
+`-M8L2BB_0lev%Osu9l7O4G=oA4a+@``F-5Q2t}qoK1C%t3)?}<?|vrM=PdGVC8`!pFq|k-YlGJqR5A98EGWSYZt7LkI%fAF1**w{SadAdX!IgvOp0$zl{wpM@P!7Ir5>99S5BLfbd>BJ~nMJ>+ydLl9p?csdS0g
+F8m;nH{+_Dq$^L-;v}vy*MP8LNr|Ay0#1tKlN&JuQ7B{vWdA|oP`j@LbP`X&JaTNFb~gAR%9p$SN6t@Xxk5DPgju<{$lSyy^JWW-<snY5^Omr_RGrI??80o-IOmP55ALozp1pjGZMYWXk@Z2@Eio*$?fm<!-}Bsu
+gbckbN}1YZi2riP{}TI>QoVxJWaLaega56+QFtV{fdF$?BjGv;7@I@7U@FMyJ_s_-=lH3he@?P8quKtW<|SB9MQ&TT_MPZuc1v8h|7c$RgZ3p;K%UNH(^~$A<IxYZtn9)Hn|5I-Z(On?kaz#(RL`je+zWBRmBic3
+`u?ot&3v-zYSlN8*tNPUW<aPt{5Vrq%~UQ5&{VsYXOt|tQ)x2o*V1fzN1G|L!O<x9U4+c(5aC>xR`&Ph8OzL*^Ng(PS~NHfiO)qZ6!qn>Odv{2NPASR9%5TmNY@YGrrsh!*TNLBIXv@6ihy@tVD{4=!E@2&kIi44
+Uxahm!~e)|15qR=X)siUT!WA+fC<3!We+jIlhJP#7inb_cZaasX3gcNKoA82wJnRvMcZ&iV&Ac8eeMi?dazClnRnE-EciiGTpL~68r_SLJ3HFs*I*0VCfb_ZmabsHQlRD2I^CAN?m4;wX0JGB?aFAmnBfs^)e8e3
+l&-Ew+*t0O(d3@FS<42$udVwJ*0or>b$+yP*((>zZF-Mws`bfEx3%1z>2YTr`T3x2%E&0qjVl_dB5KEeE9+;GR0uxhjThT5HrtNdb`QEUBgunq>#<}XhiXI%Ke^hiZFsM$q<xLH!1GvQjhNvZ&>++#X0(Yj#O&zv
+Z=aCkk*U6*2?#oYAl<%N-*A|pQdQO*Bk_H#0jhGq7Nd{6b-FwbjWj*l);P;xzV<`xbW7##*`T56)3SPopX?N+a&b23T4{t*BnTDy%1tOF%*Nd#!u`!52yMa}-IgetuAuUcN9LrU6h#Sb<++fj+3po~W%ARZFX$69
+L@t_LqE5dHJ(jq?P~cLiJ`IOJAKqA%-n@q8b2%E-k0k=S3!w<tB+l4;;H0TPF$c2{Q3}Ex&-Mscg#CqItVvmWH8LP%*xnLEhwc4=bB^wwNF`013`?QaWk79|ck6B5%fv4u1)isqxaTzAnxj*k@$!L>?wvzrbQZo5
+s|*Zm#jlSDJ^CR(O5Mfzpf9;c_7&WD0z4l}RD~Y+7DHh7Y|s9dFT}%<?w*mbES`yEr9%-JxZqHEwNbyes(zi_yhg*X3w|8q1;UAMM_xYA@AxnxC!sKY2+K}n>Nk<$hgshlB6dX@hH;;5$Y{pKzZ1Ons;cWNUyS3v
+hg9<Hb)16sw}`Hkd*m(5<^F^GO}1_UTMx9>wz;h!E{GrDps_0~@f~N?Im8ta%bQ<!iq^!Rc9tPiMXE2Z^0g748S(AG57^uM#YX|}l8d`rkn9z~9aPz_zZX;yKHvKNNbjn^5?f&9URLl3EC0l-Nm<N6Sy(bdfY9`~
+?}zAQ_C=s1c*Of-!MVDBbw$-r1C`!U*N1F`%ar4TS`@PZzgt|XI^LBEj^|S{p$-YuCwQeHTPv=QI9D2Fzb?kP#+^%<|AsQJ5p#iaY>J{d>~D4Y<DDhT6R|0`vYcRlHQz4Jy8yR!aBJRH)3JQ(;s{?4#zE`xPTb@~
+IU18Zul=g%iAbIZzY!W6CpZu1wcT)4G2-KqFa}dw3jdC}ho)-7A^+`o+Q%)6#enz&K=g<+RvtJF-YJqbs&{fb>{kR>o}TT=D?BSMiZ~Vl7TohjG@1HNdDx$b2e97W6F?do!1J}zj7V07z1WXe7$AO%S>I<wERHxk
+1YQ$MdFFAd_tQyyO3bP*XlJ3YfLx8Y<vPdhV{52fP;Q=oYrs^OXt^uS3%?L&MjVr3>J8X4vPwlO#63(7u?vZ6BBCZD<H>o&$IZF2XL5hsniS5=EYk8Ce6aMEi@_Jn0~3ze@Xa{xsA}BY<VcNVSwT@h!rjxF+%h9m
+j3!YQ4H4&_M*0l6bWdZl>G&%j!jn*zA7jHaq|=>)-S;h~x`9(;-sK=laLRHM(PO`i4JHuBAdB}YvjTbYS3GMo*qGn5{N#ZWL)*d9hemg#Jmko-g(#wJ%Fb84`@WPu8=s3?jKf(o#s406zSOJCYic^OJZlT~znhiO
+<j&?38m>9r1=wv5mfV?b*}1_T)aThvlTed8FLg_@-s-PsO*cl_NIcKN6xf~b6!WVEEq2dJB+w94uXR*D9_3%&ocBO=y`i;EKy`-dYRM_uYuvN=w6%X2N7EGaYDd<_>MgCIu%Tu*@quHU;;dJ(b2$ocvAi|J31H0v
+p>f+Yn>+noj*jtHw<ud$Yj*HGE9K?<(;E3uRIoWZemy?4rz<!K360vu%>k!a&~T%1v;CQkp)HO67<wI`+t<OO8*LKv61RW~PBD*v8*1_9ZASz_E7S!V!dNV*UT<GtgZFf0)rr1wp{}*<5#A|gn_e)LI^Eed;(gD5
+hYcPeO=3=_l?98qHXwfR{k?2(7SzNUy|%zhnB`_5@z>)6_HB-zjc27RxD^|DBpd94w0#KKZBnXHXDMV|>4<|}8^8Pgea@||;|(J;>Z`U^RcQsQJu7o3ri5+0Y27DIZsv-jxRvkrbKKoYXVwIN7FCl@&9?!ZgiJ+u
+gf>6euX$f)U8jjJj&3%dEu_gNcL3hZ{t3Kv0Z_Yp^x{vb%<lOha}{otLFQal=1ycUkOX0)D}nA^pBU%&G~6)FMp|V+*{Ud7!D7$Kcm`Lg(k|9)$I)2&LLOtcmA__5pDN~#*N9eFMIIS9!RD*RiMZJ`2dv(=)6V?T
+oB)*?N{y<9d9r97Zx}A{aE_?72t=Ws5R0%o6Uq*ke2@O=!TX~VbyKy#XA|o|jhK1Il2BK8wn@yC3dY++E1ycE&fBpwH_;0%*g&S<0|hFcik#&Y<?+UzK-Mf?<NYHq>Bhq)(tYD|XF~~F%-t^Kj`3Tid^Lfjr0)^<
+l(pe8r^Vp07+3#z<)2vJ&&iGLaS+cjwU)V#5_C0fTr`arrF^Sm<c!BEhNvBvEe5B>IJcOw(y?2$Tsk*qJ(P%ThpwI-tN-wmm2dkVWI$Pduy;=2rIHlK>tjo12VP2t-VFsM7C|(+?n7`7ap?G;u>oP58iMamgdoe%
+5OmTI^ktx+5yfJ#v|*%ePuE|J!KRxr=(}e<G{fQ_nec(SAb$22qA+-xaIuZ_UyVb@D|g6@4MIrT{wpNdq)=#MFdk%WxZ&B;WlE=_+PB*6+RzPq_}Xfskk+9W`671vtZ1wO5+DHm<VGhOR1mEz=4S4AOiIx+1|7gq
+8CsKKs&M@;&0zVvauV#>5pB)Wg<G=E><59QW-8FD*dEJd5XmlqJfBQv`8}qLTZv#Vu+N?Cs2_VKSIKRa+xf-p_G^)d=9VyZ%?%!Z^80hroUxfo4MN84nfi{gRQD%iQ-StQn5xvE2$Hfu`ozfcFPU73yXhSpc*p&t
+v72ePM!S6|B9|d5%fMCz=3?Vb6%m#$?Fg4KGb^}tBviH0JIwm_A^Zmdk-mOxz-w5I=^Knpv3?8^X0>O8OMPBfrzYAx>!`V%`};`W&2{uvzu5V$M0>gLtVhg*B|Vi6sq1+atmmAXT|}*vu-mMGN@<~$(gzWmebd{0
+DR<XNS*?>9$Tv|ZOSe8e_E+lUoiTd1@VkREZ^o!9{%3!=QvNM5>Ly{3x=NM$cBO2ZsFV<<8#2cJ_Btu0jSXN!R&KsVc4tb{#=xdo>C`dS)JfdSh2L`}-;;Cuf;Yy|ok`a};g7a&`Q!P*vz@9x(&&%}dS2?1EH9cw
+r}p;*JZ|gS!7!BK>YoML#F^6P;YLfK73=5X8h2Ka&hjQ~Y#rOf;oLPTd2g(N1xpNsvzI}6{s}5vCLRbsomAlAGhI*J(J6?}hAnTxv{^7+jX1L^D<B;WSHrC7AfD+}T!uQ`S*D7_pH@zfz}6l?59kTf=#^PUE@Nbt
+eE`d4>;o0UbIzr5aF5`bH&cgM210pt1?+(QT@9m6d%9{m5O*Ld?h0G?#tpK*?c?eeNPzD2F860^xYx$->}J#$IQjqXp&FWC3k8ihgHU1}>?AtHjJkK&;g+jnS6J!_FXo|=$2#z`Z72~##fCx-6<fHX=TlM_#r9oy
+%hImyBmY`I+VaJKy%wgUyRAugFL~L!#mB=19$$*OrJGpy-a0AAAyb{>(XfeF_rzW!*!B!R92e{-Dw0?p&Q1qcaXuzS)i9iyI%Q#IkH@8n=?44py0@ur8|H__`mj_VK3cCT7~5q)>k4Wf-b7nhSVbYK67dTc+Qh7Z
+L4D^cJ?Py@x9GEDtJdhq;HoKYtET!t4Rjq2M7Zsh$<h<ykrO$*?iVODaD6cw3Vri5&({Mk?b~P2JtY(qmc4Ybjb$#qu=7edI>>5v?%YXs{@Wm{ja_uH3m3b@!R5*&@+_X)Hm@L{q&vEBS66ElEqV|%COj7&W)&P@
+=jDDa%?sxwJKfTqx|ID4NsjPkHYeq9Ei|1{tie|50-&K|ZWttsuq~T&61(yP!LR5$ePR%q@TIRW_C>fel_Q;@D}jcu2W~X0MHcaVKR@((M9K-5i#BVzN6hHOf!>P1Dep%KVOx5B(%SfNx!d-^vPYAu?+@@SKQ%O?
++2hU-gxbm`<UHP}%xF$+LkFXyU?Uqkn$#rPc3HQ6IchCP-HSrAq!12#f>E$}O!mJoem=T=7Sl4_wJ<E68I`f7XR>d8SoR+&DEGO-)|?h&urw@Q7-gn}=^OD>`t4G}M~ZsPz6Znf1ywQ~3h*d6H$3RZe1q#>!?7{m
+%xh=`Jd!g~6v`F^;f)?+a9h}A8IyA~^hK78U@ya)g+t9jJXZhosx`59T-F?(XReO|hs!K)9O!QMeQyk=zCuTMo|`s?#O~4gkLBkqV8y^_0n3Gn<3C4vHecKAKVt80wrL&jj27{{*`|d%jvu29!}UmTEW(N<Z5{e<
+(b*?D21R8^EZ%8I3dN2;%m85gDm{QWPS1=k(!+rZY=U%DJZTU|=o|hcY#>m(>(3u;A9ca*2}#%KpjDHf1hx-A^!IrAOTOzw{F=l|@Z=(UL_A@*z{E~`5E@~DKLBFYx#D3S^#!2ao>5ss#8Ki16ZHT=x<RiCH0tR@
+Wvx03?8RVnVaImLs*whYLI^=x;03}S6%Rf&njl#hoiwC2#g~OiDvq}<;;->ZmfgHH+m7`>e!RK2w^nZu%0@`4hlrmM=}K%qdNhSm<q9Hw8q-J+GAf<Knk{`v6sJLSkM_#V;ul27&^x{$>M@u2;Vsg9wsIZejb=@6
+dV4=>T?FB3TV%~X)ps&GUZNJbssEyfkYYSIaMXR!F*+)Z6kc>BtUbB(GJ9hm6Vaqj*Pbw+`n>mygC6UkO+&=G=q01pnr-?0P}yaY+D5GA#VJL}%oX|u84TVcWB+@$f3TY87lv`DG+;9?D2!iw#C>Av1;>bFJSeDh
+5~yxVGe^Nh2@*fWS%&P391CWEp$n$k?zh|DcnD{u3)v1^8PDP;bj%|(%Hk#2e^^LwzbUu<0V+2zko|$YHUsvbX2z%x*ndWi1Bm0(d2R8`aBQ%jxlU9rH|bUXoHQgz$Jn`jG|4fKx_g+zVe;v&Ypkg07TH@yS`GnN
+4KQs7Qp^jHG8?Yw1*B{pBdX~xIz}aGwN^vmGK)XbAJZ`3(AlmIk3fa*=imPm)1R_9sffu*W<nE|8h6qGKxY0-M|!U`_VxrS%@OfSB7daU<3{GZdZcxhm^Eow_YKM6RUcsgimm-*r{Qj^f<D+ENRXI!zOCm|AonVO
+T7Y_h27pF@R)8HTNNG{+IIwk`j7pG<L2}f6a%sZaiw;mG4MW%uk!&_CcY($cB7Gm}(@MMjsQkyMdrewQ7560~zB`iUUB#`0eewd7lf>-5c^>#B$#PIq*MszM;B_K>PAFnp?gdRCGjM({D+~(mep1Awc^~B#Cx>PU
+%q!|K;0byNoR+&>)3TS>I@hFL)~Y)h<oJkOB59?MYIRphQF0Em=^QBwk;TbHOmB|B>{R7BN-p)Jd6#oyJ4u87*YfVWQa4$W9Y}))jGpQA6W1l;^dslur^G)JYUn?yM@uYm|B>LNr}W;&e6B1G-54|se?Qsr?=at`
+*|-Fmt^}_V`SoaC+riB5+r)n+y+s10{spDhT_EB=sh%o3Mas^D$(WZ$VBDue?zN;mCrvfbn@1igWVw?h_%%UW{r5WYG1lo1ST*yWOYV_*BlNjEYtu9gCWSJMx=d^cCL*W*bdGM`b2c8^XdQ=Ow>%fm8*Q2#EqL4M
+?{65I_go?!fP{dNh9MdR`_t`f*d@b?a!r}{rfo@S08OE9?07bBj@IrCm~aSM3dxaJTKQfyZw_O^K-AKn6v~^!^F}p_5Gq|zY3JFb(EfDmlA#!<@7&^)C$n}O02a>oNTrs<Zj(Yi%kChgOr|Jby_X>5Zh&4$9gsWJ
+C+jECzYsjWuGU>s`y}esE9-Sn{G_(#=TB<sZ|#rWweEF@ZsRvZi*-6JVl{C{qe(;`f2vm!Pw15bfKLE6o!2XKPwJIcfHNm!_noKo%JkEEW#Dw|o<jYZ*tOzwy<#5FD~}A^es*o*_vy2GWy7Fe37pd_zx+b4Ecx;_
+&Q18mSFvj?Kv%zB`7OxM4R}XkPSdH_vv`1q&)-XXH#h<RmjI`Lp5{4iJLt&(tz|lZH~{*JCJDd*@LhT)NY^`>7Bs!+>l=WB^iK)EU;_XHOc-Fo0277-fJK#orj>!*XQlxN0CoTcpbGuP4>JMm9dg~2?WTMbxCw}x
+fcObWn1D$WkT?PS1SCzs&Ci{Bb9eAcxPzYJr%c#lGQf8L=-(!$1Ed4Y1jq$=0DzvK(okFhK>wT446qyE5WqRA6NCQd4|5l=cY)?E(B1{QyWq}`-e5%WaS7ZcU80uPB(cd%it0;df_D8RnhFznLjP1^|39u>xPS
+""")
+ESP32ROM.STUB_CODE = _LazyStubCode(b"""
+c-nmzeNYtF{oUTN_qE15%HRpu?kx%jfd&Bsnx-r!IW=bLSG}M~r-Bi+F$o|Ugu%(~k=!i_oxnL&j^K1TlL#7GARl6g&4S4V4W#NMt&N(h84M~$AgDxTUw>~;+oYZ8AHREVfA9DG_1@j8GL&!FR=#y$8bT&Ck(U5~
+2q?GnY_Q&+kDNEL!lGO%|9i5!3@lsTe4dU%2<2bH;&p;-HAp5|E<bBRR<4-(#y5eTV+22+nl*}$e0eI*@$^*QivmJCk5Iw>sl3+#2eLcA$E;j#v$I2=p`CFwNDH*+>Vx*CM&Rx?H++XdY?A~Z0SBtDpNK!AC=>A2
+SAd#cgEh1SMb5-a7>)&D!XI2D4*gI{zqw@ycYcli%`?I}R6XpE`zmZAT(uVXIcRoM<l`Xus5LkI9XCmgnaC_a#P&&cB5yK7i$lW{aY-@@!felC+;H=UUxXCdfEE#ePy#)8^~P-s(PK<N=`BLQB2E&nz$T)y(d4Pr
+WKh-P0++$E22Bd$BfLYmaP04}ID#8){TB}*WB92&j4?8>ksRH|xeH@!XyDs0iDPd@F_VlTr*&E*Cj@O?Sy#WfhUZC~=iJ2P_d6_cOg!Icuivj5h!OVdI<Mf4psjO6Q}r}z_>62qn~Ba=v!@Ctn3*`fsir<lX_DqI
+tmTLeX#vgFkgSMP7;;Z=@a>hAcFG^HhvZY@4T2BJr`-nPnO8pL517R92=a_L8sP$-1({(Ap%8`QITE&8I43ZsMWg!5DE{QnX}%fOgi}%c{Z41-xJ|rCINeqtU}E@(?fgUQ2MvdG?UZ<p96-(7UOQ;8b+UwZjG!Ln
+_$<YvpW;GR8`r^x*e*C3At&urf|cmJfz$OqggALUQG9zN;*WuUrcK00XHkn$DYnNIuc6Z{MaOMS)XL(xh;xjCm+XtWDfc6&ofbbQC|@>0f!Aj(->RGq+T((J#rj(Fpz)9nw2Fg-01mYiuv0SE?PE;d;@IsbUo1j*
+j%-1}yO|WhoJ;tSv0X>(yP_rTA|5n?U+dmv#hxFElFTKXP_kOcdAB0~wh~mMS$JOAb%1i8#=Z+sgkJZS(ChKGeX@9zaC$7bD`XAPTWmcYq}+C*8<(Q5FPh#Jng*Dvp3qVhU*Q|W)t3)6^%gHOd6VLDx+(v=&5;nU
+dyj>1zeXex>;8%F#Bt8o#LhRq!f6(<Gm>8u)M&~1n|X_8)BGq$^Y<5O^?elET3GQGp?T24MBh%8bb%16mu$6~zkkII<5&*qNbjT|Sz^g%GwO1pmMd8NR?Bl@4apUruGO9R0A^+e7Nd;j{Gbb(X1*gOHzVVnCN4EA
+;}`i1l~OQ&F)?rwr(5dcIQe73yF8sHHJqP@3$mAIt&d%AD2Q3RYWb7-ZXGdl!%-|f{HDVo&Gx@>l~~nBnzA)!P=APu6c*&L?$MR<M=PI-Du`LIdQD70cE)ODO*Rn@Gj!SF{3We0>q^dA`4|8OW@;`!0lkY*9n3=;
+%)__f`~!e>^?-jB<ELQV1n?w)0c4l}3?ox{F~B<tj6@y-xY;lRs-ZqdpjHcfh~JV*^SPNcACpG&0|1W!WWR*?fqKMmgC5Gb8pRhtO+V&^n(jr;e_+PK6`B^xC=yQR=XmZHIE>H|YAKhKIZ1-mhnc0JUY5B2G3HuG
+W`-1;U#He{_SD&PkK)dwWKt}loLg0fVb*3AA@MX3Huqz^vV|nirBAag=ScQa^kN!062H*2{YAS@sDbwr4rg#Su5Xh03A?9;v5KFO<FNynnbjxjx@6t?7Q~;iqXE0nqYHttpJ?nIc*Tcm>cd4}+^gM6v1QsVWnhd<
+G;AsjT)vId>lhc8Z}+Y+SFT737!z_TqGyGTh|}xK^pwEaOE|W8q0N=38IrPs)}aKBTVW=N@50P0p<Ww_!F$-N*K@!i*;$Eo?!YWN;qOX-xksYWfkX1QgrkEL{?MPW`xN9BR43#l=VV{!9PX>o*IeIyaBp5;SW@~T
+F5zSsB~yS?0hcf%8G7^rDt+PK2W5R3B_-wWJ$}S@7Nsp=jGV0Oa!|gnP~{4ytldbG(T25kPMg+kd&%#Hy%CeSJ`J}Id$=jL3o+52O<CT;>0%WLn=~f7YTQRqk`%>6yFWo_TcRtA^|ONTj;CKG62myPqB$;n10(sZ
+eDPUrRHROECq~)5$^b_<!+kDHcpR$F0JVRuc1$de$n|`AQ{WWFfgnnImE_!WG@1EC#&0wkmnI`JJRvpwGR$q_Rgy%}ZLm!@y7!`_?rZdRFgK~2qFYdRR%;?dTpW_IoLu8;M$F9O?kA;(*fu-i?eo7+(M_m(RVa}P
+6y8G!Kg5ma<XttsX&UL=ACbCWMXs#wRjrBaHgE78q5c3n?^795<GI=*?!>*7oZMKGZVr1<LyF26LuR-L!WB)FTZ9OC`$xf8|1O<t4Py+*SK-M}wI^h8#8=3{41e;tS07cTH$ZumNNky&Miq9Ug7xZ+f}{hC5LCQ!
+FJr8C?Fc`EM7s)-117ZH92<;l%q0f)SIng7jmT91)5~3i5^6~iL&oVMG`V$n{mE7R50P+)X6?c;ZMQ%U=_g327E^8yY8Y3=aTRKKn>m96)i$<*Z6!5bX>PcpGFI&*f{q|Bs{ex;`VT5u>s7NjqJlP>B^S3)pRMJK
+*!dt5Ud(^x?dsd%dr<2GwPV3^2YZhk7cUU%?p|rkb?>(LR%_$A{^KQOwj^pA2s>$E(=v{6cePpKgI%B6{PUHtfQ!L{7qBMWmlR2U*omBds<dibVlCzDRVyimqGzGbLy(q}RwfRTu^S3TNZoO)sfG>ONS=c0dJm}E
+&BF{QAMyWkl`t9u@;rYwq?>*4tVrF_xOpiTH14*rs*<|hpLr#=?d11Nr8T?`GttG8!?{=Wa;VPXmHQcECFR^hltv55HH;Ci0j*T;JX7bC;Sz1Lp;Wt$OR#7B0O|GQ<eZ;f&xE^H<@%<etC<_n)!~zBX+XW()u>E9
+Q4zhYO#Zwgx`IBTN?D;$sj|-wevXMdN%)+8wLwy~VI+;Q+4B_6UJp@AWChO4SW3G3#NQLL(4JxOWwHq?DnfUwgBbNZraw?oS7ciC*x4So>(kNDVF#H94VZpc{n6+veQt{D8<lbdZhdTEzck}zuTYl{wOu<#=+|Ot
+tZ~tsGYyT&yIL=kj#;VQeKQ8BuEP#-3o)Q>L8koC{Ks==q-M>Zk(<LNDk(X>*HlpA)l+4M9iS(7p1`r7#&g(weI@0a1ATSGor>lzQ^jRd!}^rcvyxI<C?&O<{ard{LGWDL@r%7g|4Q6?Ty(2#y5ZiIN7OT>L&m<|
+gz;Vn1nXB?ttAawT1%nhdz6DoGN*Lw_f@nON@M$a7|TJu(pDq%DDtuLfu{4Pg!XA?+iGGj>Do=CUXL6n@&)1_RB5fA<QOptyP3MK+<A3dmAtu1ma_BhYk#W-V?Rk*O>a~^%|X|^*o8spRr(fgP4qN1is@P|v=oX-
+WG|+YU*8ju6jxSk*-pkH&c2(kpOVd43emq-wRbJNId)U<Qg-S6!RZ5;OtjC4;EAHIKJS~3lA?`CoWrM&Jeh@*M1L@q;oxxGZ6bGxd^$M@FQycIx=9<dUinP*xIah}6eph|3aTvRZ{2UVmKT<lZ$|L&sEXR~Y<XGb
+=8+-T8=fjGFWlNp+=h3=$TwF0g<&hd@rsqFFIxFO4oB7v0NzVhega@Oz#o7v4%Tu23C<jst$fFw^%>wf`UAd~VBZh;6p-0{!OAbav;IGL?s8;ZG7{mdvJf-x_&^>#8UF$oq{f^
+""")
+ESP32S2ROM.STUB_CODE = _LazyStubCode(b"""
+c-nn94Nw$Uny-6?p=W6049f!YbJx=-45*g@RM4}QCb0%xv$g)jS+v|*@Q00i-WDQzBNoYZ5AM*IF@Yhs&Y<2k6Lm)uHbP9q5UXY|&f+a>Nh*8Gm2peRnXoP<fPaWizx!SfalN~$qw1U2@B4q>U%%$@L4E!11NHm2
+TM%Lps>%Xbi(+MFSXY!I>th_|P$^wLOIDkn<K8+xRz8Crdc>C6WeSiXM%F7z{Y?fX@ip|g=N`6B5$2V2_9Q|Ri`BAS@5IUui3kY-LMQ(cE1Luy=<a@mIi=og;TAE}uQCkM1MKUhS_762KS=i)+wNje+abfomyTLn
+?`2*Mhws6zzY=vEgEhDg#c9%Q3}jKf*Bq#jZau4Iz}R^UcYlGKkEcZ`)HvRp@uw(5q*_eybJ6Ia$>t*2v>4m|h&yD~NOV>r;`_^-Q1-H2AilQ6$dP2DC@yra#ci|C?g%Sd0=$R-gc11RRHvR`>nvs&;B@amAR^5W
+Dc>u^q@Qs%XgcV|X_2>coL<v{gt+Xj$2j$8Sen3XkN=kpVXG8lWf)_m=QQ7}PjKlAsZ9ou+dYF*XA{^NR$mgD=jX+M*{x8mYnuc?i}Nfdzjv|Bvzdb5()tcHm?FMIb>G3~0_N@s&D1}jw%?P7;2vT#WON?HSw=QP
+=xAy!4tK~aUufZp54B^nWenIqw1W~(0<5See(%163m@T2RF_Vg#ZVDHFtN!Kw`Ix~M6I&9g(63r!fn%72~t`F6`9jw-%CWkCL+qhCZZqDM+nX)UBT=E-&$lpULLSPFjl7Lm)h;;JNSZP`|5I*&aYg#mYit@FEx2H
+c;yO_9o$EeIF^5iE0=93-kG{nUzxIP^M>u^4oVB|1eVvFPS?u|n@@d1gl~~xhf;=gmuP89^FgWiet(nl$);Til_{&XY)z?LX5SLtx(t-hJi%papg&#$Kt+@=QAi2)V(t8m16_1;`_jUPIGTV$IyTGP%}Ec5K4~!y
+Qb=atF{G3364aL&pGQrQ@ETn%s~e)&#YNR99soZjjpLHQybx29!4!U}<>EyYV6rC#ViUkysGSe;E`5#%=n&Hl#r2rTvP=tfUDfj%T~Z0kZAxd2?g5oe7W3P)CugAd?g6Bum&&{V_%6nCHTMLkZqs+pVA=HX2>9)1
+KHk&)05=YjL?yMhri5j4Ydl>^vZ;Ftv#YAkT1Z_cDYCiqYpevG(z7RRi>bL<-u)1NoY6LnWn*UOjIr$+W=)3!{5s?wh_DO9Gfj$EKX^F!o^Y1u{O#UHBq7rny0wdzz99$5o&-HXB}`nL)#@MiZY2!C_F00;bz<TX
+4l19+OoBhRa=qEd#A_m`+#rqk5NkSC6-8+jq!Hgw>hRQKT;iM5x^C|#BzWs6!3!(98G6ua4Gx>*73@d?1~x@lV-a55Ii!curltFHHS%QJkREbOc(t<mJ}(r9ow^twOfvK5xFFX9lnFxVqO+3Xo-EaQ5aN}c#IW!*
+Mo@y@k0cq(j8`k?F$fZj3+?m>9fCSLKZS%=Si@6KXT&Iex1(@7_KrbKX=N4+qNoAfg;lzTpD8v+0+~=IuUncVTMva$+^_7(NzDiAj?TnzjU}UItAS0}F>LNi*i@4d4=kH5$d-y;+OY<88Ke(1`C^28C$l%~58n(}
+G6I5YXNz$t@e&0mmVQGRfT&R*MzYa+m}T5Gsjo7g?>;587)dn7@TJ5ql8Z%OlEHLp6b~grJgZJ~(urr)$i`Y;tlc7(d~n_eeiD@5DE=aR^aAa;fjwWrkaauu22W<1&nnU&k#w4HPcSKH*lX@PNAw5L!`sOZD(3eD
+=K<zmUvNFjba|$5<6kaxL~1G+cWy>WFWvmX@p$U0KI9<HuM$l}dIW!)zw6on{Uc^ca87-tRb#B|hil8%J%OIuE7HQ+)s(Qhi53{dRGDGV!h5t-5MW*-WRrw4FT4lM0!fEjW(H_%1=^b!i?AL7H~_E#biNF*9q1__
+KMBG_e<k2*VfJsIMuI$oglkX>CjmZ#x~K$D{tF5ET1r5_pagLpC5$hJ`Skbjj3~j+!86eI!fa##4&_tAfq$Zen=VRt3sz)D!YjbHB7&@gP<{EG(wB4R-`$5(Z|e*1s^!xvxdiAoPOJHP@{~|Lp$3&*`G)GR)hgb+
+<0Pu$$pFYtkVc5`T76@`z?<2HLL9Aw%3DXT=b^i;J-G0F4DYF;JEWE)m|Y)?*od_&nD5jYG>prqVy(QTU?Iq^qYFdW`k%3)9a>6yaOx_9^@JKZp@wL7vGi{$nSRGtCqdtQL`--8D`r`?L+YJt45>)N25^Ypq)^iP
+T6@q^{@i+wtcC5`B}cbm&RYWv=<YZ1kcr(Uoz@t<cvB~(@hmZY%Oz!MBfgXTT7Ri&pa(z7x@_moeE$sl9q#QWHc9Fr<f+#%o6TnRDAZUd5^h+~phfJXf(nw_HR%St(Wn-z+3|<P(Nr?aKvz*BvfJxZ@9N<Uu;nX|
+6jQY$?F*l^NUv$Oe@TA#y@DIZ$z?4u_#PIE&E~Vj)0K&HJg>#)P`s-5ZO}5QPwjccCK4Gvn+!{Xo-fbhbrfrBkofX!_s02IC9dS0tO{51!Wv&LuhZ4(Xpy(n@?6aeX|^2gtoag*Rg}eh$e`@!H_j*dJc)Z0CK$;g
+2@T;oosI`VmxXh2RsnO|Jy%age55aW8>aNvB;7&MTe~~4VFZH<S!?r3OCIo<hKDe(pXa#x4_}}ixg?Duuh?h>Oaeg#LY6HLrqdlHEqO|E_uECW{=>>oJYS(D>sW?Y!bj6+&n?s<v30L9U5UirF|4hNjuE@J0-E&z
+W?u)dlX!wUj-5p@&+~{)cBU=wkC<UtB}#v%jhBpNJqjC)n2AgWHvEPhJ=uAoNXjE*!(x=%Y+#c;QNSO_u@!U8oG6}m_Ns*cA8~=}c!uX8M#{V8QdV4FjQ@0!`*nDbHylGq5$`$ERgWItG51>{QVL;_BhG)H75Olm
+j${jP=9P|mbee`FO~dR=T!S;HIu3(3<jlFvv?m0QOPT0tlzZX6rxCo&y+C^u)LR_NsZ+F8YQsuiQ}h^O7t~z%@qrh)GZrG;@A`;#1W@nhP>!$qIl}i->>p)m#n<GSr|}m4Pu@3>t(b6gE_Yy*@bAJ_XN+b1qb)o5
+PZu}vioa>8F)E?94S)?A;UySt?w}nal5^^QI|=T({FH4g%lMRU;97q8?Vu?=Q&s|Ymu<REm*Cdvp?*Xc=hhh@0<|(%r%M!F6kuut;W{P4GOc;-(Y<J2X$&;`644Q3>edW@32|_sc>!&xLAD?HDv+ZZWwo#jn+z3U
+s75pU$9Ilw9(a)igiVyXNpBr7K|~DONU$ns#}?FfRF#gBhB;sqc<{jtWgH^K-(YO>sce!)iKFAlH`M=wI{a5uo;Ej((!UT}hQCF%$}%lo%^7rbHL5*d{(AeXrp70R=MW0542)ikTpgAU5nlgjZ^V`_F9;b2hDEnI
+m!1cTMoioi`!(Lo#jjqbOqcJf`9jGj4hh#((9wU!nr=^SJoQm4vc96qn-Ao)(AJ--4Kzy|vQhU=m1Rbf*bGR-2`HCq1x>Xb?Oec2auleF{8&9=9A|mus_T23YbR4cpYuKaQlkf&u%O+)XFVTaPMA0~TyVrybSL%d
+$RoBT$x)5LWKDCL^#`g<d(+*@0GrrATh|ez$zom;%fNM9D^&6s=&oi-bL_x!MASYCPgQFjS%sbS2V@@P<(2%+gCg2<P38Mz(Dv-ZybH8pNZq$Wt(|N8I^|PW@=xlN&s;v*U`5d@Dzsm5X%4BzAL1h>=g-c?$0jtD
+odncsQ`_>jNl42P?)>sFZ)t@{_Hng+?k>jO*DtNmX6@VK(n9j!=mw47RtxcNFZR5v_Qa=Kp9KVaem5DsoKB`k367ou?q_FaT*<!HCw%{;Tq5#2Q#buuPCM)tz2y+fmI(1P2fMATFHe7Zf!?2YH1ubJ%hbM4(uU}s
+%jr@I(cxWHq<pgSN2O^6#VgZFOSqhHeu?xPp?KuDQMZn+yPOVoOP7m02L_#&jSn`_o<-1iR~-eYa3UuC{K>d3zwM?RZYh^@yNt~}6uT-gdS>{~#FO0_I5aGM5gU)3p*qK6H<(L_{gH*!5i<nuehe)2<_?)cZT?ZE
+FMKgq;lsVUv#wCN968&^nl9?XXPU&muyU<_uw(4H*fsCwnWog+R2S0{35;GHCIMOmsrHW!47cb=9UwOA1ncc7UGCi<E-MTdhky0{{r~WSv%k&X;@PYs=euv&mZxrd3z|7Pi)}g1U^@xTOL*=@_;GCRvQ~_x-;-yD
+LxqWyTGU2rX&ojxe1DGTmL1=uk>Pu)CSd>eo8klwUllf8b71~p5e)A{1fQ3>#xc))l$)HG%csM<)jlu8{G8@M0m}n%+QE?bkn(w60KRndbxRq8USqn^INcmD5EQRmC;AVX$iG>BvcJB%u6_@Ki{Zh9-9N9dYuKZg
+;aR_{y1sh90;1%OxBhinxB)QTN((h!T2Nn)uU7#6bc7Z*zCjC*VEw~kT5!R74PYE-^?)}YiLbu{nF8-$<-UM@8bHaLv~U*m-fp3V;kotygU{ZGuUF^f4w{IobLSwJQu}`cJtY7H
+""")
+ESP32S3ROM.STUB_CODE = _LazyStubCode(b"""
+c-nnf4OCP|macyN-<D%HAuU34^7<*zO)%llw7AatIvSM8&RP5;#JD41B$$)kgQRmBJtX^HW17Zbgw{lw=$S`HG7SqGWz2{{lZJ^5F}mwyCKGmIc8wVgIxzu5)ChF#t!gyx?m64%)T?^;-FxfSy<gqB)ss6ko-MVW
+=erXTN|e-P2-@GF)5|o_KjKF6B*8^d9)%1;8ieFq1jZ4Ae3K}OCt$c>K=vDy6yP#OzepWJ2pJG6vq3XM19|%t{k)iSPtx9@;rV?BF1klap$6f_*#Q+(7tnw<&^1e_<VO7y#6C`$3plE9;=zxWJ@+rCm+h1g5=Df%
+|9X1aEuew!BR>#c@t7@qT7l~IWSxA21lv{3Axm2;NcS0AzN1FA1>hx^gqoWtQa+4EC*W<c6t%qpeYgn4zsXk#e3qn%hR{m+(!E-SjqR7nkuOQZfw@B}R5#j?{GUSxD%EI$$8lpJM_-Q9mqugDr=%@_jZ|kTqPDN&
+QQ5j|=7*MP<|d;gEht$<T5jL_#{8BAyofe%A@IYhI;M#IHo*qq^i?1biF-d-MW<{vlx&YXzV5mtWb?d+X+dIK_R=J=K1<}UNz3H_lA&y)1|;@DdqhU^Gy%ukbUF;eW$Tt>15Q5ong#DJ$hpQfmUpfWxf|_`mj6&?
+&B15z<MMUNUc4f@A#a0lIq@uJF-ml>dHFCOS4U~p7jG{!z<N%YkT?wOk#cI+mTyVU59Fk(M=jr`oIf|=gs-m#RKYN64wxHN)b#I2%XOlJRm?+5fM>q#qaxo>5oJL=)xS|Xy^PF3s0y$_aXLltyx=O7eZU=ZfUgRY
+oQt!wkG2V!dD%<d1*>vy5J5q?Y9v%?Gww6W?^9KUYQ&7XK^B^tk_F`yC?<p;4cI*a{=r5hA|vxt&R>XQxz%T(XuC|Tx6Sw#)?`F*U_MTeq<m??US4ES93^xO7l{4OMBtD$*A$sA|CNZD7VCs2!?9FurxVMg^f@{o
+b2zyZoNU`8egi%qR7UVqPPa41X?I$jDtSNS-AA8(4&tL6vdf>bc$suOyk|HH<lT(tk2CrbW;A7C{8SI;EO)Lhau?+k*^4YiD!HDq%53E-B!5T;IN3iNA;)|?PZTW8jjA(=QlqNnebOwLTi&D45w;@x1`@|0!&^x$
+u|d?taJ^%>B1E0b9rL>c=X@Fyil?nqYnILrp+WN7^yNoXUE}Ct8{LgLA$x(PkzxwgoY1Ri<c-X>4fIK&1qi#G_&&o{96Rovq%^-cZ?kpttkT2{Yl}C!VF@&Lmr2!%x2&3~1<!PROW)5>;IH06suI^|k@Yd1{1~&L
+*yC$Q#kEoIuMKC_C%GP-|0n3Io(|T0LL;_if-G5IT<XTgLM=jr?I^^sc%8JWYCct^gqoW@WxtZDd!;7|zNr3flty}-$Pcm5Xi;3H{0YOS;%WMspnM=at#u?W5uAyR{A_SjJ}hRVp6wGkM)`cEBy98zPXT_MdsD|K
+{nkD7=^6S7@^8ylK|U^qCZ;1XAKJNe=99YN9<E{U!kn9A2yBk1vF)S^GBb7Lo>*9gSbmPE<?krza`NXxCWuL;IvuOes_=uk<tV<PT2%l?S7>&`P?>DVxlCgnUJeOAb!-L9$w70ZGrJ*|%jd~37cm@xWHia(V`zj7
+(5$<YcRIc!P47aI2pF1H#Zwsd;ux`JqA*1H#+~eNdfBSGGF!&T&rK(mzz)On0%~kZSyiOYxkz^9`GyCi&U#@vQbf<0uH3i9>|7~(-(Krh4OM!B6wX0CTzm~w%~jHUI_C;mdc}7iN(n$V_pL<@1#^6Fi@OAz%pckd
+k+F6m%+cU|PlUD160jkxuz21iGw(hn3XTn0!pdiK4d0Wnavshr`1zF28iIy6T*Aud@odFnw<LE6c4(MGDFT(5B(C5%%g7sTNaO*-RnU8&Jz}?qe{YUwKe|a)pNru{afQXFMdI?!XEl%;xu#ZX&szkJ9N0u-GpL$c
+LcdbsYn1XcLClMmd^stEXPJe=JzOt*U}>d?v(2J5Kvq-x5fYTm)Q|wgaAyh<_d(yBayMQhq<a^>&s|Bz@>ET|k(m(nsE3U3kSFL15E+7WMs~9Nf#9UEfGSI^)YtbItU&~)3|$M@8lOLPtc=ChUU4Y(LZv0S@<|<@
+yGB73zc&|m@S@kUrZSl-x=B_Z<AxqZuyKx2xuJ(qOH-`)`KS+4u6Hx+PH=@a!eaZ{j4yib?659u@Ksu0G!!Nvmcu)~Bq#MfbkC-JMKRZLk(||=kML!0@$r<qL)fw2_0F)bT^|itf`?L*0~bP;fFU{5YLs4x?swG>
+U4^sOSNL4`P>Q)rk^h|vm6%9xcve{VoVounRoaVgUQM{Ma!xQj+Z;N)BLo#hiq}6*>aOf>8>n2F5Ny}`(vzbhOLC~u=<4Gd-gzY+o|8I2sx*VtOCw|^MqAFa{qZTm%p;dcd~f{yDtFOg36-@k87Xdsz7JYvPU@bc
+&`&|_(=EBgRvwov^|{3EmtCR(8OkI(E;9q&40T&E^l+Y+Ef!JPfvk^~!I6ftWT?qRT4;Q<%nYrr8I_Segh<fugjNe}9n4({Z6kb#a<FU+1nGPmf#!kpR)YLh3)txc3_T6a^8gaR25iH5DXxQ{6~h=o>}^gYF33Ql
+0qTOkz`IA*hzH>N6f^_yM1Zyv#?L`(hUS2?c7$R^rLqqYY!b@NP=?JotD9JNX>v{w`w8McNt2UPjXBzB*m(7El5?DtA7>S#me!iOx(V|Nm6%5hhXNgC(gHY(xW@$@hwKrO^EP=@L9X1dDOjQeKOP<sX>fl_gm#wn
+-y=Djr<(;!=6qI#x(^Zi-%J<Lw9(N4m4fxQ*4`Eycq10!@PqQf7})7PK#m+Fwq%S!qEi#cGfp1sQpss_c;s~g%=gQ^Y(H^w>P*khM|X3)G%gl+wk*GuLH;1=ZgcMfrAKzLl>9W}2YFec67~jySKwrz7I82KRHO(U
+sV8Smc!S)^R7zw`yNYSeGTqTDbL?o?%QUd!(ZQX0*Y<%Zn1#VxIFUb8k7vnEjOi8n{0CE0n>zvrk+1?4CL)_3Cv0_B4Dg-hTXQ<?ot943wCS43xtbp0zl1}a)_>1VgJ6wHuvJz3?yIsg&oh0hh1#Wle82Y*71p}<
+O@lQ&?*Wb0i>UocBG<6_o}yyoB?PBp8&0{{j>OL`=!~VTUxiKbvy>%g=XAv%9t7Wj-D~uyxY%R8U&~xfi<Fg6&d@-F!`q@=7I_m>`V0Ep_9&?v1(s5M-EC>T+06K#)XSxe<q7(vc9$^TjF|h%6my%k;s>m!Vj7$P
+-FA)O&KI;Q?AZQ=;9lfgonmu&6BgK3dK2uGLA#(;*JwFOuv80t<)aCXH0E6A7c?m%n;@)Cp%D#{Ud0d|$fp=PKzg-m0c83u{NucR9^v_kmA%RFqo`v)oG#x`c<yKU;WgqPAuzjbWroXjLrBpXRY(|o82tE~M>$;@
++BS<+3yOnN;0O{1V?eiMWE|rP3EHN;`=w?uySm!*n<q~Be?VD9ST88i{fV6aCffc5uIbTJ1Dgr!FYRF!(W~^C_A0@zfX%`nqqUF{VY*O6IHBZF!QcRYQq!Z64J=i5Ew;f<;;GCY;*U}mk1LKjDA|YpjM8_4FNa2u
+BdvB(wU3viqa`CTs`PKk4xzhEcZ;}ZPb=MSp9VGEl7;DbfnM|J7%kJ0JWk_ly&BVfL#o5kGjoT2g%oL`q;;y$gxs+yMfn~C4<yO=QNbZKs=I{(mR(*rmgO&*=;>JDf5F)WRFL;BKJ7Om_t@0Tgrl;K%IVmI@I>+_
+Oz3t@_c5KXBxBnD3SwSM-^uBqjL<LC7e-L}(eHIH!CKRga=I|;TNFvd)P)@~Q8McN2N9lEd300YF}~A6Wd|GH<#cbLzV(r`V7Zm9J)Z>aR%L&E;ZGQA{{LVtY(|bnl$o#f&G6?C`@j@7fKX$F@bQB+6`ayqztE_w
+M=kwRSRXdRc|YWB<NPwJP3!$&4D3C&pA(!~tPd*R!gY1W%RWO=idPC{AIrGz(`sw98VNiS;A^xx<h4j%-lx?|0TocBP}HXkV12V=@6bOY`OPU%9W<a9jn+_d>tbr;uy-D(dj>g5;pSCXfozRfj}rh@x(ambh0!e|
+>xUnsE|GV{SgrV?NpaNco}%tr!4;OEmQ68vQw;V>tr2b?lGn_8`3T)R+l?(7Vt5w&5+}!rC9(fQTJs|*gXKA+{1lyyUXaA*d=@dV(*IK=u5iC{s_qt4jgh6k^83M|gXM|xI?6m~PxRUEcVyMtA{bm-U1Lt?W`nX3
+6Yt1AC)}CMloA>|V_sSC-q1gjN?5^5gsJzZ#{n>8NA`zff%Ua%jhy|V*me$cx>Pit8N>SFId~pKV>f{2uyb#;v7Qf@X`oum+84xLG>n)8<-=n?U3>UKBIqmmSIt5Lz3^qe9H@F+Xw>gE^4Fr7b;okAS*u2_n6}Ru
++C*?d<<2B~V$3I?rX-&-jP=_&yO~a!AZ65JJzS3%Txb3w=~zRm+2GP@Rvs0TlIw?QO3BD@J#ZtJD~!g3!D+}G_$FkIp%bxfWcqGSsZl=mCTyxv{^$*IIy)+SC+1jGnnu;+lijA0XS?HR7n~|1>dtNB(=FrEG%k8@
+YxU7ZQLm-hYp(9+`F>xIp}2ogCUm!j-yD@E*mhN72;D&o%^(|z?m!Ivm?Hc6-jBw@r;_Nm2Z-*q7`iv*%GaopZIhG2;8?&V37f6CZwBV>@<~l@mOH>OYOI=oHNgzcTl2KR3~qnqE4rbs#NfUdnR}M&J(VP%r+S)}
+tWiFA@`=*9nd_gNTk3)u!ReC!#Il1I%!G-3TCV0)63ktiCkZ@ETJo6b#v0C_0h{l`!Ys7<*VFRIWJK#6R|3&SIgs9CZ0J?tB>=f_c_IzM?O52JD0fYFsz$Z#oztHiPU;5-mR=v=sSi)kx%$%2nj+&gIrK-5r^7|N
+Put~<$gqO0er!6fjds>c{ZZwd=gh8)pGiHlFLc&-XZ9HG0-G)vvjy9&0PjYvjsn7V5I6Of<~6+#-INnuAANn%_kXGbqkrdIs}o}-=l3}BtiC<4uXU5ekyi5YtJFgRnK@M(sa^8x^y$wB2v|REqThK!<LIO03mnot
+6l3=uxL+LP;3nlzH-zS#$;AnNJzTw<>bi??>q$@0rwd7bb^J;tIp;ToGO++3uNTr<Mo`XYgiJWWsa|N%X&BSzb=Mn0I!Y3h&*%g@O!RNdP0xGEYdl*K6udjMTmH#Yvwf?y3&xtK%RS}KPtp4q)ULmH)g|WbafvJU
+xx|yuuiX>xQ=47lk`}0;p{<8@Ww%Q_2ed30i_o8gzG|ko1OH3+$Q3}J33{7@E^#*KMIgIyrvLw1W-#8T?TyQ648KJ2Uy@2=(9VnvFxJhC5sd9@04dF)F`U0=jPHzrC*dxgcVJ{zQ6Et^%=m~F^4b3lvEKSY
+""")
+ESP32C3ROM.STUB_CODE = _LazyStubCode(b"""
+c-nneeN<Cdwm&yFH#fngKrf2E!9FA{w)CyeC}?n6$&K7_`L1?JU0R$*?+Asq^NK=!cFbCV5K_L3c%?yyzM+glWt@2m=$*kbBzz=6@bg(dd{EJhq&m+5W`GR7Qr<Zvnd!_Q^T)mCoPGA$XYc*nd!KXu?;~;Hf&VBx
+6cG%7CN!!yx?AE9RAOByt72U0kpUr2tfRzYFh<u@)_7X!DCPvC!AcAt(-AaPG#6ZA9T%`rfdslthw+>lq`FioE_L+PH+m)4qXq>r(CPP3G8wR?Q-!l?#l)ZJ{fzSSIBZ+WZKgFPDwWuWWEt1XfKQq}%)N$L>hGdR
+AU~;TF>|XQ0uyU;C>scHB&)<gu$*}k$db5f2hhXuHi9BAC^ROn)*~us>+N#_FR>}ORbPTSJ4FC_iGi2gROqv~+Tmr&1x1NLDC$>hLU~hPhs3c@&1ngVaJXO1o7q;pnUvx~tQ6_OOICqyiM>R5VpzJ-sszmdA7-UB
+xxASabI*B2Dz8gTk!<T{xgA!#iIfVP`_%zCd|A?E?q4T?vdJk`HVjLZCrIhKhJ{^j$=o-sH1eOa2~rz8(s4nx9_WsyeOfuUq*4WXB?e8X#4)ZC;GD9F6sbrct?Q{v)GxVqwbGP!Ziy&IQV`duT0aiwX~bLCgQP_y
+E-v|YL5Qk)U22{z#ZqnfITDjNqPw{unOLjZ($~pS;!>=b;fB^@Vy5$BzC8@+RVH-=qmmc^Wp#p66DkS7g!v^<WD%l)ZlwEocilGql7_9BAlO*hBf7(?eDQfKqSqH0q7<|%7K*TcL8TI3SHA}+f?2Wx*OJE&Io)C=
+w6&gAmiLm83665rvbL-sp_jS7v_v>twLad4C$XCv0E!kAA(~LZ=~7D^yxEKqtkU2C)NmiDa}v4w@WCFJbD{c&wJo(5i>n5dEhNyW)<C4U%Y8n;LZb!)K8U{B%Vs(x*Hc|B<;ZsK&$Zy!rRQw;OALrUMeXhf5y@QE
+G>BlhA1#P3ZPkw_)6r$uO@96FqqxBOc#@W9yRzvfYql+$F<G*Ek)F4iZ7HoONZY(k?{^_&e5=3^t~Ft;bkRy`(@GFPtxvVKU&W#bB0+XywKIfW+bu}sy1FDqMZwQ@Sn3=^&Tld)iNrQz(SJxu=G6t3QOg(C1Gq{Y
+N7SKqg%*v&ao18VFb*PWbazy5OQ~<?iT+=y70bKu5)v4P9e@&(z(jVFcBAr>dB976oGZHnC~^YlioD=`m2#CB{4K|kJd}srzdQsebF?aouqn`vySq@<xxe@D+X6_tshAT2wIimqO?(M(;U~W%2iJ-LA<j@g5jGV>
+4`ezQ51R583!|>3_P^2hW{>0sUt0QfRSj>Jkxkas(za3$h$)XYz2dimUX5l}ONsmrYg+}Y+3<UadJ#{Up7JC~QiN$COxj|NH4Ota{<XCY_F@9QU%63h*Vd{qt!e+Nnx}L=bC*d?=}3u5J)Nq6NHvyohbn+6FSBgO
+l<G$r^em(N1ks}XG&&^nRIE5ovqPYWA4sygP-RK!+)%K1kjTv(e&fqG|NBQbB=@4mqyHy$bkD8**K!8(`+wqGJiMv~;!7r2BcvVH1P6@GzqFLUQqfv*xw0>oCxK{<T_8mu!N1Fd)RfCT+(i*T)*qo{<<LGcc@=sj
+w%h{(+UZFBPbvAU3%tB?fr9ghCrrBEI%zFtV&%i2t!fy&k-;6!ka06-aLwnZ)Qu)7R=w%Bs;DwK7LY>Yji(w<a&rvcW<I0gW)9=A;?p$u=L+y<DdNiv@U<deWQ~gkG3LnL>Wp8=FtFc0XE>u@z_lB&NmI>h-0K8z
+KdAoJgsLOi2zBnT-nA+#n*TzGX9V}kvx_yXo0y$nMh<!eq4&>`(=8NiMc5sP-LW-m3-Z#M`^aMfU+LzT5#64@^X|^n-5tAQ_MF}m^w!g~{Per&sTmy^FF|yLU7D0N1-#i?ifPNfY8-32dv)ac(Cs@zx9{Hk>iUDh
+$*YfDe{>{V_uE>3af9NTAeQUu8FcocQ!k?Ti*)^Aiu9_pZ3`COL(*RiQUopW>u@51nfV#-2?zDP*p_v6!3=aNc4RwWW)7mr@Rqu6%1p|Xkt9&5)>@Pe5}0Yt&+=vDin?yz><p?)gw@pmbG--62{2Dp%jX9P`PeJ#
+8k7wrs3F}?Jl|?wt<k<CE!eUzR)D7tI$_r3CRmk`Ua3IF)9A#7mGK#6<N^?m^s9GlMkg*`p3=(6h!A1DT&HD!Gi=go{k3)Co<PLYSQ2j{z+Y(-zEi($Kt+gvzurywYw@(e0$u&vvWGL3_rs}6;h@;R%D~%m1z1}b
+!(p8WG397-1Oi}~7G^Xiq`K6Ke1A?Iqbe(~=+nmLe(Bsj<1hQACRW)blPX0sBBS$rK*lPm`=VdKk?2ka%N2X1J6O)*k-WrmKlcEm^HqR5Uj~ijs3nx;K7o|xN>HDeaOdon&$P)QJ2w9vN3MqC3cX@fu@>V{#d-+;
+6VF_WJGVh21S~h<EB!Xmx8Uii%VuFtiy)RE*-n|z5A~T5We7Ob?N$=!nG~6lxXDR?rBmYRVAJPE!l}dF;Ql1{*OT80ANH$*NWQG>%4X~8M3EWRTAZJs4-QRo=M8-WV@HH|tCP5|CxZgKNj4uZMbaX8b9q*DXDx$i
+i{mhDL0s16jLpa@eOOUk(JYpZF;vlPaP4bU(Ko@Jal1FWpA$buK1*S_1Ky1?*8QRP@mx6X^#*Tc-8%1M6hjpxj39f5wLY=LOfaAQ0p8DOyqU#Lu^)sKYcVai=mFN7g9w>6f*~H=(!LY2^)-xH+hDzbsJg``0>Knd
+S*M*SHa>`rYXC1btYbNo2M`RF-YMYcD*=9H0JP;+f!pMqcWU~cK|f=EFRFeqLa&b{s_2Z7w!^hpt=s+{8gY|VqQ#@Amom1Y*f00ptc9GDbHZQ8`B^jhCvOQF|F|J<$3m?5q{c3+W8GDrKO*k~`L#|Bd#y{u5{$dv
+GjBXQ0PwSwVDH9@KH3S-Jl?zltI6dad!93%O~cUa)O7GSn*#H*MmQgu%jJ6`@a6#!;E65uh^D433(E6ipnSgK!Ul-G7;rclhQnyHhoikY$_s4C7|TnhpW%|cFm~U9ahC?;0!1F~d>3pZ_gak3pMnQ)>@J=EJtYp2
+7hj4k`vbs}$}obwc<jDlgmM?1V+{8x8D>jX8pJ?<X&;Jfk+FFIgS%nICa6=>3M^oq-ygeUst^)=SFm(~dD0e&>^be36s$nko_OG}KAgx|ICkq8TG8Iq&K7IYsNFf6h}zknJ8u_Rc34L4`J~x)VV#uM3*0No$NU%z
+sM1Pkhkmd7aQ$d9<Kv;3)yz&hgkCttk<D1dHj4Ew=`Ewj!nz5$Mm*XT%AUQn>{YAhE0mLXa~h_MSpdoxAAyW3#usFmJ-p^&`3;1ePX59be0>VW<#;8OR|VW_$Org~DHxW7v9ZM0bX(a&z~w=GNXboQ%sD7y6v*0;
+=Rz_=$>ZHb(xa|*Xs;U22>yHuw#G(@4RU3S406gqY@7j{ZA1G+%I&{JtwDbOB5IGz?H4IBQo$KLa+q%l_kVgW<GruKs`4_367Q|@SsJ+wKi>;9VceloEUL;am$%#K{U<jV>X+|>^$hpcY|zy74M)+qi{4+xn<_E?
+x&+^SaLhGEKd_G3#+Wv<Su@t_n+039T$UZ62%-Q#50N|*K+^UKdNGZp3GjApU&ZfYv1iF5OK0V%1+K<1ZQGY-kstH#Q-mSG*VnylZ~w>0fI4~KZ#VY&?4h7ujl_7hedW~jf89*^0>-^<YgfQps;Ux07LPHSuxsub
+)|AFAnWa2=9BTh*JKn4SQ8$U?HuL||2}8#96&JWevp|u&&GExtm={-~*p11mK9~A|>1YUFR)K|tK)Z0io&SbjL%h_CmF&WsKfYi*s{m`O)>;zkTX!kXe0`y%@^`h$hEBknE3i+ivA)l8IqMwQW15<N9lq?|$7H=@
+%&8vt>mPWzdn@2=-~)N5U`iA8@I^HU<yL20;j5~!M_umYE9%D>cQtvMCk^s*0*X2JC*)~p=MA5q{r+7I{nGE(Eh4WKRVuegTnFtK{Ek0YO-=v1Q*`oIty9xej`{65JBM~A?Y_J_de0|&ByY{9<)ja#CuLmDkiome
+M?vVB{Pv;3eFqEk0EnkQA`bkd@ZgcWn-bU;|9D^FzC#TFfYr21Z3~L0LsrDo@4#=fJf3cZ-*)&Nl*QA3g0zjWe-yS+aD2hvo`!2CzO(K;><>YDBy2y2-_vJ&a~+C!x)t{KOXKOg{`Q}JZz_E4h=1KjK}c1<9qsS-
+tAFtSD@vGI
+""")
+ESP32C6ROM.STUB_CODE = _LazyStubCode(b"""
+c-nnedsq}#mcP~Y>c(!Nw@@^}EK&(RGG8XxYJE-=tF@ZqX<}C5r!fgw5u%&S28D6Wq`z(GE;_s<STKz)?sgc3$okD1P-_Oqfkqx8O4KN*1JT$ct!6X84A3DHWbdWBXR`ap{Bir<d+xdCp7Z;ib8q!uJ|OaT{cGO7
+t8)P`8)G}-+Nmzp4>FA+M>zOfz3Mo~WC#Kb@|C5Pz9v3aI3$>{Lfc1tG|%KugcrJoRLrQ-Aahff{e%;wT;y~PKJL=19aLZJWt9M#*6oZ=2inq@yzy|uy+83g1@_aG*oNfmLQ`^V3Ymp$*_Y@*z?wDEyHJ?vX=P}j
+uQE3}r3DXwEXrN1n*;|k3T>n)IfsERQ7Z2ORyf~4GW02fS(d7OnqslmGodO}n?ag?6V!MZ66gzU3U$?B&5)`GW+kT#g*J7S%$tphEVocyS?eVWNvWL7D^9uzZ=kh!zo<pNDAat=PI(I1Lj&3sE*3NZd_dGz=0H6{
+dd9EeR0q${bkip}EiSyC)~b^ZK4eEJqRvYHI1JeOZY}E`(6WbU?PB-TRxdU2eG`xHW9y;R?b8ma90xK#Og&mUF~cnhjS6jMBh@v;sc?<0r!^c6v^5uMHd<#cZf)Wj%ft*>jI1E7+v}}EaGgiGH5ZVz=#A4efm0Bp
+oWsE@w1B0w;U{Q}>WXWZ!gPd%Thn=7WC#H(5TyPk7$KbhNI4w|tem_)THq)fU|ikc@I8(Km^wKF@+;KUAoEuH$L%#6tTSe@@*XLgbdUHJ7rXRXEV?6*8Jc8tDrQ97KgV%I-}-j}Lkcr4V4LyT+<$6xl9p;;lc@OV
+n1rrkZq{2-rTAH`n-$UBO_qRe%&2LV8=!1K8Dci7P6tnQDNYe1Mb_p6%s?lo=_YfmQI{`V?4BzBNp)lOX9Z=wY$FZK+(O9oEBXKim@)Qp2!psw9pa`gsxReYV=;<d`g1k-mE%MkzDxjdhna0XAUa9P7zNRS^yZZ2
+%sT5(5+7I8CkK7<qP)O56`I%YxVVF_ckO7~A;=XwI*^~&g$>C~$;jK?tKMrx%mjAv{kTQOn)v*A%&K`H#9Ak3=u~M3$`){A<KaFoN0$k+$r!znqo!x9^T#SU3I}5cAto0>TvA={aYm29g62`UZ6*iUFC%GOdu&Ie
+BXHWio^70=heMVr8rTPl07K9~rrT+covoS#3I+61(G9@R_i!oS58mV0NCNz=u8}=dd(u-60IC)X$B=CXbmF#FRB7I)A3Vv0va5y(HFRGrcQg}cfD~2r13S2d03?yV{u^~wZd~uC?&-bq?&-YPD=9s%cD{Cj`do21
+zMEgEICXTrYk{`e;RDNy<K!2DQP_TjRu*W<JuR;0644z02gr23LdxGMG)*(4JQb;JbeZG<fabq)HN(;J5Z=pHSUi?$4ztKR=U0Bm?-A|@DakF#%Ttb|7$7@!#nQeKAn)E()Gwz5nQiNwW%e5+iwnwZ&u%(wB37C=
+s|@)fmC=fBljQU9xzl^eoJ|9--hAzgH$SKD#ty~(KIQiIYdf!G_wMQWY4`O0`IV4II>8mKZE+=Z!F>F-vG|3OrjoOz6DEZQnuQ*f)_{aiPA!siqz79W@@?w@Mpq2uBj`&I5mT`bguHV<ZT&f;e`!k5mrgNo9qB}B
+ce;jM1%gRG0Gi7Nz^m!fhv_<L>=<tT^ziyRS&Nmg`VALbq{l*5Y*BTG>#C#)0dIC5GfQLpaT9Tbm;PJ=UUMM5O+h_y24Rsgq`8a<2i_=8|D_HCJA-TdG3yj=iN}Uzd8PC+3B32qpUCJ&r0by1Ev`E*wxr=(k{DCH
+^Nvqfie7Sja+W!W2x9N=Gv_wsu0!1IGHqVxiAN|c{0bo!!pa>s%jhe6w%pm0vaMy?^6f{qhrRw?>YlVaX({O~>B}Iy>Q-~|!d%7acVL#HFY5;D?_9do*MI#+|MfdpzwEnzdHB-fi+}7&=nG<U^piCP&);fKr5rq4
+Hwjc&gVXaTDm>Y!{^qSAuc%ArWOCxISCk^BhoPeyYucG2x{ZyY0PCiJQbf1cv@6bTPYtYJ0&K3Rxq#%T!nwek04t6@x7f|PX;4Xfzwte>yi{p<N1MN9mq}G;?}4VpISDQ{#;;Xr8;@R5#p#^O#!LZqjm%pT&?~AG
+>zX8zj8JJT(;~w6LoZt_!5b4ys-%s_5*3*Qf0g+IZ+T5GM`}Qj!$~ztm-*3K1r`<Fin+yEv-eU^|35rA(^0VgBjjvzwn_pFvnUP$Q^Op*VNXz}iYZOO;*QuGdbAUF?f=!Il|{B*r)4!`8hiKCKqs=ySDIhKndU~i
+C>8j$n?<R@M=cYj|MUTS_e%ipeje1(w=0aI^b06yC<V0}6K+`IKd~f5<gfle8aZZK%JUQGCR&()ZXyi+-kZB@b@>{z8j4rO=Y`^Z2w%d?9U`n%jpB=n*wG!Y_CSBeH0df1eY=(@`Gz%eqBJ}Vur!7k4VOPX5XJ2G
+hxa6U9}YiJSIc}DtrR7mTkTq~QR9SnD6ULSh8q*TyZgUqXuk&OmM2PI4{JlZR9irop?Qr|<BQPTSR`PU<0~;s#@eyfk5;3otdZB&=8t1(n84(Zhv%+k^1lz?w${4Z`wa0IVU{dP@AzNTiQb?2A5TOnet-Bn(VOXi
+jB=-hhMD7Oan)`tbdti+uiuX-uwWL~=)a+Oa~FMe&GJsf(Y2Tm|0yXHj0ELBGp%%kW$wkIB>Mm<U};$@ezFwc$9h3?P8qmPPxwbhTV?B*=iS)a>1eCfM3(UxgU$P^v1+g9T{M%1%QVv;&dRUG7X<9u_GV0FS52sY
+o#$qZ?Www^nuGJU_cu?Oh$^#3T`YQweWM6tppRG0;+0mjNDAIs-=zI`FTjtNf(I);3&;-nCh>+jSY?j%*!PV6cq)cgM@DCCt3vDJcDQcLk@onb@rGUy(lI%Fnvv0edBUC~0Q+posd&gS0VJG`#9>Z(qR`nA;|Fa?
+n5a;rbEQN-%+S|icBMl0QGVgw{|q+JZ&cX3e-7@$xwl|)m?0wcC(fISz6N+=5k}IV9sEkQL%Y-6gMxIFj%-U}Z3M8M$wJwyu{ZQ$@HEU`4}GeigN33C;K64tFPmlJ43<U;#xq6~&k^6S>H?Xk-`cg`8bxML9lUlB
+?Kpk+^wt6knw=gPe+%{FcgO!JzhZO6w_gOT#k{@jJmdER?>zdkGAIJZQ3~U*zTwTQ{e6-U)Ja+(Y~dsLse=;TfJJX$ME{Jn;`YJFc2aL9Znql6<7Z}3b@{$Tm4`Q^V(ii>z{WiS`RDA<^+4Pz9~6I%n9I}`pTn2v
+Fe%$lF@6qs7t;6fr8*2t#6%PMkZ&$}0Hoc}AA-8hE<FKl+y?RI5ONWljP%FtWa6XN#ptX`-!1%E9k#HIA#8efsSaxDfN7--9B)SF#OS~I4D~ksmD&Dd{iEM7bc{i=`}DA?4BmhD{TlCh3EmyggIMB?vLLo1ezF6Y
+Bc*)~EVj(6)1PhQcUHyQYG=RTY6a=_@vxE6|L)Bny2$S=Qsh!BxNl?N3vTe@Ab;OA*fuCMJDujijv#&;o;$1C#gJq!eiAZyEX1UH1^SP3D^-Qx!=CxdRuTILI=|w4>Fo-*8^<ioH=UYb4VW0xmJmGa$B%yd|1)D`
+bmTABPTM;J@i5S@I&!GoGjC+H;%5G7xZ1I<H54sVR*IpB2L*HF6>p^|r%E$UtwMhcy*Ho68w?=!Dw)*m{2xA{-@c^el(cUg7?L)0{iFldMO&=6B8ih7{C)Yu2&E_mi-=&z&Y+hu@#z1Hq7|{it$4#nr|icKU{Tqk
+iiFyxt?aRfry5ItSIxT51I3ww9WBQ?Kgp3?6JWbMGWz3Q*8Lu)>lhRcU+}*CzF)dK2fpR+>(8rls=7|*)iP+e+;C1QOT!+udXLVj9TdDJbge?$^e0r5b6$n6g?7FO;2gv^8gkVa7~hM@XhJuYH=L+}(yKqf^Qn>1
+moICoHaCroe%?FzO7@oiEs5LCZj0Ogi|y3wld0Kh{b`BmXVZ1?O8|fm!q8vaxAx^_?akW_fQ|ov-1XDEy$5!8P;gAVot2lh&kX>G1P*?0n2m3T?Ws97{vm8z^fq1tTY?UL^uYNaV0!_!KWc6K&S0Mg^$-1E-<z<n
+gZkHD+YZMk=LXi^HQ4yK;rIo(r!3h2y{0t;`jX(j55kbE!8lGmFY_<{FY=gQ*#
+""")
+ESP32H2ROM.STUB_CODE = _LazyStubCode(b"""
+c-nneeN+_J6@RnywTrs~9TZ7PicEqZIVTCOI>$zFR%RJKP0W#aG$vV{2+<~OP^dM{o-XVT8@?nskVT89gepYpX$`2;Vl6D6B5KqssD;G1k&UJ)kN{iKAbpSBP1636Ki<B1_uY5jy}#eRcV_?dCXu`2SGjvG&jr8~
+9@`n$PIaq3U<nsF!p`65Q^$dYAqX(YSCmwEoA_AafMCK3Y;W_?Jd-yOTHqQ|v2c|Jmi68CV@{BIj?>xsxbx3-QkP;cs06TBw=g;#XiH~u$3qRbzvQ<I?EA~HbtzYcrj*!JavQQ`U!((mYt{%)lrYoV%FsYxX=-#z
+3+@70l)Kql670(?u#uwV90s~1sjM4V;d&j(&?gKgS*r4Cio_cCgsM<&25J6vQ0-<&pf9i~)MbM;Q>q%6m7FjX*whsc-W0CLatqbHZLMS`DV1~Zij!`_8)z-wFKUr53N;_JQ|<!xz<_p{iv<k;9}u+_*-(#=9`R{7
+)y^|C-Sl2|iwm!(wd$mu586=*sngO=h5=jOqh)IcwCn*|yRdd@lZTr4rin-RvGq_|>(vga90x3Kr5!GrnBf)$p9*ZIaH@NVQ{f(4Pir_DXsbJ_6Rk7nHZ}2#d18hvLROI0&9&AcxX&Zq>JDTrI&pf&e+y!ibJ%%>
+7O>Pd{1}Z<-Er+wh>kFGtGdpL3?X3og4DkVBZRYWD<>m>m6O*-3mjzwjH?G6yv<PnQzvIYUb(swSZ=hx(_X#KI%5(mZj+)>caLvzv5OzYqC5SWp-DlvV&RDU$2g9V`PTqL5;HDfoAKIWzHD@o<|=QKsQBoZgzh44
+)>~1f_*t#%<<UJ&X1{Ljh;c<NK-q#a#1yVN?L5`3I7N&US(_Iy16`oHhs?G{Ug$X2GgbD}s>Z4h@=N>JMjDv7D9H4)dOrqOc<hBB265**#r56PrPOncMJRUZt19qE$FVkii2&jbGMjrrbh4B=3Zez+r76v+HP)eI
+KCbYR9PsH5$_uPZp?Uq*b6fd(*VeYJf?U3}6Zv^nSeMe2g1p_i;`LU<jQ<qhkDFzziO-wIte6LataWjQE|s>UYysC24_@N3bry#135!nTsOcH&{IPP5!ok>nh)G9~ORD>IF5GP}qje;1o5=?D3rHH*9^2XI@ZWa3
+cQa?`<&b5H2KIqMzz{T$>2}&}XDcUxLIJ&0cnvW0ZCuLpf!8@Uf&kyuHL{0lPkQJsK-FUA7_!ZPZrt38D$VobyAN`p?6P4(4fczrj%MN%kRmI;X9qVEfFv^3exa_&iR)Y6Gre2hIh`AOF}3%(uID?b4;6>w>-iOm
+Q%Bdk7HFFtUa+(%PJSW~1-}ICEYOm>T3pS=qAC7U$aJ1U%3muqO*5oC6`^f(8RY?h)_-(0!>6SIyg}SDv)f$7VP<*z{EDynUBWFPHKiqGY3iX=17xSJNZL~j<elpa`{mRCvwYVqvtJ-tTu`=f{XrwK+_XVu$fu~x
+R@6;W&c^3V?<TX?4?K7M`M<yPA@y<WP~1OKZ*IA={bE+%uHK*bOz)jv0lNa7;EL9^xDvWyKK{G0=!xQ{;?pG)Mui5ND7Q*$KtkY_+fj11baxX&zGB_S=!#%`1brSNVl484pm&x9)?YLFr>7Ks$rJ<kkxqnmyKC5$
+FBtU$pt*DaJeMK8m7$Zyj^L*E53a3~wOHATzi_dIdhFX6BkB&;RZ0^A-t0VLlE(JpM&b}JeN_yecObp>0X^GEghl3%<^m?{d$BCz_c{!05860lox;uW*sv@wm!2Vk=T6xJ8FfUu4*J~Uy5(Yv8~#laW2$G~(di1&
+Lyk|*G6xYs?ENrvmXMq^h`Sxe4Qt%-2&Je`5Mn{BEc7g+&+giIYh&u>md#7I9NH4{!q;iL(r=}wX0&81f$XZAOes-0iqq%7%!MD-4c6Z}f8$dB)ocA%Z(aWA(wz&#=kK5US9ijtK&*$~TV-&6S9>aD=h?bRpu!rQ
+o<C9U&O-G!Zxwk_T{OqSi8r2A3VYlP9obmj&J@yZYzzh1S_&wIVtaKv#G$<!)-M4zlvj5kIjV5Z|4x7vN1s_(%huAMg7$pjePDjN!u+Z>Z`BT?s?PR-riIxFE;h!eRcRZK-lB@rIhT!@0_rLUZ%#mOQKd-NB#~s8
+N@EtY$ToVlve_Kym~CIGq>aat6qy9y%D(cy%d7i1QUe0@@s%2>v%LLszFCD`F{fzTY+nlE;m)3pg!LaLXPL585@48FaR`_iV&@IJ0y+v)l8VJ0vN!Z<CqB0Sp;s%5Y`sp)YQ{A7o*x69$TFX3eh*igYZ;=H@6~P)
+rE)K|M3jE#1@@k&0p9aCsH1O|hl|p?P|{EWY7!H!nd9FxCx_*&{2z^M6D{TX2-Jz95>O|?;P36ZOIDVxGO59MWqe*R-cRA1(6Uv8wW?9PkzreV;?-X0&zL4d#i4Ikk|gi2MoyB3hXIz(5Tl{;`}-o9y}r=iB+qBV
+57d<oK7>{Zlg_MkElAWjVGqTX$;r_0B+t(NZy4IALAqs0(&xk4pf1(s*JWs4BUO9DG}j&$F!Rynm^pLx*vfk=QB>B5E35Oyv2;ve^2S4RRx^3ugl=AKUFms*xQ{SP5v5msPw7O@FManXA{C!6bdBh-`0k_JDW+lO
+xLaH`i3LtlIQ;n=Vfkjv>>B+I;xgyqPp+6>4LiIV6XM?|h5Qk}+?HotUJI7gE)*r%3rGP=-=^ZnO8|bP4>V_&f~)j|Z)CJpwvM@9i>;ZCwpxv3DW5smytfLg^0;3^D`~h?GyT@A{BnGL;J)3NQ(2W0>bL8h%&}dS
+S5#AA&A+i>%1Bh2-0DKnQ{){*7z2I0Y7#HDnnY6Y)OaWDNBaPNv;^E;_JLn^z&nXI%)u(MrTgAT>_^iuv^z37V_Om2AGgE(@N8+9FB)&?13?|5!>bt?{lx?JI04v4i%-NujtL;)bOa7_${mUBmKYysOU6Wn8l5X8
+`Cx{=0JAF%vXAl$@A(;6N55EZ@A);j1J|DX$zg^F(;qu)Ec_hcNrf0mf3W`()eh}W_Y4ZsVLGBMnY9tXdTJZWUX8t>4}-U1_Il`3{TwV9oga@j%hJ+WCQf1Lq!4~89L00UJFL2Z<z(89z1B!FYij?M{piHWzVXC-
+Gg^&zjHk`ceJ2z1$~Tn%xx;U*R$6kF@%eyf9(`XK6anKXfpJ)0^yJq3BU$k4#3U~eHu7Qo)P9L>z@pbNqHo4pesh0BJE=DjH(SHSqo-z3b$LHRm4`Q^VeH~5z{cGJd1vg8^+Mb#?iPKBn6v1M&ftr5n3UzC7#{~b
+QS=>ru@1wMFwsbU#y1z<1=3FF4?$gJ7axN*Zi4tT2)VHJ;q*K0WYWFXh3Kvd?+yG>9TwHb5H>x#SO+zAz_{E7jy9uvV)S2pfM%Qi;_Up6{@!00I>sQ`y?R(x2G4K3f5tnXhP~r)5KFvR8o)LQKi&yU5z-z97F+7k
+=}))u+biR3HM3uEHG=fQc*w};pZfBK&hgs|6}bcpoLlGrf*U+H$lq}dwhao+PN!+GGk~$_vD3O83`yqT$03tPf=t#fL;rDZq^a<G*gap_Bw|0J^UBYb+$@Kuam?I&-Kh!KH!`FxAy5xb-uvtSXU53r$bYV!w0HUA
+VW3}i<WQM=-pFYA^}LgCw{uNvFj}Ux1Va%I3Z{sQo(fS;lV+S+g?<NmZ#s!L7(nc0GP&9LPd=gFzNq+wv}YU`lGk<rv=i1vTdcS&nUn4O9r>*=r7#r>3uDNxfR{1x=>LnN6|sU%c*EN#>_-jY;nIi86Ka|^u}3~T
+(OB}gDz^44P@JjQ;WDi2y==)f0k+5^qfhp+wXb8k&OzZ|hv%6$eA35r;Jf?{{aIB`Q`b0nwG`SdGn`RM)3JN4p2Kr$1_e(sU8B%8{V^5goJXN+pq;<_aSq@c4Y|7Hf4&`)*@QZkCzPm$(#zk&^P!Q^XD(<eH#Cim
+e%LqpY}Us9jY*qNZ;spY?iT8W$+WEW{`91b(-}JWB>=#iA?UB|%X@OS?ati^fQ^5X-0}0=-TQWSQt+90Wn1pHJ+%OU2w>-ThuHXbI3Ai~<3EFAqu$1A;7HKHj~=-G6pkn0_?OnkZx77rQ2)U9&b<WZI;ejYjxF%{
+_+0<qYX%$t3VeP7o+%B?KQy!k|6Ck6_htxkH4w*%#~u7r{{@KJV{Q
+""")
+ESP32C2ROM.STUB_CODE = _LazyStubCode(b"""
+c-nnedsq`!7Qd6pWD-mYbP#llT_hH&-R(+I0@WoGOc=uJtNnCcsZ?+(RI9sHVOeamUmy&Tmxu$6ve-qdpw!(@K%Ffu<xL<^s#fu_V3Dju?L%yVEZrh|FA3dl|JXn7cjw&myXT&Be&?Q<`S*Tt#`ZsE>|3P(0P_||
+kdoMKI%5X0Ju1CT9b|jCQ!)_PFNi^kA&HX7Kx;geF`-tBd_!;3Do?M%qV!j^4f?=XA~n}|fHnoo0F^oEnQJll*cWSOds`?H$jdc#W_HnCz%g96vYG(d8*_~W!<xr{ESfFp1_mfc5fph&q2bsHhp2$5YMT^zNvneO
+y#|i7Q3R0Z8hObjg<&IGaeZ#(oFdmKWcH~w-aJP%NxD<jtd5WfS$%5WY_7*^Nhv<aNRcnR#22(n+H#eLuS;LBC_yd2uQSrJblyyg*{7W%mD8rCNOS%1^d<{lLrR6PKJ~mEK0p5g`|~lNtg%X!)z_uU!=!X+_4FpY
+Wb*q4T7%^pl{Ij++94elRKXzS?YLt_ld~$-{8O$`<1OhPRtZq2tRY1z5=f7999d_W?b*~oQ@Y7nq5xSzsGDlTFx1lsd!z$d^ItbJ>pDf_9oVVrw5fTr6U4USXGl!a9n{Wx$izBTL{~FIi911#mK_Yn#M<Tq{COW>
+P;qL1tx949l*I~;j;JI66Q*WCW~mSaQf{;#YCjTXnAI?4BLovFyH7V+l+P~1{5u=yK<#0zNI&lt;*a&ZD?%B!fSy^0(P*cLRt56Q5AT^x2c}WPoPE*V$8P-{inyfc5|Gb9?UL>ld5z)=fb}Z}F5Ad5t`h?S`u>%G
+xOLgVZ)ffa>KM2^lfmtn*~{nUeaD++WMEfp+m)fgTQwGm)wirMFBq&S2;!d4v#gvui$@q@XQ8FBkkKsvCy{Q*q{Q4bPm<&bODIHB1os`1>MSR?P%ap__Z<r4+H@bNF&($fx2%a?p{>+<=%+TPB@HI&VI`j^VD}XQ
+ZbxGNAQ#KI;-W`UHDO<&wII%Ar?n{YXsCFVW;2XqrDS8vo;@>r6F+_Vli&2cYL#3MycYCX?B%51ZCz;{JKMg#U02{+2ICbyU)WH1u}IYJwj0BxvtMrV=3X;oP+}Cd*zJ3u`;-9A@D?RsGtJA3rYWdJh;5cJ3#Jd1
+2ZP4qVDMxD`&NRC-E#)dt~RW$;SMa)uTEYalwZ8)2OBvxM}v;CnR>jDJfmSBW#NtD6&m*2N-&s*aEb0HM?OPQZX6bM=4i8%OA_A0FtE+7OX)OB<GK(q#{DvcO(cMQ^w?t#-6OKbQfRqlQ5M$zixW=^cHdJoWsE(4
+VhZtrvX40VDIbW96PzVrj*qOnYY-!kLc7+W47q&?n`7st6&orycx?Vozccn$Y;0Up+=}?hc#njs<OIkR=8gK(`Vf_PK)nlE*Uq~3R@>^#gs#HT!0=8oAhJ6<V(vyUf`pz!T`TpsHt1Z~fS%CR)c|!g)WtO3g4L#$
+bn|8_AQ+|50jTR;;D{B*;@98NW1TK}v7)Y`KBu@(Sw{kmYBB6aFUei^6!Q-3pTDO;woWFoTQU&aQ&)iQC;M#$_*>qYR(!b@1RbR|_X7VIcH=nk*Rropi|#}khGXcU`~i2a13sLqwl1Ee<y(5T&^4AVty{EQ>6T99
+=M`;~zCn+?9S+;wB5cy=7w_TC&OA&PIgo$*#8AyG+l_(2D^~}v+`4poV6=bC_MqqMZukBCtH9XQs<{qF0@(SQ*b#@%sfaS&>(crVE<%9)5cR&L>5&#?fKw_E;j}=8(^xdbFM!<^pf|%poibn=xOsXC_N|mH3}Q||
+(L4OSwpiUf{7hg#%7LvpIw8AHy{8~`A+>tp{JwK-=`((?!+3FNnlym`7^dU%I)M;tQ!945G4JyQ1@-97LlxOTP^GE1S33E*>HS_Q$0%!LQl;pT$YgyA$QUJcNAw<)L{}3Sw#Xq_&#(m!$#RDMivyUfYXEM24xAuw
+mU=VnJ8-482vn_$ys8O1u8Z+1i~Ju%x`t%`<or?3qsvjxbLWqzh><5;&#i}Z!kPtTH3`bd-OatwheslVfJ1*SN3)JG5f{yljR7p45|4WxJDu%EWjQ^2qwV*`9t(fyQ+tqnes@!tWzjm3nU|0_KQ-m)9c|w+_&r6!
+(;>Dbn*DlAI*-k7abYQv7O|BMFVWQ{T5P_C3o%{J+Jv>bwJ08gkA9V59E-=aROW=|Gi#~L?>!Z3*RQpEi@!wK(lhLK=Smr4&vrhT^y8gQ&tEfk*7*QcMIi}mqP59VwJz68XpepIrdN(`{uH`k$(_r(*S!|5!n7f$
+32n|pcOFVYS5<@M)k_(ca{xk%#it7R*&=|S>;sMI#o!7#={y>-eX?y=VAYJj!4OIm)5$}PSru4?y=@ng*s)^K%-eJ8mqK#f{iZN^I<0(C_(3j6ezddvvY>Ix)dx0Dhl<NJZNgH<Ug#J{c?R+bLBo8~qG1TF{g`9Q
+bgB>Fr;5PF7d~*U@s26Hb^%tF&far8Z8{Z)A#F%VjxeV!cTAX|);pcu;q=FA`@lRRG|wR#4pW{L1Ld;9bFvoPDh4c0`rxpR+WgSDEae2PF&M*3#-CuLov<ojffW@8*+(^nTi*atWOAv=`W6_4vORBVj1qgvxeKBB
+UjRHhA0x>6gLecIv^!%R(z3@$pVk<qQ4BUVr=p4#nQHqmcp7G^fgaT?z~&>fj9XD|vR4!%4zOk{p3pA8;O&ZkOt65I^Xs-}8T^Q}>4TRKq8;Zu&NDeWB%QZTtV8oe$JMQwrRz&?eD1PFXAu`DrxV!y$Orro1E{<r
+7>6O*o>lda7_AG_nz~54f%c-O53*z}<{w2d&RIk0&4WJegj^%O+2YMyxG<N~O2=(<+wj^rOu1|tC<E_<-bT|idYHGey9J*j)>7ohKg5Fz0GsBNP)-%FKShq>&lUhI8e>9<dvs&|T>u#Yc2aUhx$F$IaT6#SQRci7
+y~#uEMD+cZr7r$%;L8fY;#Nv*lq;9XAW{ZGR~bQbBRVHQ-t_^Rjq<zoXg(zGs;9^R1#5E1;jL2G%N$L3=Ni~Ao&$m6<YISjx8i3zfyRg3mxl!w+dbtMTj_1(A;zk?{#~VIlO{YKj+fra9PXjF<?~z-=HB;;tA7vm
+4AG;Oq1GX7quHz(>U8HgY2nAR?G!=m!Oub_PtG$*$D^<C8*u{sVr%o|H!;|gWM*k|(alo08^?5w*UTapawMK2jFIl=nBnt3t&E4`zjC&HWa@IoLqWez5W^*H3(vf``=f{B4{zlN^RZIJMHq^ANUQPbvX?Pj9Q)WT
+<;g?P_w4g{tpWsIB4QfNU(%6-rr^SJ?7j)0h>7ZcvGd{h?*{{!7h+UhHuWg?wilmo172Pfp_}(nkG`*YsTJgI!fOwlGo4a^CB;ihBdZ!VDNo)zS6B3Lg|fOC@Mar0R)TdMPiNnm1W8<SxUzaTChHv19__HxZ%(tH
+F91CGrkrcx;sgWyLhpxGOG=vf;(l<y#a^-C-65?#mwcBejq-W{)tmj#WEJdNu3C+7W!fbLgt>i-NN7SG$}SOC&Laa<|IKN2sHj}iH1$&2hQSTdn=ft-N_r<r^2$_PTKr&qbi&018GQfl_dvf-TlZz8?#<W%Ksddh
+*#5hWz1chd4qu!5#jmAir0%N*0LW>ZdPEvd|3Vf{=fUx^M>zd49J}B+4d1R$z&R0)BT)BSDEGVPCb;MEkM{M$=O^Kaf};lxUxiCIxFDRi$;0WBl5l#$J^#P4cY$mE#=UR92XfUN$LTlv)GPl3jppPQ
+""")
 
 
 def _main():